@@ -1,8 +1,11 @@
+import asyncio
 import os
 import sys
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config, pool
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.ext.asyncio import async_engine_from_config
 from sqlmodel import SQLModel
 
 from alembic import context  # type: ignore
@@ -11,6 +14,11 @@ from alembic import context  # type: ignore
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import all models to ensure they are registered with SQLModel
+import database.graph.edge  # noqa: E402,F401
+import database.graph.graph  # noqa: E402,F401
+import database.graph.vertex  # noqa: E402,F401
+import database.run.node_run  # noqa: E402,F401
+import database.run.workflow_run  # noqa: E402,F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -19,7 +27,7 @@ config = context.config
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
 if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
 
 # add your model's MetaData object here
 # for 'autogenerate' support
@@ -31,6 +39,25 @@ target_metadata = SQLModel.metadata
 # ... etc.
 
 
+def get_url() -> str:
+    """마이그레이션 대상 DB URL
+
+    `alembic -x database_url=...` > alembic.ini 의 sqlalchemy.url > 앱 설정(DATABASE_URL) 순
+    """
+    url = context.get_x_argument(as_dictionary=True).get("database_url")
+    if not url:
+        url = config.get_main_option("sqlalchemy.url")
+    if not url:
+        from setting.config import get_config
+
+        url = get_config().DATABASE_URL
+    return url
+
+
+def is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -43,12 +70,13 @@ def run_migrations_offline() -> None:
     script output.
 
     """
-    url = config.get_main_option("sqlalchemy.url")
+    url = get_url()
     context.configure(
         url=url,
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        render_as_batch=is_sqlite(url),
     )
 
     with context.begin_transaction():
@@ -62,17 +90,49 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    url = get_url()
+    section = config.get_section(config.config_ini_section, {})
+    section["sqlalchemy.url"] = url
+
+    # 앱과 같은 비동기 드라이버 URL(asyncpg, aiosqlite)도 그대로 사용
+    if make_url(url).get_dialect().is_async:
+        asyncio.run(run_async_migrations(section))
+        return
+
     connectable = engine_from_config(
-        config.get_section(config.config_ini_section, {}),
+        section,
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        do_run_migrations(connection)
 
-        with context.begin_transaction():
-            context.run_migrations()
+
+async def run_async_migrations(section: dict) -> None:
+    connectable = async_engine_from_config(
+        section,
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await connectable.dispose()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    # SQLite 는 ALTER 가 제한적이므로 batch 모드(테이블 재생성)로 렌더링
+    # 앱 엔진과 달리 foreign_keys PRAGMA 를 켜지 않아 재생성 중 CASCADE 가 동작하지 않음
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
 
 
 if context.is_offline_mode():
@@ -0,0 +1,55 @@
+"""Add ON DELETE CASCADE to graph foreign keys
+
+Revision ID: 4d2f7a91c3e8
+Revises: 5c1e9a7b3d20
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4d2f7a91c3e8"
+down_revision: Union[str, Sequence[str], None] = "5c1e9a7b3d20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (테이블, 컬럼, 참조 테이블) - PostgreSQL 기본 FK 이름은 "<table>_<column>_fkey"
+FOREIGN_KEYS = [
+    ("vertices", "graph_id", "graphs"),
+    ("edges", "graph_id", "graphs"),
+    ("edges", "source_id", "vertices"),
+    ("edges", "target_id", "vertices"),
+]
+
+
+# SQLite 는 FK 를 ALTER 할 수 없어 batch 모드로 테이블을 재생성 (PostgreSQL 은 ALTER 그대로)
+# 재생성 시 기존 FK 를 이름으로 찾을 수 있도록 PostgreSQL 과 같은 명명 규칙 지정
+NAMING_CONVENTION = {"fk": "%(table_name)s_%(column_0_name)s_fkey"}
+
+
+def _replace_foreign_keys(ondelete: Union[str, None]) -> None:
+    for table in ("vertices", "edges"):
+        with op.batch_alter_table(
+            table, naming_convention=NAMING_CONVENTION
+        ) as batch_op:
+            for fk_table, column, referent in FOREIGN_KEYS:
+                if fk_table != table:
+                    continue
+                name = f"{table}_{column}_fkey"
+                batch_op.drop_constraint(name, type_="foreignkey")
+                batch_op.create_foreign_key(
+                    name, referent, [column], ["id"], ondelete=ondelete
+                )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _replace_foreign_keys("CASCADE")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_foreign_keys(None)
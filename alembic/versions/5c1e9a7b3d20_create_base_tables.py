@@ -0,0 +1,85 @@
+"""Create base tables on empty databases
+
+Revision ID: 5c1e9a7b3d20
+Revises: 63fe39cad050
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e9a7b3d20"
+down_revision: Union[str, Sequence[str], None] = "63fe39cad050"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _timestamps():
+    return [
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 초기 마이그레이션은 이미 있던 테이블을 기준으로 만들어져 테이블을 생성하지 않으므로,
+    # 빈 DB(SQLite 등)에서만 graphs/vertices/edges 를 생성하고 기존 DB 는 건너뜀
+    # FK 이름은 PostgreSQL 기본 규칙("<table>_<column>_fkey")에 맞춤
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    if "graphs" not in existing:
+        op.create_table(
+            "graphs",
+            sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("description", sa.String(), nullable=False),
+            *_timestamps(),
+            sa.Column("properties", sa.JSON(), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+    if "vertices" not in existing:
+        op.create_table(
+            "vertices",
+            sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column("graph_id", sa.Integer(), nullable=False),
+            sa.Column("type", sa.String(), nullable=False),
+            sa.Column("properties", sa.JSON(), nullable=True),
+            *_timestamps(),
+            sa.ForeignKeyConstraint(
+                ["graph_id"], ["graphs.id"], name="vertices_graph_id_fkey"
+            ),
+            sa.PrimaryKeyConstraint("id"),
+        )
+    if "edges" not in existing:
+        op.create_table(
+            "edges",
+            sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column("graph_id", sa.Integer(), nullable=False),
+            sa.Column("source_id", sa.Integer(), nullable=False),
+            sa.Column("target_id", sa.Integer(), nullable=False),
+            sa.Column("type", sa.String(), nullable=False),
+            sa.Column("properties", sa.JSON(), nullable=True),
+            *_timestamps(),
+            sa.ForeignKeyConstraint(
+                ["graph_id"], ["graphs.id"], name="edges_graph_id_fkey"
+            ),
+            sa.ForeignKeyConstraint(
+                ["source_id"], ["vertices.id"], name="edges_source_id_fkey"
+            ),
+            sa.ForeignKeyConstraint(
+                ["target_id"], ["vertices.id"], name="edges_target_id_fkey"
+            ),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 이 리비전이 테이블을 만들었는지(빈 DB) 기존 테이블을 건너뛰었는지 알 수 없으므로
+    # 데이터 보호를 위해 테이블을 삭제하지 않음
+    pass
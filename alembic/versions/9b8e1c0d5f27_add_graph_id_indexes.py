@@ -0,0 +1,37 @@
+"""Add graph_id and edge endpoint indexes
+
+Revision ID: 9b8e1c0d5f27
+Revises: 4d2f7a91c3e8
+Create Date: 2026-10-19 10:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b8e1c0d5f27"
+down_revision: Union[str, Sequence[str], None] = "4d2f7a91c3e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# edges.source_id/target_id 인덱스는 vertices 삭제 시 FK(CASCADE) 검사에 사용
+INDEXES = [
+    ("vertices", "graph_id"),
+    ("edges", "graph_id"),
+    ("edges", "source_id"),
+    ("edges", "target_id"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in INDEXES:
+        op.create_index(f"ix_{table}_{column}", table, [column], if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in INDEXES:
+        op.drop_index(f"ix_{table}_{column}", table_name=table, if_exists=True)
@@ -0,0 +1,30 @@
+"""Add graphs.execution_plan
+
+Revision ID: a6d3f8c2b1e4
+Revises: f1c8a3d5e920
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a6d3f8c2b1e4"
+down_revision: Union[str, Sequence[str], None] = "f1c8a3d5e920"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 저장 시 컴파일한 실행 계획 (기존 그래프는 NULL, 실행 시 컴파일)
+    op.add_column("graphs", sa.Column("execution_plan", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("graphs", "execution_plan")
@@ -0,0 +1,42 @@
+"""Add graph list indexes
+
+Revision ID: c3a9e5b17d42
+Revises: 9b8e1c0d5f27
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a9e5b17d42"
+down_revision: Union[str, Sequence[str], None] = "9b8e1c0d5f27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # GET /workflows keyset 페이지네이션 정렬 순서
+    op.create_index(
+        "ix_graphs_updated_at_id",
+        "graphs",
+        ["updated_at", "id"],
+        if_not_exists=True,
+    )
+    # 이름 접두사 검색 (LIKE 'prefix%')
+    op.create_index(
+        "ix_graphs_name",
+        "graphs",
+        ["name"],
+        postgresql_ops={"name": "text_pattern_ops"},
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_graphs_name", table_name="graphs", if_exists=True)
+    op.drop_index("ix_graphs_updated_at_id", table_name="graphs", if_exists=True)
@@ -0,0 +1,66 @@
+"""Add run history tables
+
+Revision ID: e7b2d4f9a613
+Revises: c3a9e5b17d42
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b2d4f9a613"
+down_revision: Union[str, Sequence[str], None] = "c3a9e5b17d42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "workflow_runs",
+        sa.Column("id", sa.String(length=32), nullable=False),
+        sa.Column("graph_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("inputs", sa.JSON(), nullable=True),
+        sa.Column("errors", sa.JSON(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("execution_time", sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(["graph_id"], ["graphs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_workflow_runs_graph_id_started_at",
+        "workflow_runs",
+        ["graph_id", "started_at"],
+    )
+    op.create_table(
+        "node_runs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("run_id", sa.String(length=32), nullable=False),
+        sa.Column("node_id", sa.String(), nullable=True),
+        sa.Column("node_type", sa.String(), nullable=True),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.Column("inputs", sa.JSON(), nullable=True),
+        sa.Column("outputs", sa.JSON(), nullable=True),
+        sa.Column("error", sa.String(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("duration", sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(["run_id"], ["workflow_runs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_node_runs_run_id", "node_runs", ["run_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_node_runs_run_id", table_name="node_runs")
+    op.drop_table("node_runs")
+    op.drop_index("ix_workflow_runs_graph_id_started_at", table_name="workflow_runs")
+    op.drop_table("workflow_runs")
@@ -0,0 +1,30 @@
+"""Add node_runs.timing
+
+Revision ID: f1c8a3d5e920
+Revises: e7b2d4f9a613
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1c8a3d5e920"
+down_revision: Union[str, Sequence[str], None] = "e7b2d4f9a613"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 노드 단계별 소요 시간 (queue_wait/input_collection/validation/execution/...)
+    op.add_column("node_runs", sa.Column("timing", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("node_runs", "timing")
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+워크플로우 엔진 벤치마크 (DB/네트워크 없이 실행)
+
+합성 그래프(긴 체인, 넓은 fan-out/fan-in, 다이아몬드 반복, 랜덤 DAG)를 생성해
+벤치마크 전용 노드(no-op, sleep)로 실행하고 다음을 측정합니다.
+
+- load: WorkflowEngine.load (노드 생성 + 의존성 구성)
+- sort: 위상 정렬
+- run: 전체 실행 시간과 노드당 오버헤드 (no-op 노드이므로 대부분 엔진 비용)
+- peak_mb: load + run 동안 tracemalloc 기준 최대 메모리 (별도 실행으로 측정)
+- concurrency: 동시에 실행하는 run 수에 따른 처리량(runs/s)과 확장 효율
+
+결과를 JSON 으로 저장하고 이전 결과(--baseline)와 비교해 임계값 이상 느려진
+항목이 있으면 종료 코드 1 로 끝나므로 커밋 간 회귀 확인에 사용할 수 있습니다.
+
+    python -m benchmarks.engine_benchmark
+    python -m benchmarks.engine_benchmark --sizes 10,1000,100000 --shapes chain,random
+    python -m benchmarks.engine_benchmark --output before.json
+    python -m benchmarks.engine_benchmark --baseline before.json --threshold 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from database.graph.edge import Edge
+from database.graph.vertex import Vertex
+from helpers.engine.workflow_engine import WorkflowEngine
+from helpers.node.factory import NodeFactory
+from helpers.node.node_base import BaseNode
+
+NOOP_NODE = "BENCH_NOOP"
+SLEEP_NODE = "BENCH_SLEEP"
+
+DEFAULT_SHAPES = ["chain", "fan", "diamond", "random"]
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+DEFAULT_CONCURRENCY = [1, 2, 4, 8, 16]
+
+# 값이 클수록 좋은 지표 (나머지는 작을수록 좋음)
+HIGHER_IS_BETTER = {"throughput"}
+# 회귀 비교 대상 지표 -> 잡음 판단에 쓰는 측정 시간 항목
+COMPARED_METRICS = {
+    "load": "load",
+    "sort": "sort",
+    "run": "run",
+    "per_node_us": "run",
+    "peak_mb": None,
+    "throughput": "elapsed",
+}
+# 측정 시간이 이보다 짧으면 잡음이 커서 회귀 비교에서 제외
+MIN_COMPARABLE_SECONDS = 0.005
+
+
+class NoopNode(BaseNode):
+    """아무 일도 하지 않는 노드 (엔진 오버헤드 측정용)"""
+
+    __slots__ = ()
+
+    def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return {}
+
+    def validate_inputs(self, inputs: Dict[str, Any]) -> bool:
+        return True
+
+
+class SleepNode(BaseNode):
+    """properties.seconds 만큼 await 로 대기하는 노드 (I/O 대기 모사)"""
+
+    __slots__ = ()
+
+    def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        time.sleep(self.properties.get("seconds", 0.001))
+        return {}
+
+    async def execute_async(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(self.properties.get("seconds", 0.001))
+        return {}
+
+    def validate_inputs(self, inputs: Dict[str, Any]) -> bool:
+        return True
+
+
+def register_bench_nodes():
+    NodeFactory.register_node_type(NOOP_NODE, NoopNode)
+    NodeFactory.register_node_type(SLEEP_NODE, SleepNode)
+
+
+Graph = Tuple[List[Vertex], List[Edge]]
+
+
+def _vertices(count: int, node_type: str, properties: Dict[str, Any]) -> List[Vertex]:
+    return [
+        Vertex(id=i, type=node_type, properties=properties) for i in range(1, count + 1)
+    ]
+
+
+def _edges(pairs) -> List[Edge]:
+    return [Edge(source_id=source, target_id=target) for source, target in pairs]
+
+
+def chain_graph(size: int, node_type: str = NOOP_NODE, properties=None) -> Graph:
+    """1 -> 2 -> ... -> size"""
+    return _vertices(size, node_type, properties or {}), _edges(
+        (i, i + 1) for i in range(1, size)
+    )
+
+
+def fan_graph(size: int, node_type: str = NOOP_NODE, properties=None) -> Graph:
+    """루트 하나에서 size-2 개로 퍼졌다가 싱크 하나로 모임"""
+    size = max(size, 3)
+    sink = size
+    return _vertices(size, node_type, properties or {}), _edges(
+        pair for i in range(2, sink) for pair in ((1, i), (i, sink))
+    )
+
+
+def diamond_graph(size: int, node_type: str = NOOP_NODE, properties=None) -> Graph:
+    """top -> (left, right) -> bottom 을 이어 붙인 그래프 (bottom 이 다음 top)"""
+    diamonds = max(1, (size - 1) // 3)
+    pairs = []
+    for d in range(diamonds):
+        top = 1 + d * 3
+        left, right, bottom = top + 1, top + 2, top + 3
+        pairs += [(top, left), (top, right), (left, bottom), (right, bottom)]
+    return _vertices(diamonds * 3 + 1, node_type, properties or {}), _edges(pairs)
+
+
+def random_dag(
+    size: int,
+    node_type: str = NOOP_NODE,
+    properties=None,
+    degree: int = 2,
+    seed: int = 42,
+) -> Graph:
+    """각 노드가 앞 번호 노드 중 최대 degree 개를 무작위로 의존 (시드 고정)"""
+    rng = random.Random(seed)
+    pairs = set()
+    for target in range(2, size + 1):
+        for _ in range(degree):
+            pairs.add((rng.randrange(1, target), target))
+    return _vertices(size, node_type, properties or {}), _edges(sorted(pairs))
+
+
+GENERATORS: Dict[str, Callable[..., Graph]] = {
+    "chain": chain_graph,
+    "fan": fan_graph,
+    "diamond": diamond_graph,
+    "random": random_dag,
+}
+
+
+async def _load(graph: Graph) -> WorkflowEngine:
+    engine = WorkflowEngine()
+    if not await engine.load(*graph):
+        raise RuntimeError("워크플로우 로드 실패")
+    return engine
+
+
+async def measure_once(graph: Graph) -> Dict[str, float]:
+    """load / sort / run 1회 측정 (초)"""
+    started = time.perf_counter()
+    engine = await _load(graph)
+    loaded = time.perf_counter()
+    engine._topological_sort()
+    sorted_at = time.perf_counter()
+    result = await engine.start({})
+    finished = time.perf_counter()
+    if not result.success:
+        raise RuntimeError(f"실행 실패: {result.errors[:3]}")
+    return {
+        "load": loaded - started,
+        "sort": sorted_at - loaded,
+        "run": finished - sorted_at,
+    }
+
+
+async def measure_peak_memory(graph: Graph) -> float:
+    """load + run 동안 최대 메모리 (MB)"""
+    tracemalloc.start()
+    try:
+        engine = await _load(graph)
+        await engine.start({})
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+async def bench_shape(
+    shape: str, size: int, repeat: int, memory: bool
+) -> Dict[str, float]:
+    graph = GENERATORS[shape](size)
+    node_count = len(graph[0])
+    runs = [await measure_once(graph) for _ in range(repeat)]
+    row = {
+        "nodes": node_count,
+        "edges": len(graph[1]),
+        **{key: statistics.median(run[key] for run in runs) for key in runs[0]},
+    }
+    row["per_node_us"] = row["run"] / node_count * 1e6
+    if memory:
+        row["peak_mb"] = await measure_peak_memory(graph)
+    return row
+
+
+async def bench_concurrency(
+    level: int, node_type: str, nodes: int, sleep: float, repeat: int
+) -> Dict[str, float]:
+    """동시 실행 수 level 에서 처리량 측정 (run 마다 별도 엔진)"""
+    graph = chain_graph(nodes, node_type, {"seconds": sleep})
+    elapsed = []
+    for _ in range(repeat):
+        engines = [await _load(graph) for _ in range(level)]
+        started = time.perf_counter()
+        results = await asyncio.gather(*(engine.start({}) for engine in engines))
+        elapsed.append(time.perf_counter() - started)
+        if not all(result.success for result in results):
+            raise RuntimeError("동시 실행 중 실패한 run 이 있습니다")
+    median = statistics.median(elapsed)
+    return {"runs": level, "elapsed": median, "throughput": level / median}
+
+
+async def run_benchmarks(args) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    for shape in args.shapes:
+        for size in args.sizes:
+            key = f"{shape}/{size}"
+            row = await bench_shape(shape, size, args.repeat, not args.no_memory)
+            results[key] = row
+            memory = f"  peak {row['peak_mb']:7.1f}MB" if "peak_mb" in row else ""
+            print(
+                f"   {key:<16} load {row['load'] * 1000:9.2f}ms  "
+                f"sort {row['sort'] * 1000:8.2f}ms  run {row['run'] * 1000:9.2f}ms  "
+                f"{row['per_node_us']:7.1f}µs/node{memory}"
+            )
+
+    for node_type, label in ((SLEEP_NODE, "sleep"), (NOOP_NODE, "noop")):
+        base = None
+        for level in args.concurrency:
+            row = await bench_concurrency(
+                level, node_type, args.concurrency_nodes, args.sleep, args.repeat
+            )
+            base = base or row["throughput"] / level
+            row["efficiency"] = row["throughput"] / (base * level)
+            results[f"concurrency/{label}/{level}"] = row
+            print(
+                f"   concurrency/{label:<5} x{level:<3} "
+                f"{row['throughput']:8.1f} runs/s  효율 {row['efficiency'] * 100:5.1f}%"
+            )
+    return results
+
+
+def compare(
+    baseline: Dict[str, Dict[str, float]],
+    current: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[str]:
+    """baseline 대비 threshold(비율) 이상 나빠진 지표 목록"""
+    regressions = []
+    for key, row in current.items():
+        base_row = baseline.get(key)
+        if base_row is None:
+            continue
+        for metric, seconds_key in COMPARED_METRICS.items():
+            base, value = base_row.get(metric), row.get(metric)
+            if not base or value is None:
+                continue
+            if seconds_key and (
+                max(base_row[seconds_key], row[seconds_key]) < MIN_COMPARABLE_SECONDS
+            ):
+                continue
+            if metric in HIGHER_IS_BETTER:
+                change = (base - value) / base
+            else:
+                change = (value - base) / base
+            if change > threshold:
+                regressions.append(
+                    f"{key} {metric}: {base:.6g} -> {value:.6g} ({change * 100:+.1f}%)"
+                )
+    return regressions
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _csv(cast):
+    return lambda value: [cast(item) for item in value.split(",") if item]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워크플로우 엔진 벤치마크")
+    parser.add_argument(
+        "--shapes",
+        type=_csv(str),
+        default=DEFAULT_SHAPES,
+        help=f"그래프 형태 ({','.join(GENERATORS)})",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=_csv(int),
+        default=DEFAULT_SIZES,
+        help="노드 수 목록 (예: 10,1000,100000)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수 (중앙값)")
+    parser.add_argument(
+        "--no-memory", action="store_true", help="tracemalloc 메모리 측정 생략"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=_csv(int),
+        default=DEFAULT_CONCURRENCY,
+        help="동시 실행 수 목록",
+    )
+    parser.add_argument(
+        "--concurrency-nodes", type=int, default=100, help="동시 실행 그래프 노드 수"
+    )
+    parser.add_argument(
+        "--sleep", type=float, default=0.001, help="sleep 노드 대기 시간(초)"
+    )
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="회귀로 판단할 악화 비율"
+    )
+    parser.add_argument("--log-level", default="WARNING", help="실행 중 로그 레벨")
+    args = parser.parse_args()
+
+    unknown = set(args.shapes) - set(GENERATORS)
+    if unknown:
+        parser.error(f"알 수 없는 그래프 형태: {', '.join(sorted(unknown))}")
+
+    # 노드마다 INFO 로그를 남기면 로그 비용이 측정을 지배하므로 기본은 WARNING
+    logging.getLogger().setLevel(args.log_level)
+    register_bench_nodes()
+
+    revision = _git_revision()
+    print(
+        f"📊 엔진 벤치마크 (commit {revision or '-'}, Python {sys.version.split()[0]})"
+    )
+    results = asyncio.run(run_benchmarks(args))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "revision": revision,
+                    "python": sys.version.split()[0],
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+        print(f"💾 결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline["results"], results, args.threshold)
+        print(
+            f"🔍 baseline {baseline.get('revision') or '-'} 대비 "
+            f"{args.threshold * 100:.0f}% 이상 악화: {len(regressions)}건"
+        )
+        for line in regressions:
+            print(f"   ⚠️ {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
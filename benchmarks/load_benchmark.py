@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+워크플로우 로드 쿼리 벤치마크
+
+그래프/버텍스/엣지를 각각 조회하는 기존 방식(3회 왕복)과
+UNION ALL 단일 쿼리 방식의 로드 지연 시간을 비교합니다.
+
+    python -m benchmarks.load_benchmark
+    python -m benchmarks.load_benchmark --database-url postgresql+asyncpg://... \\
+        --graphs 200 --vertices 100 --repeat 50
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel
+
+from database.graph.edge import Edge
+from database.graph.graph import Graph
+from database.graph.vertex import Vertex
+from database.setup import create_engine_from_config
+from repositories.graph.graph_repository import GraphRepository
+from setting.config import Settings
+
+DEFAULT_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+async def seed(db: AsyncSession, graphs: int, vertices: int) -> List[int]:
+    """그래프당 vertices 개의 버텍스와 체인 형태의 엣지 생성"""
+    await db.execute(
+        insert(Graph),
+        [
+            {"name": f"bench-{i}", "description": "", "properties": {}}
+            for i in range(graphs)
+        ],
+    )
+    graph_ids = list((await db.execute(select(Graph.id))).scalars())
+
+    await db.execute(
+        insert(Vertex),
+        [
+            {"graph_id": graph_id, "type": "TEXT_INPUT", "properties": {"i": i}}
+            for graph_id in graph_ids
+            for i in range(vertices)
+        ],
+    )
+    rows = await db.execute(select(Vertex.graph_id, Vertex.id).order_by(Vertex.id))
+    vertex_ids: dict[int, List[int]] = {}
+    for graph_id, vertex_id in rows:
+        vertex_ids.setdefault(graph_id, []).append(vertex_id)
+
+    await db.execute(
+        insert(Edge),
+        [
+            {
+                "graph_id": graph_id,
+                "source_id": ids[i],
+                "target_id": ids[i + 1],
+                "type": "default",
+                "properties": {},
+            }
+            for graph_id, ids in vertex_ids.items()
+            for i in range(len(ids) - 1)
+        ],
+    )
+    await db.commit()
+    return graph_ids
+
+
+async def load_legacy(db: AsyncSession, graph_id: int):
+    """기존 방식: 그래프, 버텍스, 엣지를 각각 조회"""
+    graph = (
+        await db.execute(select(Graph).where(Graph.id == graph_id))
+    ).scalar_one_or_none()
+    vertices = (
+        (await db.execute(select(Vertex).where(Vertex.graph_id == graph_id)))
+        .scalars()
+        .all()
+    )
+    edges = (
+        (await db.execute(select(Edge).where(Edge.graph_id == graph_id)))
+        .scalars()
+        .all()
+    )
+    return graph, vertices, edges
+
+
+async def load_single_query(db: AsyncSession, graph_id: int):
+    """UNION ALL 단일 쿼리"""
+    return await GraphRepository(db).get_graph_with_elements(graph_id)
+
+
+async def measure(
+    db: AsyncSession,
+    loader: Callable[[AsyncSession, int], Awaitable],
+    graph_ids: List[int],
+    repeat: int,
+) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        graph_id = random.choice(graph_ids)
+        start = time.perf_counter()
+        await loader(db, graph_id)
+        timings.append(time.perf_counter() - start)
+        # identity map 에 남은 객체가 다음 측정에 영향을 주지 않도록 비움
+        db.expunge_all()
+    return timings
+
+
+def _report(label: str, timings: List[float]):
+    timings = sorted(timings)
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(
+        f"   {label:<14} median {statistics.median(timings) * 1000:7.2f}ms  "
+        f"p95 {p95 * 1000:7.2f}ms  (n={len(timings)})"
+    )
+
+
+async def run(args):
+    # 앱과 같은 엔진 설정 (SQLite 는 WAL 등 PRAGMA 적용)
+    engine = create_engine_from_config(Settings(DATABASE_URL=args.database_url))
+    async with engine.begin() as conn:
+        if args.reset:
+            await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        graph_ids = await seed(db, args.graphs, args.vertices)
+        print(
+            f"📊 그래프 {args.graphs}개 x 버텍스 {args.vertices}개 "
+            f"({engine.dialect.name})"
+        )
+        # 워밍업
+        await measure(db, load_legacy, graph_ids, 3)
+        await measure(db, load_single_query, graph_ids, 3)
+
+        _report("3-query", await measure(db, load_legacy, graph_ids, args.repeat))
+        _report(
+            "single-query",
+            await measure(db, load_single_query, graph_ids, args.repeat),
+        )
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워크플로우 로드 쿼리 벤치마크")
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--graphs", type=int, default=100, help="생성할 그래프 수")
+    parser.add_argument("--vertices", type=int, default=50, help="그래프당 버텍스 수")
+    parser.add_argument("--repeat", type=int, default=100, help="반복 측정 횟수")
+    parser.add_argument(
+        "--reset", action="store_true", help="측정 전 테이블 삭제 후 재생성"
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
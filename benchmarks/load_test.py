@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+HTTP 부하 테스트 (단일 머신, 외부 네트워크 없이 실행)
+
+로컬 mock 서버(웹훅 / OpenAI 호환 LLM 엔드포인트, 지연 시간 설정 가능)를 띄우고
+uvicorn 으로 앱을 SQLite 파일 DB(기본) 또는 로컬 PostgreSQL 에 연결해 기동한 뒤,
+생성 / 조회 / 실행 API 를 고정된 동시성 단계별로 호출해 처리량과 p50/p95/p99 지연을
+보고합니다. 릴리스 전 용량 확인용입니다.
+
+- 각 동시성 단계는 동시 요청 수만큼의 워커가 --duration 동안 응답을 받는 즉시
+  다음 요청을 보내는 closed-loop 방식입니다.
+- execute 는 기본으로 mock 웹훅을 호출하는 WEBHOOK 노드 워크플로우를 실행합니다
+  (--workflow llm 은 TEXT_INPUT -> LLM_NODE -> TEXT_OUTPUT).
+  앱의 OPENAI_BASE_URL 은 mock 서버로 지정되어 LLM 호출도 로컬에서 끝납니다.
+- 실행 중인 서버를 측정하려면 --url 로 지정합니다 (앱/DB 기동 생략).
+
+    python -m benchmarks.load_test
+    python -m benchmarks.load_test --concurrency 1,16,64 --duration 20 --workers 4
+    python -m benchmarks.load_test --database-url postgresql+asyncpg://user:pw@localhost/loadtest
+    python -m benchmarks.load_test --url http://localhost:8000 --scenarios get,execute
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - 부하 테스트 전용 의존성
+    httpx = None
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SCENARIOS = ["create", "get", "execute"]
+DEFAULT_CONCURRENCY = [1, 8, 32]
+LLM_PATH = "/v1/chat/completions"
+
+
+class MockServer:
+    """지연 시간을 설정할 수 있는 로컬 웹훅 / LLM mock 서버"""
+
+    def __init__(self, webhook_latency: float, llm_latency: float):
+        self.webhook_latency = webhook_latency
+        self.llm_latency = llm_latency
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self._respond()
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                self._respond()
+
+            def _respond(self):
+                if self.path.startswith(LLM_PATH):
+                    time.sleep(server.llm_latency)
+                    body = {
+                        "object": "chat.completion",
+                        "model": "mock",
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {"role": "assistant", "content": "ok"},
+                                "finish_reason": "stop",
+                            }
+                        ],
+                    }
+                else:
+                    time.sleep(server.webhook_latency)
+                    body = {"ok": True, "path": self.path}
+                payload = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_app(
+    database_url: str, mock_url: str, workers: int, port: int, log_file
+) -> subprocess.Popen:
+    """uvicorn 으로 앱 기동 (앱 로그는 log_file 로 기록)"""
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "OPENAI_BASE_URL": f"{mock_url}/v1",
+        "OPENAI_API_KEY": "load-test",
+    }
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdout=log_file,
+        stderr=subprocess.STDOUT,
+    )
+
+
+async def wait_until_ready(client: "httpx.AsyncClient", timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if (await client.get("/")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        if time.monotonic() > deadline:
+            raise RuntimeError("앱이 기동되지 않았습니다")
+        await asyncio.sleep(0.2)
+
+
+def _workflow_payload(name: str, workflow: str) -> Dict[str, Any]:
+    if workflow == "llm":
+        vertices = [
+            {"id": "in", "type": "TEXT_INPUT", "properties": {}},
+            {"id": "llm", "type": "LLM_NODE", "properties": {"model": "mock"}},
+            {"id": "out", "type": "TEXT_OUTPUT", "properties": {}},
+        ]
+        edges = [
+            {"source_id": "in", "target_id": "llm"},
+            {"source_id": "llm", "target_id": "out"},
+        ]
+    else:
+        vertices = [{"id": "hook", "type": "WEBHOOK", "properties": {}}]
+        edges = []
+    return {"name": name, "vertices": vertices, "edges": edges}
+
+
+def _execute_inputs(workflow: str, mock_url: str) -> Dict[str, Any]:
+    if workflow == "llm":
+        return {"text": "load test"}
+    return {"url": f"{mock_url}/webhook", "method": "POST", "data": {"n": 1}}
+
+
+class Scenario:
+    """요청 1회를 보내고 성공 여부를 반환하는 시나리오"""
+
+    def __init__(self, name: str, send: Callable[["httpx.AsyncClient"], Any]):
+        self.name = name
+        self.send = send
+
+
+def build_scenarios(
+    names: List[str], graph_ids: List[int], workflow: str, mock_url: str
+) -> List[Scenario]:
+    inputs = _execute_inputs(workflow, mock_url)
+
+    async def create(client):
+        response = await client.post(
+            "/workflows/", json=_workflow_payload("load-test", workflow)
+        )
+        return response.status_code == 200
+
+    async def get(client):
+        response = await client.get(f"/workflows/{random.choice(graph_ids)}")
+        return response.status_code == 200
+
+    async def execute(client):
+        response = await client.post(
+            f"/workflows/{random.choice(graph_ids)}/execute",
+            json={"initial_inputs": inputs},
+        )
+        return response.status_code == 200 and response.json().get("success", False)
+
+    senders = {"create": create, "get": get, "execute": execute}
+    return [Scenario(name, senders[name]) for name in names]
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """정렬된 값의 nearest-rank 백분위"""
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(q * len(values)) - 1)]
+
+
+async def run_level(
+    client: "httpx.AsyncClient", scenario: Scenario, concurrency: int, duration: float
+) -> Dict[str, float]:
+    """동시성 concurrency 로 duration 동안 요청 (closed-loop)"""
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                ok = await scenario.send(client)
+            except httpx.HTTPError:
+                ok = False
+            latencies.append(time.perf_counter() - started)
+            if not ok:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput": len(latencies) / elapsed,
+        "p50": _percentile(latencies, 0.50),
+        "p95": _percentile(latencies, 0.95),
+        "p99": _percentile(latencies, 0.99),
+    }
+
+
+async def run(args, base_url: str, mock_url: str) -> Dict[str, Dict[str, float]]:
+    limits = httpx.Limits(max_connections=max(args.concurrency))
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=args.timeout
+    ) as client:
+        await wait_until_ready(client)
+
+        # 조회/실행 대상 워크플로우 준비
+        graph_ids = []
+        for i in range(args.graphs):
+            response = await client.post(
+                "/workflows/", json=_workflow_payload(f"load-test-{i}", args.workflow)
+            )
+            response.raise_for_status()
+            graph_ids.append(response.json()["graph_id"])
+
+        results: Dict[str, Dict[str, float]] = {}
+        for scenario in build_scenarios(
+            args.scenarios, graph_ids, args.workflow, mock_url
+        ):
+            # 워밍업 (커넥션, 캐시, 지연 import)
+            await run_level(client, scenario, 1, min(1.0, args.duration))
+            for concurrency in args.concurrency:
+                row = await run_level(client, scenario, concurrency, args.duration)
+                results[f"{scenario.name}/{concurrency}"] = row
+                print(
+                    f"   {scenario.name:<8} x{concurrency:<4} "
+                    f"{row['throughput']:8.1f} req/s  "
+                    f"p50 {row['p50'] * 1000:8.2f}ms  p95 {row['p95'] * 1000:8.2f}ms  "
+                    f"p99 {row['p99'] * 1000:8.2f}ms  "
+                    f"(n={row['requests']}, 오류 {row['errors']})"
+                )
+        return results
+
+
+def _csv(cast):
+    return lambda value: [cast(item) for item in value.split(",") if item]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP 부하 테스트")
+    parser.add_argument(
+        "--scenarios",
+        type=_csv(str),
+        default=DEFAULT_SCENARIOS,
+        help="실행할 시나리오 (create,get,execute)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=_csv(int),
+        default=DEFAULT_CONCURRENCY,
+        help="동시 요청 수 단계",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10.0, help="단계별 측정 시간(초)"
+    )
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃(초)")
+    parser.add_argument(
+        "--workflow",
+        choices=["webhook", "llm"],
+        default="webhook",
+        help="execute 시나리오의 워크플로우",
+    )
+    parser.add_argument(
+        "--graphs", type=int, default=20, help="조회/실행 대상 워크플로우 수"
+    )
+    parser.add_argument(
+        "--webhook-latency", type=float, default=0.05, help="mock 웹훅 지연(초)"
+    )
+    parser.add_argument(
+        "--llm-latency", type=float, default=0.2, help="mock LLM 응답 지연(초)"
+    )
+    parser.add_argument(
+        "--database-url",
+        help="앱이 사용할 DB (기본: 임시 디렉터리의 SQLite 파일)",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 수")
+    parser.add_argument("--url", help="이미 실행 중인 서버 주소 (앱 기동 생략)")
+    parser.add_argument("--app-log", help="앱 로그 저장 경로 (기본: 임시 파일)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios) - set(DEFAULT_SCENARIOS)
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(sorted(unknown))}")
+    if httpx is None:
+        parser.error("httpx 가 필요합니다 (pip install httpx)")
+
+    mock = MockServer(args.webhook_latency, args.llm_latency)
+    mock.start()
+    app = None
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base_url = args.url
+        log_path = args.app_log or os.path.join(tmpdir, "app.log")
+        log_file = open(log_path, "w", encoding="utf-8")
+        if base_url is None:
+            database_url = (
+                args.database_url
+                or f"sqlite+aiosqlite:///{os.path.join(tmpdir, 'load_test.db')}"
+            )
+            port = _free_port()
+            app = start_app(database_url, mock.url, args.workers, port, log_file)
+            base_url = f"http://127.0.0.1:{port}"
+            print(f"🚀 앱 기동: {base_url} (DB {database_url.split('://')[0]})")
+        print(
+            f"📊 mock 서버 {mock.url} "
+            f"(웹훅 {args.webhook_latency * 1000:.0f}ms, "
+            f"LLM {args.llm_latency * 1000:.0f}ms)"
+        )
+        try:
+            results = asyncio.run(run(args, base_url, mock.url))
+        except Exception:
+            log_file.flush()
+            with open(log_path, encoding="utf-8") as f:
+                print("".join(f.readlines()[-30:]), file=sys.stderr)
+            raise
+        finally:
+            if app is not None:
+                app.terminate()
+                app.wait(timeout=30)
+            log_file.close()
+            mock.stop()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+        print(f"💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
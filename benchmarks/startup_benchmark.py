@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+기동 시간(import 비용) 벤치마크
+
+새 인터프리터에서 대상 모듈을 import 하는 시간을 반복 측정하고,
+`-X importtime` 결과로 누적 비용이 큰 모듈과 무거운 SDK 로드 여부를 보고합니다.
+
+    python -m benchmarks.startup_benchmark
+    python -m benchmarks.startup_benchmark --module main --repeat 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = [
+    "helpers.node.factory",
+    "helpers.engine.workflow_engine",
+    "main",
+]
+
+# 그래프가 실제로 사용할 때만 로드되어야 하는 무거운 모듈
+HEAVY_MODULES = ["requests", "openai"]
+
+_MEASURE_SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(f"{{elapsed}}|{{','.join(heavy)}}")
+"""
+
+
+def _run_python(args: List[str]) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def measure_import(module: str, repeat: int) -> Tuple[List[float], List[str]]:
+    """새 프로세스에서 모듈 import 시간 측정 (초)"""
+    timings = []
+    heavy: List[str] = []
+    snippet = _MEASURE_SNIPPET.format(module=module, heavy=HEAVY_MODULES)
+    for _ in range(repeat):
+        output = _run_python(["-c", snippet]).stdout.strip().splitlines()[-1]
+        elapsed, loaded = output.split("|")
+        timings.append(float(elapsed))
+        heavy = [name for name in loaded.split(",") if name]
+    return timings, heavy
+
+
+def top_imports(module: str, limit: int) -> List[Tuple[str, int]]:
+    """`-X importtime` 기준 누적 import 비용 상위 모듈 (마이크로초)"""
+    result = _run_python(["-X", "importtime", "-c", f"import {module}"])
+    cumulative: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            _, cumulative_us, name = line.split("|")
+            value = int(cumulative_us.strip())
+        except ValueError:
+            continue
+        name = name.strip()
+        # 측정 대상 모듈과 상위 패키지는 전체 시간과 같으므로 제외
+        if module == name or module.startswith(f"{name}."):
+            continue
+        cumulative[name] = max(value, cumulative.get(name, 0))
+    return sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기동 시간(import 비용) 벤치마크")
+    parser.add_argument("--module", action="append", help="측정할 모듈 (반복 가능)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수")
+    parser.add_argument("--top", type=int, default=10, help="상위 import 표시 개수")
+    args = parser.parse_args()
+
+    modules = args.module or DEFAULT_MODULES
+    for module in modules:
+        timings, heavy = measure_import(module, args.repeat)
+        print(f"📦 {module}")
+        print(
+            f"   import 시간: median {statistics.median(timings) * 1000:.1f}ms "
+            f"(min {min(timings) * 1000:.1f}ms, max {max(timings) * 1000:.1f}ms, "
+            f"n={len(timings)})"
+        )
+        print(f"   무거운 모듈 로드: {', '.join(heavy) if heavy else '없음'}")
+        for name, cumulative_us in top_imports(module, args.top):
+            print(f"     {cumulative_us / 1000:8.1f}ms  {name}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,9 +11,9 @@ class Edge(SQLModel, table=True):  # type: ignore
     id: int = Field(
         default=None, primary_key=True, sa_column_kwargs={"autoincrement": True}
     )
-    graph_id: int = Field(foreign_key="graphs.id")
-    source_id: int = Field(foreign_key="vertices.id")
-    target_id: int = Field(foreign_key="vertices.id")
+    graph_id: int = Field(foreign_key="graphs.id", ondelete="CASCADE", index=True)
+    source_id: int = Field(foreign_key="vertices.id", ondelete="CASCADE", index=True)
+    target_id: int = Field(foreign_key="vertices.id", ondelete="CASCADE", index=True)
     type: str = Field(default=None)
     properties: dict = Field(default_factory=dict, sa_type=JSON)
     created_at: datetime = Field(
@@ -1,11 +1,17 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import JSON, DateTime
+from sqlalchemy import JSON, DateTime, Index
 from sqlmodel import Field, SQLModel
 
 
 class Graph(SQLModel, table=True):  # type: ignore
     __tablename__ = "graphs"  # type: ignore
+    __table_args__ = (
+        # 목록 조회 keyset 페이지네이션 (updated_at, id) 정렬
+        Index("ix_graphs_updated_at_id", "updated_at", "id"),
+        # 이름 접두사 검색 (LIKE 'prefix%'), Postgres 는 collation 무관하게 사용
+        Index("ix_graphs_name", "name", postgresql_ops={"name": "text_pattern_ops"}),
+    )
     id: int = Field(
         default=None, primary_key=True, sa_column_kwargs={"autoincrement": True}
     )
@@ -20,3 +26,5 @@ class Graph(SQLModel, table=True):  # type: ignore
         sa_type=DateTime(timezone=True),
     )
     properties: dict = Field(default_factory=dict, sa_type=JSON)
+    # 저장 시 컴파일한 실행 계획 (helpers.engine.execution_plan.ExecutionPlan.to_dict)
+    execution_plan: dict | None = Field(default=None, sa_type=JSON)
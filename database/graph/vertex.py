@@ -11,7 +11,7 @@ class Vertex(SQLModel, table=True):  # type: ignore
     id: int = Field(
         default=None, primary_key=True, sa_column_kwargs={"autoincrement": True}
     )
-    graph_id: int = Field(foreign_key="graphs.id")
+    graph_id: int = Field(foreign_key="graphs.id", ondelete="CASCADE", index=True)
     type: str = Field(default=None, description="pre-defined Node type")
     properties: dict = Field(default_factory=dict, sa_type=JSON)
     created_at: datetime = Field(
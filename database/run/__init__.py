@@ -0,0 +1 @@
+# Run history models package
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime
+from sqlmodel import Field, SQLModel
+
+
+class NodeRun(SQLModel, table=True):  # type: ignore
+    """노드 실행 이력 (실행이 끝난 노드만 기록)"""
+
+    __tablename__ = "node_runs"  # type: ignore
+    id: int = Field(
+        default=None, primary_key=True, sa_column_kwargs={"autoincrement": True}
+    )
+    run_id: str = Field(
+        foreign_key="workflow_runs.id", ondelete="CASCADE", index=True, max_length=32
+    )
+    node_id: str = Field(default=None)
+    node_type: str = Field(default=None)
+    status: str = Field(default=None)
+    inputs: dict | None = Field(default=None, sa_type=JSON)
+    outputs: dict | None = Field(default=None, sa_type=JSON)
+    error: str | None = Field(default=None)
+    started_at: datetime | None = Field(default=None, sa_type=DateTime(timezone=True))
+    finished_at: datetime | None = Field(default=None, sa_type=DateTime(timezone=True))
+    duration: float | None = Field(default=None, description="초")
+    timing: dict | None = Field(
+        default=None, sa_type=JSON, description="단계별 소요 시간, 입출력 크기"
+    )
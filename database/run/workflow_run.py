@@ -0,0 +1,25 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import JSON, DateTime, Index
+from sqlmodel import Field, SQLModel
+
+
+class WorkflowRun(SQLModel, table=True):  # type: ignore
+    """워크플로우 실행 이력"""
+
+    __tablename__ = "workflow_runs"  # type: ignore
+    __table_args__ = (
+        # 그래프별 최근 실행 조회
+        Index("ix_workflow_runs_graph_id_started_at", "graph_id", "started_at"),
+    )
+    id: str = Field(primary_key=True, max_length=32, description="run_id")
+    graph_id: int = Field(foreign_key="graphs.id", ondelete="CASCADE")
+    status: str = Field(default="running")
+    inputs: dict | None = Field(default=None, sa_type=JSON)
+    errors: list = Field(default_factory=list, sa_type=JSON)
+    started_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=DateTime(timezone=True),
+    )
+    finished_at: datetime | None = Field(default=None, sa_type=DateTime(timezone=True))
+    execution_time: float | None = Field(default=None)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Literal
 
 from pydantic import BaseModel
 
@@ -15,11 +15,16 @@ class WorkflowExecutionResult:
         self.node_results: Dict[str, Any] = {}
         self.errors: List[str] = []
         self.execution_order: List[str] = []
+        # 노드별 단계 소요 시간 (helpers.engine.run_context.NodeTiming)
+        self.node_timings: Dict[str, Any] = {}
+        # 프로파일링 실행 결과 (helpers.engine.profiler)
+        self.profile: Dict[str, Any] | None = None
 
 
 class WorkflowCreateRequest(BaseModel):
     name: str
     description: str = ""
+    properties: Dict[str, Any] = {}
     vertices: List[Dict[str, Any]]
     edges: List[Dict[str, Any]]
 
@@ -32,6 +37,8 @@ class WorkflowCreateResponse(BaseModel):
 
 class WorkflowExecuteRequest(BaseModel):
     initial_inputs: Dict[str, Any] | None = None
+    # 프로파일링 모드 (PROFILING_ENABLED 설정 필요)
+    profile: Literal["cpu", "wall"] | None = None
 
 
 class WorkflowExecuteResponse(BaseModel):
@@ -0,0 +1,324 @@
+"""
+워크플로우 실행 계획
+
+워크플로우를 저장할 때 그래프를 검증하고 실행 계획(위상 정렬 순서, 인접 리스트,
+레벨)을 컴파일해 graphs.execution_plan 에 함께 저장합니다. 실행 시에는 저장된 계획을
+그대로 사용하므로 매 실행마다 위상 정렬과 검증을 반복하지 않고, 실행할 수 없는
+그래프는 실행 전에 저장 단계에서 거절됩니다.
+
+검증 항목
+- 노드 타입: 등록된 노드 타입(플러그인 포함)인지
+- 엣지: 같은 워크플로우의 버텍스만 참조하는지
+- 사이클: 위상 정렬이 가능한지
+- 포트 타입: 엔진은 앞 노드의 출력을 이름 그대로 다음 노드의 입력으로 넘기므로,
+  이름이 같은 출력/입력의 타입이 호환되는지 (JSON 은 모든 타입과 호환, FILE 출력은
+  blob 참조이며 참조를 받지 않는 노드에는 내용으로 복원되므로 TEXT 입력과도 호환)
+- 필수 입력: 앞 노드가 있는 노드의 필수 입력을 앞 노드의 출력, 기본값, 노드 속성
+  (노드 클래스가 property_inputs 로 선언한 입력만) 중 하나가 제공하는지. 루트 노드는 실행 시 초기 입력을 받으므로 검사하지 않고,
+  출력 스키마를 선언하지 않은 노드(플러그인 등) 뒤의 노드도 검사하지 않습니다.
+"""
+
+import hashlib
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple
+
+from database.graph.edge import Edge
+from database.graph.vertex import Vertex
+from helpers.node.factory import NodeFactory
+from helpers.node.node_base import BaseNode, NodeInputOutputType
+from setting.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 저장 형식 버전 (형식이나 검증 규칙이 바뀌면 이전 버전 계획은 실행 시 다시 컴파일)
+PLAN_VERSION = 3
+
+
+class WorkflowValidationError(ValueError):
+    """실행할 수 없는 워크플로우 (발견된 문제를 모두 errors 에 담음)"""
+
+    def __init__(self, errors: List[str]):
+        super().__init__("워크플로우 검증 실패: " + "; ".join(errors))
+        self.errors = errors
+
+
+@dataclass(frozen=True, slots=True)
+class ExecutionPlan:
+    """컴파일된 실행 계획 (노드 id 는 버텍스 id 문자열)"""
+
+    order: Tuple[str, ...]
+    levels: Tuple[Tuple[str, ...], ...]
+    # 노드 -> 다음 노드들 / 노드 -> 앞 노드들
+    adjacency: Dict[str, Tuple[str, ...]]
+    dependencies: Dict[str, Tuple[str, ...]]
+    edge_count: int
+    # 컴파일한 버텍스 id/타입과 엣지 구성의 해시 (graph_fingerprint)
+    fingerprint: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """graphs.execution_plan 저장 형식"""
+        return {
+            "version": PLAN_VERSION,
+            "order": list(self.order),
+            "levels": [list(level) for level in self.levels],
+            "adjacency": {
+                node_id: list(targets) for node_id, targets in self.adjacency.items()
+            },
+            "edge_count": self.edge_count,
+            "fingerprint": self.fingerprint,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ExecutionPlan":
+        adjacency = {
+            node_id: tuple(targets) for node_id, targets in data["adjacency"].items()
+        }
+        dependencies: Dict[str, List[str]] = {}
+        for source_id, targets in adjacency.items():
+            for target_id in targets:
+                dependencies.setdefault(target_id, []).append(source_id)
+        return cls(
+            order=tuple(data["order"]),
+            levels=tuple(tuple(level) for level in data["levels"]),
+            adjacency=adjacency,
+            dependencies={
+                node_id: tuple(sources) for node_id, sources in dependencies.items()
+            },
+            edge_count=data["edge_count"],
+            fingerprint=data["fingerprint"],
+        )
+
+    def matches(self, vertices: List[Vertex], edges: List[Edge]) -> bool:
+        """계획이 현재 버텍스/엣지 구성과 맞는지 (버텍스/엣지를 직접 수정한 경우 대비)
+
+        엣지 수가 같아도 연결이 바뀌었거나 노드 타입이 바뀌면 맞지 않는 것으로 봅니다.
+        """
+        return self.edge_count == len(edges) and self.fingerprint == graph_fingerprint(
+            vertices, edges
+        )
+
+    def remap(
+        self, id_map: Dict[str, str], vertices: List[Vertex], edges: List[Edge]
+    ) -> "ExecutionPlan":
+        """노드 id 를 바꾼 계획 (저장 전 클라이언트 id 로 컴파일한 계획을 DB id 로 변환)
+
+        vertices/edges 는 바뀐 id 기준의 구성이며 fingerprint 계산에 사용합니다.
+        """
+        return ExecutionPlan(
+            order=tuple(id_map[node_id] for node_id in self.order),
+            levels=tuple(
+                tuple(id_map[node_id] for node_id in level) for level in self.levels
+            ),
+            adjacency={
+                id_map[node_id]: tuple(id_map[target] for target in targets)
+                for node_id, targets in self.adjacency.items()
+            },
+            dependencies={
+                id_map[node_id]: tuple(id_map[source] for source in sources)
+                for node_id, sources in self.dependencies.items()
+            },
+            edge_count=self.edge_count,
+            fingerprint=graph_fingerprint(vertices, edges),
+        )
+
+
+def graph_fingerprint(vertices: Iterable[Vertex], edges: Iterable[Edge]) -> str:
+    """버텍스 (id, 타입) 과 엣지 (source, target) 쌍의 정렬된 목록 해시"""
+    return _fingerprint(
+        ((str(vertex.id), vertex.type) for vertex in vertices),
+        ((str(edge.source_id), str(edge.target_id)) for edge in edges),
+    )
+
+
+def _fingerprint(
+    nodes: Iterable[Tuple[str, str]], pairs: Iterable[Tuple[str, str]]
+) -> str:
+    hasher = hashlib.sha256()
+    for node_id, node_type in sorted(nodes):
+        hasher.update(f"v\t{node_id}\t{node_type}\n".encode("utf-8"))
+    for source_id, target_id in sorted(set(pairs)):
+        hasher.update(f"e\t{source_id}\t{target_id}\n".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _compatible(output_type: NodeInputOutputType, input_type: NodeInputOutputType):
+    json_type = NodeInputOutputType.JSON
+    if (
+        output_type == NodeInputOutputType.FILE
+        and input_type == NodeInputOutputType.TEXT
+    ):
+        return True
+    return output_type == input_type or json_type in (output_type, input_type)
+
+
+def compile_plan(vertices: List[Vertex], edges: List[Edge]) -> ExecutionPlan:
+    """워크플로우를 검증하고 실행 계획으로 컴파일
+
+    문제가 있으면 발견된 문제를 모두 모아 WorkflowValidationError 를 발생시킵니다.
+    """
+    builder = PlanBuilder()
+    for vertex in vertices:
+        builder.add_vertex(vertex.id, vertex.type, vertex.properties)
+    for edge in edges:
+        builder.add_edge(edge.source_id, edge.target_id)
+    return builder.build()
+
+
+class PlanBuilder:
+    """버텍스/엣지를 차례로 받아 실행 계획으로 컴파일
+
+    버텍스 객체 대신 id, 타입, 속성 이름만 보관하므로 NDJSON 가져오기처럼 청크 단위로
+    저장하는 워크플로우도 전체를 다시 조회하지 않고 컴파일할 수 있습니다.
+    """
+
+    def __init__(self):
+        self._errors: List[str] = []
+        self._types: Dict[str, str] = {}
+        self._node_classes: Dict[str, type[BaseNode]] = {}
+        # 노드 속성으로 제공되는 입력 이름 (노드 클래스의 property_inputs 중 속성에 있는 것)
+        self._property_inputs: Dict[str, FrozenSet[str]] = {}
+        # 노드 순서를 유지하는 엣지 (중복 엣지는 하나로 취급)
+        self._pairs: Dict[Tuple[str, str], None] = {}
+        self._edge_count = 0
+
+    def add_vertex(self, vertex_id: Any, vertex_type: str, properties: Any):
+        node_id = str(vertex_id)
+        if node_id in self._types:
+            self._errors.append(f"노드 {node_id}: 중복된 버텍스 id")
+            return
+        self._types[node_id] = vertex_type
+        try:
+            node_class = NodeFactory.get_node_class(vertex_type)
+        except Exception as e:
+            self._errors.append(f"노드 {node_id}: {e}")
+            return
+        self._node_classes[node_id] = node_class
+        self._property_inputs[node_id] = node_class.property_inputs.intersection(
+            properties or ()
+        )
+
+    def add_edge(self, source_id: Any, target_id: Any):
+        self._edge_count += 1
+        self._pairs[(str(source_id), str(target_id))] = None
+
+    def build(self) -> ExecutionPlan:
+        errors = list(self._errors)
+        adjacency: Dict[str, Dict[str, None]] = {node_id: {} for node_id in self._types}
+        dependencies: Dict[str, Dict[str, None]] = {
+            node_id: {} for node_id in self._types
+        }
+        for source_id, target_id in self._pairs:
+            missing = [
+                node_id
+                for node_id in (source_id, target_id)
+                if node_id not in self._types
+            ]
+            if missing:
+                errors.append(
+                    f"엣지 {source_id} -> {target_id}: 존재하지 않는 버텍스 {', '.join(missing)}"
+                )
+                continue
+            adjacency[source_id][target_id] = None
+            dependencies[target_id][source_id] = None
+
+        order, levels = _sort(adjacency, dependencies, errors)
+        if self._node_classes.keys() == self._types.keys():
+            _check_ports(
+                self._node_classes, self._property_inputs, dependencies, errors
+            )
+
+        if errors:
+            raise WorkflowValidationError(errors)
+        return ExecutionPlan(
+            order=tuple(order),
+            levels=tuple(tuple(level) for level in levels),
+            adjacency={
+                node_id: tuple(targets) for node_id, targets in adjacency.items()
+            },
+            dependencies={
+                node_id: tuple(sources)
+                for node_id, sources in dependencies.items()
+                if sources
+            },
+            edge_count=self._edge_count,
+            fingerprint=_fingerprint(self._types.items(), self._pairs),
+        )
+
+
+def _sort(
+    adjacency: Dict[str, Dict[str, None]],
+    dependencies: Dict[str, Dict[str, None]],
+    errors: List[str],
+) -> Tuple[List[str], List[List[str]]]:
+    """위상 정렬 순서와 레벨 (레벨 = 가장 긴 선행 경로 길이)"""
+    in_degree = {node_id: len(sources) for node_id, sources in dependencies.items()}
+    level = {node_id: 0 for node_id in adjacency}
+    queue = deque(node_id for node_id, degree in in_degree.items() if degree == 0)
+    order: List[str] = []
+    while queue:
+        current = queue.popleft()
+        order.append(current)
+        for neighbor in adjacency[current]:
+            level[neighbor] = max(level[neighbor], level[current] + 1)
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                queue.append(neighbor)
+
+    if len(order) != len(adjacency):
+        cyclic = sorted(node_id for node_id, degree in in_degree.items() if degree)
+        errors.append(f"워크플로우에 사이클이 존재합니다: {', '.join(cyclic)}")
+        return order, []
+
+    levels: List[List[str]] = []
+    for node_id in order:
+        if level[node_id] == len(levels):
+            levels.append([])
+        levels[level[node_id]].append(node_id)
+    return order, levels
+
+
+def _check_ports(
+    node_classes: Dict[str, type[BaseNode]],
+    property_inputs: Dict[str, FrozenSet[str]],
+    dependencies: Dict[str, Dict[str, None]],
+    errors: List[str],
+):
+    """이름이 같은 출력/입력의 타입 호환성과 필수 입력 연결 검사"""
+    for node_id, sources in dependencies.items():
+        if not sources:
+            continue
+        inputs = {port.name: port for port in node_classes[node_id].get_input_schema()}
+        provided = set(property_inputs[node_id])
+        schemas_known = True
+        for source_id in sources:
+            outputs = node_classes[source_id].get_output_schema()
+            if not outputs:
+                schemas_known = False
+            for output in outputs:
+                provided.add(output.name)
+                port = inputs.get(output.name)
+                if port is not None and not _compatible(output.type, port.type):
+                    errors.append(
+                        f"엣지 {source_id} -> {node_id}: {output.name} 포트 타입 불일치 "
+                        f"({output.type.value} -> {port.type.value})"
+                    )
+        if not schemas_known:
+            continue
+        for port in inputs.values():
+            if port.required and port.value is None and port.name not in provided:
+                errors.append(
+                    f"노드 {node_id}: 필수 입력 {port.name} 이 연결되지 않았습니다"
+                )
+
+
+def load_plan(
+    data: Dict[str, Any] | None, vertices: List[Vertex], edges: List[Edge]
+) -> ExecutionPlan:
+    """저장된 실행 계획 사용, 없거나 현재 구성과 맞지 않으면 다시 컴파일"""
+    if data and data.get("version") == PLAN_VERSION:
+        plan = ExecutionPlan.from_dict(data)
+        if plan.matches(vertices, edges):
+            return plan
+        logger.warning("저장된 실행 계획이 워크플로우 구성과 달라 다시 컴파일합니다")
+    return compile_plan(vertices, edges)
@@ -0,0 +1,286 @@
+"""
+워크플로우 실행 프로파일링
+
+실행 요청에 profile 모드를 지정하면 WorkflowEngine.start 가 해당 실행을 프로파일러로
+감싸 실행하고, 결과를 run_id 로 ProfileStore 에 보관합니다.
+운영 중 특정 워크플로우만 재배포 없이 프로파일링하기 위한 기능으로,
+PROFILING_ENABLED 설정이 켜져 있어야 사용할 수 있습니다.
+
+- cpu: cProfile(결정적 프로파일러)로 함수별 호출 수/자체 시간/누적 시간을 측정합니다.
+  이벤트 루프 스레드 전체에 걸리므로 같은 시간에 처리된 다른 요청도 함께 집계되고,
+  스레드 풀에서 실행되는 노드 코드는 포함되지 않습니다. 동시에 하나의 실행만 가능합니다.
+- wall: 백그라운드 스레드가 interval 마다 실행 중인 코루틴의 스택을 샘플링합니다.
+  await 로 대기 중인 시간도 대기 지점의 스택(끝에 [await] 표시)으로 집계되므로
+  I/O 대기가 대부분인 실행에 적합합니다. 이벤트 루프가 다른 요청을 처리하느라
+  이 실행을 재개하지 못한 시간도 대기로 집계됩니다.
+  결과는 flamegraph / speedscope 에서 읽을 수 있는 folded 형식으로도 조회할 수 있습니다.
+"""
+
+import asyncio
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from types import FrameType
+from typing import Any, Dict, List
+
+PROFILE_MODE_CPU = "cpu"
+PROFILE_MODE_WALL = "wall"
+PROFILE_MODES = (PROFILE_MODE_CPU, PROFILE_MODE_WALL)
+
+# 대기 중인 샘플 표시
+AWAIT_MARKER = "[await]"
+
+
+class ProfilingError(Exception):
+    """프로파일링을 시작할 수 없음"""
+
+
+class ProfilingDisabledError(ProfilingError):
+    """설정에서 프로파일링이 비활성화됨"""
+
+
+class ProfilerBusyError(ProfilingError):
+    """다른 실행이 cpu 모드로 프로파일링 중"""
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class RunProfiler(ABC):
+    """실행 1회 프로파일러 인터페이스
+
+    reserve/release 는 확보할 자원이 없는 프로파일러를 위해 아무것도 하지 않는
+    기본 구현을 두며, 필요한 프로파일러만 재정의합니다.
+    """
+
+    mode = ""
+
+    def reserve(self):
+        """프로파일링에 필요한 자원 확보 (create_profiler 에서 실행 등록 전에 호출)"""
+        pass
+
+    def release(self):
+        """reserve 로 확보한 자원 반환 (실행 요청이 끝나면 항상 호출)"""
+        pass
+
+    @abstractmethod
+    def start(self):
+        """프로파일 시작 (WorkflowEngine.start 에서 직접 호출)"""
+        pass
+
+    @abstractmethod
+    def stop(self) -> Dict[str, Any]:
+        """프로파일 종료 후 결과 반환"""
+        pass
+
+
+# cProfile 은 스레드당 하나만 동작하므로 cpu 모드 실행은 한 번에 하나로 제한
+_cpu_profile_lock = threading.Lock()
+
+
+class CpuProfiler(RunProfiler):
+    """cProfile 기반 결정적 프로파일러"""
+
+    mode = PROFILE_MODE_CPU
+
+    def __init__(self, top_n: int = 50):
+        self.top_n = top_n
+        self._profile: cProfile.Profile | None = None
+        self._started = 0.0
+        self._reserved = False
+
+    def reserve(self):
+        if not _cpu_profile_lock.acquire(blocking=False):
+            raise ProfilerBusyError("다른 실행이 cpu 모드로 프로파일링 중입니다")
+        self._reserved = True
+
+    def release(self):
+        if self._reserved:
+            self._reserved = False
+            _cpu_profile_lock.release()
+
+    def start(self):
+        self._profile = cProfile.Profile()
+        self._started = time.perf_counter()
+        self._profile.enable()
+
+    def stop(self) -> Dict[str, Any]:
+        self._profile.disable()
+        duration = time.perf_counter() - self._started
+
+        stats = pstats.Stats(self._profile)
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+        return {
+            "mode": self.mode,
+            "duration": duration,
+            "total_calls": stats.total_calls,
+            "functions": [
+                {
+                    "function": f"{name} ({os.path.basename(filename)}:{lineno})",
+                    "calls": calls,
+                    "primitive_calls": primitive_calls,
+                    "self_time": self_time,
+                    "cumulative_time": cumulative_time,
+                }
+                for (filename, lineno, name), (
+                    primitive_calls,
+                    calls,
+                    self_time,
+                    cumulative_time,
+                    _callers,
+                ) in rows[: self.top_n]
+            ],
+        }
+
+
+class WallClockProfiler(RunProfiler):
+    """코루틴 스택 샘플링 프로파일러 (대기 시간 포함)"""
+
+    mode = PROFILE_MODE_WALL
+
+    def __init__(self, interval: float = 0.005, top_n: int = 200):
+        self.interval = interval
+        self.top_n = top_n
+        self.samples: Counter[str] = Counter()
+        self._task: asyncio.Task | None = None
+        self._root: FrameType | None = None
+        self._loop_thread = 0
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started = 0.0
+
+    def start(self):
+        self._task = asyncio.current_task()
+        # start() 를 호출한 프레임(WorkflowEngine.start)부터 스택을 기록
+        self._root = sys._getframe(1)
+        self._loop_thread = threading.get_ident()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._sample_loop, name="run-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> Dict[str, Any]:
+        self._stopped.set()
+        self._thread.join()
+        duration = time.perf_counter() - self._started
+        total = sum(self.samples.values())
+        return {
+            "mode": self.mode,
+            "duration": duration,
+            "interval": self.interval,
+            "samples": total,
+            "stacks": [
+                {"stack": stack, "count": count}
+                for stack, count in self.samples.most_common(self.top_n)
+            ],
+        }
+
+    def _sample_loop(self):
+        while not self._stopped.wait(self.interval):
+            stack = self._sample(sys._current_frames())
+            if stack:
+                self.samples[";".join(stack)] += 1
+
+    def _sample(self, frames: Dict[int, FrameType]) -> List[str]:
+        stack = self._running_stack(frames.get(self._loop_thread))
+        if stack is not None:
+            return stack
+        stack = self._awaiting_stack()
+        stack.append(AWAIT_MARKER)
+        return stack
+
+    def _running_stack(self, frame: FrameType | None) -> List[str] | None:
+        """이벤트 루프 스레드가 이 실행을 처리 중이면 루트부터의 스택 반환"""
+        stack = []
+        while frame is not None:
+            stack.append(_frame_label(frame))
+            if frame is self._root:
+                stack.reverse()
+                return stack
+            frame = frame.f_back
+        return None
+
+    def _awaiting_stack(self) -> List[str]:
+        """대기 중인 코루틴 체인을 따라가며 루트부터 대기 지점까지의 스택 반환"""
+        stack: List[str] = []
+        awaitable: Any = self._task.get_coro() if self._task else None
+        recording = False
+        while awaitable is not None:
+            frame = getattr(awaitable, "cr_frame", None) or getattr(
+                awaitable, "gi_frame", None
+            )
+            if frame is None:
+                # Future 등 프레임이 없는 대기 대상
+                if recording:
+                    stack.append("<Future>")
+                break
+            recording = recording or frame is self._root
+            if recording:
+                stack.append(_frame_label(frame))
+            awaitable = getattr(awaitable, "cr_await", None) or getattr(
+                awaitable, "gi_yieldfrom", None
+            )
+        return stack
+
+
+def to_folded(profile: Dict[str, Any]) -> str:
+    """wall 프로파일을 folded 형식(스택;스택 샘플수)으로 변환"""
+    return "".join(f"{row['stack']} {row['count']}\n" for row in profile["stacks"])
+
+
+def create_profiler(mode: str) -> RunProfiler:
+    """설정을 확인하고 모드에 맞는 프로파일러를 생성해 자원 확보
+
+    다른 실행이 cpu 모드로 프로파일링 중이면 실행을 등록하기 전에 ProfilerBusyError 를
+    발생시킵니다. 호출 측은 실행이 끝나면 release() 를 호출해야 합니다.
+    """
+    from setting.config import get_config
+
+    config = get_config()
+    if not config.PROFILING_ENABLED:
+        raise ProfilingDisabledError("프로파일링이 비활성화되어 있습니다")
+    if mode == PROFILE_MODE_CPU:
+        profiler: RunProfiler = CpuProfiler(top_n=config.PROFILING_TOP_N)
+    elif mode == PROFILE_MODE_WALL:
+        profiler = WallClockProfiler(interval=config.PROFILING_SAMPLE_INTERVAL)
+    else:
+        raise ValueError(f"지원하지 않는 프로파일 모드: {mode}")
+    profiler.reserve()
+    return profiler
+
+
+class ProfileStore:
+    """run_id 별 프로파일 결과 (최근 max_profiles 개 보관)"""
+
+    def __init__(self, max_profiles: int = 100):
+        self.max_profiles = max_profiles
+        self._profiles: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+
+    def put(self, run_id: str, profile: Dict[str, Any]):
+        self._profiles[run_id] = profile
+        while len(self._profiles) > self.max_profiles:
+            self._profiles.popitem(last=False)
+
+    def get(self, run_id: str) -> Dict[str, Any] | None:
+        return self._profiles.get(run_id)
+
+
+_profile_store: ProfileStore | None = None
+
+
+def get_profile_store() -> ProfileStore:
+    """설정값 기반 전역 프로파일 저장소"""
+    global _profile_store
+    if _profile_store is None:
+        from setting.config import get_config
+
+        _profile_store = ProfileStore(max_profiles=get_config().PROFILING_MAX_PROFILES)
+    return _profile_store
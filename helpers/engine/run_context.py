@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Protocol
+
+
+@dataclass(slots=True)
+class NodeTiming:
+    """노드 실행 단계별 소요 시간(초, 단조 시계) 과 입출력 크기"""
+
+    queue_wait: float = 0.0  # 실행 가능해진 뒤 실행 시작까지 대기
+    input_collection: float = 0.0
+    validation: float = 0.0
+    execution: float = 0.0
+    result_handling: float = 0.0
+    total: float = 0.0  # 대기 시간을 제외한 노드 처리 시간
+    input_bytes: int | None = None  # JSON 직렬화 기준
+    output_bytes: int | None = None
+    executor: str = "inline"
+
+
+@dataclass(slots=True)
+class NodeRunState:
+    """실행 단위의 노드 상태"""
+
+    status: str = "pending"  # pending, running, completed, failed
+    result: Any = None
+    error: str | None = None
+    inputs: Any = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    timing: NodeTiming | None = None
+
+
+class RunStateListener(Protocol):
+    """노드 상태 변경을 통지받는 객체 (실행 상태 저장소)"""
+
+    def node_changed(self, run_id: str, node_id: str, state: NodeRunState): ...
+
+
+class RunContext:
+    """워크플로우 1회 실행의 상태
+
+    노드 인스턴스는 그래프 정의만 보관하고, 실행마다 달라지는 상태
+    (노드 상태/결과, 노드 간 전달 데이터)는 모두 이 객체에 저장합니다.
+    """
+
+    __slots__ = (
+        "execution_context",
+        "node_states",
+        "is_first_execution",
+        "run_id",
+        "listener",
+    )
+
+    def __init__(self):
+        self.execution_context: Dict[str, Any] = {}
+        self.node_states: Dict[str, NodeRunState] = {}
+        self.is_first_execution: bool = True
+        self.run_id: str | None = None
+        self.listener: RunStateListener | None = None
+
+    def get_node_state(self, node_id: str) -> NodeRunState:
+        """노드 상태 조회 (실행 전 노드는 pending)"""
+        state = self.node_states.get(node_id)
+        if state is None:
+            state = self.node_states[node_id] = NodeRunState()
+        return state
+
+    def set_status(self, node_id: str, status: str):
+        """상태 설정"""
+        state = self.get_node_state(node_id)
+        state.status = status
+        if status == "running":
+            state.started_at = datetime.now(timezone.utc)
+        self._notify(node_id, state)
+
+    def set_inputs(self, node_id: str, inputs: Any):
+        """노드에 전달된 입력 기록 (실행 이력용)"""
+        self.get_node_state(node_id).inputs = inputs
+
+    def set_timing(self, node_id: str, timing: NodeTiming):
+        """단계별 소요 시간 기록 (set_result/set_error 전에 호출)"""
+        self.get_node_state(node_id).timing = timing
+
+    def set_result(self, node_id: str, result: Any):
+        """결과 설정"""
+        state = self.get_node_state(node_id)
+        state.result = result
+        state.status = "completed"
+        state.finished_at = datetime.now(timezone.utc)
+        self._notify(node_id, state)
+
+    def set_error(self, node_id: str, error: str):
+        """에러 설정"""
+        state = self.get_node_state(node_id)
+        state.error = error
+        state.status = "failed"
+        state.finished_at = datetime.now(timezone.utc)
+        self._notify(node_id, state)
+
+    def _notify(self, node_id: str, state: NodeRunState):
+        if self.listener is not None:
+            self.listener.node_changed(self.run_id, node_id, state)
@@ -0,0 +1,207 @@
+"""
+워크플로우 실행 상태 저장소
+
+실행(run) 마다 run_id 를 발급하고, 엔진이 노드 상태를 바꿀 때마다
+RunContext 의 리스너로 통지받아 상태를 갱신합니다. 상태 조회 API 는
+그래프를 다시 로드하거나 엔진을 만들지 않고 이 저장소를 조회만 합니다.
+
+- RunRecord.node_states 는 실행 중인 RunContext 의 node_states 와 같은 dict 를
+  공유하므로 노드 상태 변경이 별도 복사 없이 바로 조회에 반영됩니다.
+- InMemoryRunStateStore 는 프로세스 메모리에 최근 max_runs 개의 실행을 보관하며,
+  가득 차면 끝난 실행 중 가장 오래된 것부터 제거합니다.
+- 여러 워커에서 조회하거나 재시작 후에도 조회해야 한다면 DB 를 함께 쓰는
+  구현으로 교체합니다 (조회 메서드가 async 인 이유).
+"""
+
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from dto.workflow.workflow_dto import WorkflowExecutionResult
+from helpers.engine.run_context import NodeRunState, RunContext
+
+RUN_RUNNING = "running"
+RUN_COMPLETED = "completed"
+RUN_FAILED = "failed"
+
+
+@dataclass(slots=True)
+class RunRecord:
+    """워크플로우 1회 실행 기록"""
+
+    run_id: str
+    graph_id: int
+    node_types: Dict[str, str]
+    node_states: Dict[str, NodeRunState]
+    status: str = RUN_RUNNING
+    inputs: Dict[str, Any] | None = None
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: datetime | None = None
+    execution_time: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status != RUN_RUNNING
+
+    def to_dict(self, include_results: bool = False) -> Dict[str, Any]:
+        """상태 조회 응답 형식으로 변환"""
+        return {
+            "run_id": self.run_id,
+            "graph_id": self.graph_id,
+            "status": self.status,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "execution_time": self.execution_time,
+            "errors": self.errors,
+            "total_nodes": len(self.node_types),
+            "node_statuses": {
+                node_id: _node_state_dict(state, include_results)
+                for node_id, state in list(self.node_states.items())
+            },
+        }
+
+
+def _node_state_dict(state: NodeRunState, include_result: bool) -> Dict[str, Any]:
+    data = {
+        "status": state.status,
+        "error": state.error,
+        "timing": asdict(state.timing) if state.timing else None,
+    }
+    if include_result:
+        data["result"] = state.result
+    return data
+
+
+class RunStateStore(ABC):
+    """실행 상태 저장소 인터페이스"""
+
+    @abstractmethod
+    def start_run(
+        self,
+        graph_id: int,
+        run_context: RunContext,
+        node_types: Dict[str, str],
+        inputs: Dict[str, Any] | None = None,
+    ) -> RunRecord:
+        """실행 등록 - run_context 에 run_id 와 리스너를 연결"""
+        pass
+
+    @abstractmethod
+    def node_changed(self, run_id: str, node_id: str, state: NodeRunState):
+        """노드 상태 변경 통지 (RunContext 리스너)"""
+        pass
+
+    @abstractmethod
+    def finish_run(self, run_id: str, result: WorkflowExecutionResult):
+        """실행 종료 기록"""
+        pass
+
+    @abstractmethod
+    async def get_run(self, run_id: str) -> RunRecord | None:
+        """실행 기록 조회"""
+        pass
+
+    @abstractmethod
+    async def get_latest_run(self, graph_id: int) -> RunRecord | None:
+        """그래프의 마지막 실행 기록 조회"""
+        pass
+
+
+class InMemoryRunStateStore(RunStateStore):
+    """프로세스 메모리 실행 상태 저장소"""
+
+    def __init__(self, max_runs: int = 1000):
+        self.max_runs = max_runs
+        self._runs: OrderedDict[str, RunRecord] = OrderedDict()
+        self._latest_by_graph: Dict[int, str] = {}
+
+    def start_run(
+        self,
+        graph_id: int,
+        run_context: RunContext,
+        node_types: Dict[str, str],
+        inputs: Dict[str, Any] | None = None,
+    ) -> RunRecord:
+        run_id = uuid.uuid4().hex
+        # 실행 전 노드도 pending 으로 조회되도록 미리 상태를 만들어 둠
+        for node_id in node_types:
+            run_context.get_node_state(node_id)
+        record = RunRecord(
+            run_id=run_id,
+            graph_id=graph_id,
+            node_types=dict(node_types),
+            node_states=run_context.node_states,
+            inputs=inputs,
+        )
+        run_context.run_id = run_id
+        run_context.listener = self
+
+        self._runs[run_id] = record
+        self._latest_by_graph[graph_id] = run_id
+        self._evict()
+        return record
+
+    def node_changed(self, run_id: str, node_id: str, state: NodeRunState):
+        # node_states 를 공유하므로 메모리 저장소는 추가로 할 일이 없음
+        pass
+
+    def finish_run(self, run_id: str, result: WorkflowExecutionResult):
+        record = self._runs.get(run_id)
+        if record is None:
+            return
+        record.status = RUN_COMPLETED if result.success else RUN_FAILED
+        record.finished_at = datetime.now(timezone.utc)
+        record.execution_time = result.execution_time or 0.0
+        record.errors = list(result.errors)
+
+    async def get_run(self, run_id: str) -> RunRecord | None:
+        return self._runs.get(run_id)
+
+    async def get_latest_run(self, graph_id: int) -> RunRecord | None:
+        run_id = self._latest_by_graph.get(graph_id)
+        return self._runs.get(run_id) if run_id else None
+
+    def _evict(self):
+        """보관 개수를 넘으면 끝난 실행부터 오래된 순으로 제거"""
+        if len(self._runs) <= self.max_runs:
+            return
+        for run_id in [
+            run_id for run_id, record in self._runs.items() if record.is_finished
+        ]:
+            self._remove(run_id)
+            if len(self._runs) <= self.max_runs:
+                return
+
+    def _remove(self, run_id: str):
+        record = self._runs.pop(run_id)
+        if self._latest_by_graph.get(record.graph_id) == run_id:
+            del self._latest_by_graph[record.graph_id]
+
+    def clear(self):
+        self._runs.clear()
+        self._latest_by_graph.clear()
+
+
+_run_state_store: RunStateStore | None = None
+
+
+def set_run_state_store(store: RunStateStore):
+    """전역 실행 상태 저장소 교체 (앱 시작 시 DB 백업 저장소 등록)"""
+    global _run_state_store
+    _run_state_store = store
+
+
+def get_run_state_store() -> RunStateStore:
+    """설정값 기반 전역 실행 상태 저장소"""
+    global _run_state_store
+    if _run_state_store is None:
+        from setting.config import get_config
+
+        _run_state_store = InMemoryRunStateStore(
+            max_runs=get_config().RUN_STATE_MAX_RUNS
+        )
+    return _run_state_store
@@ -1,37 +1,125 @@
+import asyncio
+import time
 from collections import defaultdict, deque
+from dataclasses import asdict
 from datetime import datetime
 from typing import Any, Dict, List, Set
 
 from database.graph.edge import Edge
 from database.graph.vertex import Vertex
 from dto.workflow.workflow_dto import WorkflowExecutionResult
+from helpers.engine.execution_plan import ExecutionPlan
+from helpers.engine.profiler import RunProfiler
+from helpers.engine.run_context import NodeTiming, RunContext
 from helpers.node.factory import NodeFactory
-from helpers.node.node_base import BaseNode, NodeType
+from helpers.node.node_base import BaseNode
+from helpers.utils.blob_store import get_blob_store, is_blob_ref
+from helpers.utils.json_response import dumps
+from helpers.utils.metrics import REGISTRY
+from helpers.utils.tracing import get_tracer
+from setting.config import get_config
 from setting.logger import get_logger
 
 logger = get_logger(__name__)
 
+WORKFLOW_RUNS = REGISTRY.counter(
+    "workflow_runs_total", "워크플로우 실행 수 (결과별)", ("status",)
+)
+WORKFLOW_RUNS_IN_PROGRESS = REGISTRY.gauge(
+    "workflow_runs_in_progress", "실행 중인 워크플로우 수"
+)
+WORKFLOW_RUN_DURATION = REGISTRY.histogram(
+    "workflow_run_duration_seconds", "워크플로우 실행 시간"
+)
+NODE_EXECUTIONS = REGISTRY.counter(
+    "workflow_node_executions_total",
+    "노드 실행 수 (노드 타입, 결과별)",
+    ("node_type", "status"),
+)
+NODE_ERRORS = REGISTRY.counter(
+    "workflow_node_errors_total", "노드 실행 실패 수", ("node_type",)
+)
+NODE_DURATION = REGISTRY.histogram(
+    "workflow_node_duration_seconds",
+    "노드 처리 시간 (대기 시간 제외)",
+    ("node_type",),
+)
+NODE_QUEUE_WAIT = REGISTRY.histogram(
+    "workflow_node_queue_wait_seconds",
+    "노드가 실행 가능해진 뒤 실행 시작까지 대기 시간",
+    ("node_type",),
+)
+
+
+def _lap(timing: NodeTiming, phase: str, mark: float) -> float:
+    """직전 시점부터 현재까지를 phase 소요 시간으로 기록하고 현재 시점 반환"""
+    now = time.perf_counter()
+    setattr(timing, phase, now - mark)
+    return now
+
+
+def _record_node_metrics(node_type: str, status: str, timing: NodeTiming):
+    NODE_EXECUTIONS.labels(node_type, status).inc()
+    NODE_DURATION.labels(node_type).observe(timing.total)
+    NODE_QUEUE_WAIT.labels(node_type).observe(timing.queue_wait)
+    if status == "failed":
+        NODE_ERRORS.labels(node_type).inc()
+
+
+def _payload_size(value: Any) -> int | None:
+    """JSON 직렬화 크기 (직렬화할 수 없으면 None)"""
+    try:
+        return len(dumps(value))
+    except Exception:
+        return None
+
 
 class WorkflowEngine:
     """워크플로우 실행 엔진"""
 
-    def __init__(self):
+    def __init__(self, record_payload_sizes: bool | None = None):
+        if record_payload_sizes is None:
+            record_payload_sizes = get_config().NODE_PAYLOAD_SIZES_ENABLED
+        # 노드 입출력 JSON 크기 기록 여부 (출력마다 한 번 직렬화)
+        self.record_payload_sizes = record_payload_sizes
         self.node_instances: Dict[str, BaseNode] = {}
-        self.execution_context: Dict[str, Any] = {}
+        self.node_types: Dict[str, str] = {}
         self.dependencies: Dict[str, Set[str]] = defaultdict(set)
         self.reverse_dependencies: Dict[str, Set[str]] = defaultdict(set)
-        self.is_first_execution: bool = True
-
-    async def load(self, vertices: List[Vertex], edges: List[Edge]) -> bool:
-        """데이터베이스에서 워크플로우 로드"""
+        self.execution_plan: ExecutionPlan | None = None
+        self.run_context = RunContext()
+
+    async def load(
+        self,
+        vertices: List[Vertex],
+        edges: List[Edge],
+        plan: ExecutionPlan | None = None,
+    ) -> bool:
+        """데이터베이스에서 워크플로우 로드
+
+        저장 시 컴파일된 실행 계획(plan)을 넘기면 의존성 그래프와 실행 순서를
+        계획에서 그대로 가져옵니다.
+        """
         try:
             # 노드 인스턴스 생성
             for vertex in vertices:
-                node_type = NodeType(vertex.type)
                 node_instance = NodeFactory.create_node(
-                    node_type, str(vertex.id), vertex.properties
+                    vertex.type, str(vertex.id), vertex.properties
                 )
                 self.node_instances[str(vertex.id)] = node_instance
+                self.node_types[str(vertex.id)] = vertex.type
+
+            if plan is not None:
+                self.execution_plan = plan
+                for node_id, sources in plan.dependencies.items():
+                    self.dependencies[node_id].update(sources)
+                for node_id, targets in plan.adjacency.items():
+                    self.reverse_dependencies[node_id].update(targets)
+                logger.info(
+                    f"워크플로우 로드 완료: {len(self.node_instances)}개 노드, "
+                    f"{plan.edge_count}개 엣지 (컴파일된 실행 계획)"
+                )
+                return True
 
             # 의존성 그래프 구성
             for edge in edges:
@@ -51,7 +139,10 @@ class WorkflowEngine:
             return False
 
     def _topological_sort(self) -> List[str]:
-        """위상 정렬로 실행 순서 결정"""
+        """위상 정렬로 실행 순서 결정 (컴파일된 실행 계획이 있으면 그 순서 사용)"""
+        if self.execution_plan is not None:
+            return list(self.execution_plan.order)
+
         in_degree = defaultdict(int)  # 자동으로 0으로 초기화
 
         # 각 노드의 진입 차수 계산
@@ -83,47 +174,141 @@ class WorkflowEngine:
     def _collect_node_inputs(self, node_id: str) -> Dict[str, Any]:
         """노드의 입력 데이터 수집"""
         inputs = {}
+        execution_context = self.run_context.execution_context
 
-        if self.is_first_execution:
-            return self.execution_context
+        if self.run_context.is_first_execution:
+            # 실행 컨텍스트는 이후 노드 결과가 추가되므로 복사해서 전달
+            return dict(execution_context)
 
         # 의존성 노드들의 출력을 입력으로 수집
         for dependency_id in self.dependencies[node_id]:
-            if dependency_id in self.execution_context:
-                dependency_outputs = self.execution_context[dependency_id]
+            if dependency_id in execution_context:
+                dependency_outputs = execution_context[dependency_id]
                 inputs.update(dependency_outputs)
 
         return inputs
 
-    async def _execute_node(self, node_id: str) -> Dict[str, Any]:
-        """단일 노드 실행"""
+    @staticmethod
+    def _resolve_blob_refs(node: BaseNode, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """blob 참조 입력을 내용으로 복원 (참조를 직접 다루는 노드는 그대로 전달)
+
+        복원한 값은 이 노드 실행 동안만 유지되고 실행 컨텍스트에는 참조가 남습니다.
+        """
+        if node.accepts_blob_refs:
+            return inputs
+        resolved = None
+        for key, value in inputs.items():
+            if is_blob_ref(value):
+                if resolved is None:
+                    resolved = dict(inputs)
+                resolved[key] = get_blob_store().load(value)
+        return inputs if resolved is None else resolved
+
+    @staticmethod
+    def _has_large_outputs(result: Dict[str, Any]) -> bool:
+        """blob 저장소로 옮길 출력 값이 있는지 여부"""
+        if not isinstance(result, dict):
+            return False
+        store = get_blob_store()
+        return any(store.should_offload(value) for value in result.values())
+
+    @staticmethod
+    def _offload_outputs(result: Dict[str, Any]) -> Dict[str, Any]:
+        """임계값보다 큰 출력 값을 blob 저장소에 저장하고 참조로 교체"""
+        store = get_blob_store()
+        if store.inline_threshold <= 0 or not isinstance(result, dict):
+            return result
+        offloaded = None
+        for key, value in result.items():
+            stored = store.offload(value)
+            if stored is not value:
+                if offloaded is None:
+                    offloaded = dict(result)
+                offloaded[key] = stored
+        return result if offloaded is None else offloaded
+
+    async def _execute_node(
+        self, node_id: str, ready_at: float | None = None
+    ) -> Dict[str, Any]:
+        """단일 노드 실행 (노드 span 안에서 실행)"""
+        node_type = self._node_type(node_id)
+        with get_tracer().start_span(
+            f"node {node_type}",
+            {
+                "node.id": node_id,
+                "node.type": node_type,
+                "node.executor": self.node_instances[node_id].executor_type,
+            },
+        ) as span:
+            try:
+                return await self._run_node(node_id, ready_at)
+            finally:
+                timing = self.run_context.get_node_state(node_id).timing
+                if timing is not None:
+                    span.set_attributes(
+                        {
+                            f"timing.{key}": value
+                            for key, value in asdict(timing).items()
+                            if value is not None
+                        }
+                    )
+
+    async def _run_node(self, node_id: str, ready_at: float | None) -> Dict[str, Any]:
+        """단일 노드 실행
+
+        ready_at 은 노드가 실행 가능해진 시점 (perf_counter 기준) 으로,
+        실행 시작까지의 대기 시간(queue_wait) 계산에 사용합니다.
+        """
         node = self.node_instances[node_id]
+        run_context = self.run_context
+        timing = NodeTiming(executor=node.executor_type)
+        inputs = None
+        result = None
+
+        started = time.perf_counter()
+        if ready_at is not None:
+            timing.queue_wait = started - ready_at
+        mark = started
 
         try:
             # 노드 상태를 running으로 설정
-            node.set_status("running")
+            run_context.set_status(node_id, "running")
 
-            # 입력 데이터 수집
+            # 입력 데이터 수집 (실행 상태에는 blob 참조 그대로 기록)
             inputs = self._collect_node_inputs(node_id)
+            run_context.set_inputs(node_id, inputs)
+            node_inputs = self._resolve_blob_refs(node, inputs)
+            mark = _lap(timing, "input_collection", mark)
 
             # 입력 검증
-            if not node.validate_inputs(inputs):
+            if not node.validate_inputs(node_inputs):
                 raise ValueError(f"노드 {node_id}의 입력 검증 실패")
+            mark = _lap(timing, "validation", mark)
 
             # 노드 실행
             logger.info(f"노드 {node_id} 실행 시작")
-            result = node.execute(inputs)
+            result = await node.execute_async(node_inputs)
+            mark = _lap(timing, "execution", mark)
 
-            # 결과 저장
-            node.set_result(result)
+            # 큰 출력은 blob 저장소에 두고 다음 노드와 응답에는 참조만 전달
+            # (크기 확인은 루프에서 하고, 파일 쓰기가 필요할 때만 스레드에서 실행)
+            if self._has_large_outputs(result):
+                result = await asyncio.to_thread(self._offload_outputs, result)
 
             # 현재 노드의 output을 다음 노드의 input으로 사용하기 위한 result 세팅
-            self.execution_context[node_id] = result
+            run_context.execution_context[node_id] = result
 
             # TODO: 노드 체이닝 input/ouput 인터페이스 체크. 다음 노드의 input field 체크 및 parameter 자동 매핑 위한 모듈 구현..?
             # 다음 노드의 input field를 맞춰줄 땐 조건 체크해야 함. 모든 노드의 조건 체크해아하나?
-            if self.is_first_execution:
-                self.is_first_execution = False
+            if run_context.is_first_execution:
+                run_context.is_first_execution = False
+            mark = _lap(timing, "result_handling", mark)
+
+            # 결과 저장 (단계별 시간을 먼저 기록해야 상태 저장소에 함께 전달됨)
+            self._finish_timing(node_id, timing, started, mark, inputs, result)
+            run_context.set_timing(node_id, timing)
+            run_context.set_result(node_id, result)
+            _record_node_metrics(self._node_type(node_id), "completed", timing)
 
             logger.info(f"노드 {node_id} 실행 완료")
             return result
@@ -131,20 +316,108 @@ class WorkflowEngine:
         except Exception as e:
             error_msg = f"노드 {node_id} 실행 실패: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            node.set_error(error_msg)
+            self._finish_timing(
+                node_id, timing, started, time.perf_counter(), inputs, result
+            )
+            run_context.set_timing(node_id, timing)
+            run_context.set_error(node_id, error_msg)
+            _record_node_metrics(self._node_type(node_id), "failed", timing)
             raise
 
+    def _finish_timing(
+        self,
+        node_id: str,
+        timing: NodeTiming,
+        started: float,
+        finished: float,
+        inputs: Dict[str, Any] | None,
+        result: Dict[str, Any] | None,
+    ):
+        """처리 시간 합계와 입출력 크기 기록 (크기 계산은 단계 시간에 포함하지 않음)"""
+        timing.total = finished - started
+        if not self.record_payload_sizes:
+            return
+        if inputs is not None:
+            timing.input_bytes = self._input_bytes(node_id, inputs)
+        if result is not None:
+            timing.output_bytes = _payload_size(result)
+
+    def _input_bytes(self, node_id: str, inputs: Dict[str, Any]) -> int | None:
+        """입력 크기 (앞 노드가 있으면 다시 직렬화하지 않고 앞 노드 출력 크기의 합)
+
+        입력은 앞 노드 출력을 합친 것이므로 키가 겹치면 실제 크기보다 클 수 있습니다.
+        """
+        dependencies = self.dependencies.get(node_id)
+        if not dependencies:
+            return _payload_size(inputs)
+        total = 0
+        for dependency_id in dependencies:
+            timing = self.run_context.get_node_state(dependency_id).timing
+            if timing is None or timing.output_bytes is None:
+                return None
+            total += timing.output_bytes
+        return total
+
+    def _node_type(self, node_id: str) -> str:
+        return (
+            self.node_types.get(node_id) or type(self.node_instances[node_id]).__name__
+        )
+
     async def start(
-        self, initial_inputs: Dict[str, Any] | None = None
+        self,
+        initial_inputs: Dict[str, Any] | None = None,
+        run_context: RunContext | None = None,
+        profiler: RunProfiler | None = None,
+    ) -> WorkflowExecutionResult:
+        """워크플로우 실행
+
+        run_context 를 넘기면 해당 컨텍스트로 실행합니다 (실행 상태 저장소에
+        등록된 컨텍스트를 사용해 노드 상태 변경을 통지할 때).
+        profiler 를 넘기면 실행 구간을 프로파일링해 결과의 profile 에 담습니다.
+        """
+        WORKFLOW_RUNS_IN_PROGRESS.inc()
+        try:
+            with get_tracer().start_span(
+                "workflow.run", {"workflow.nodes": len(self.node_instances)}
+            ) as span:
+                if run_context is not None and run_context.run_id:
+                    span.set_attribute("workflow.run_id", run_context.run_id)
+                if profiler is None:
+                    result = await self._run(initial_inputs, run_context)
+                else:
+                    profiler.start()
+                    try:
+                        result = await self._run(initial_inputs, run_context)
+                    finally:
+                        profile = profiler.stop()
+                    result.profile = profile
+                    span.set_attribute("workflow.profile", profiler.mode)
+                span.set_attribute("workflow.success", result.success)
+                if not result.success:
+                    span.status = "error"
+                    span.status_message = "; ".join(result.errors)
+        finally:
+            WORKFLOW_RUNS_IN_PROGRESS.dec()
+        WORKFLOW_RUNS.labels("completed" if result.success else "failed").inc()
+        WORKFLOW_RUN_DURATION.observe(result.execution_time or 0.0)
+        return result
+
+    async def _run(
+        self,
+        initial_inputs: Dict[str, Any] | None,
+        run_context: RunContext | None,
     ) -> WorkflowExecutionResult:
-        """워크플로우 실행"""
+        if run_context is not None:
+            self.run_context = run_context
         result = WorkflowExecutionResult()
         result.start_time = datetime.now()
+        # 소요 시간은 시스템 시각 변경의 영향을 받지 않는 단조 시계로 측정
+        started = time.perf_counter()
 
         try:
             # 초기 입력 설정
             if initial_inputs:
-                self.execution_context.update(initial_inputs)
+                self.run_context.execution_context.update(initial_inputs)
 
             # 실행 순서 결정
             execution_order = self._topological_sort()
@@ -153,20 +426,29 @@ class WorkflowEngine:
             logger.info(f"워크플로우 실행 시작: {len(execution_order)}개 노드")
 
             # 순차적으로 노드 실행
+            # 노드는 모든 의존 노드가 끝난 시점(루트 노드는 실행 시작 시점)에 실행 가능
+            finished_at: Dict[str, float] = {}
             for node_id in execution_order:
+                ready_at = max(
+                    (finished_at[dep] for dep in self.dependencies[node_id]),
+                    default=started,
+                )
                 try:
-                    node_result = await self._execute_node(node_id)
+                    node_result = await self._execute_node(node_id, ready_at)
                     result.node_results[node_id] = node_result
                 except Exception as e:
                     result.errors.append(str(e))
                     # 에러 발생 시 워크플로우 중단
                     break
+                finally:
+                    finished_at[node_id] = time.perf_counter()
+                    timing = self.run_context.get_node_state(node_id).timing
+                    if timing is not None:
+                        result.node_timings[node_id] = timing
 
             # 실행 완료
             result.end_time = datetime.now()
-            result.execution_time = (
-                result.end_time - result.start_time
-            ).total_seconds()
+            result.execution_time = time.perf_counter() - started
             result.success = len(result.errors) == 0
 
             if result.success:
@@ -178,9 +460,7 @@ class WorkflowEngine:
 
         except Exception as e:
             result.end_time = datetime.now()
-            result.execution_time = (
-                result.end_time - result.start_time
-            ).total_seconds()
+            result.execution_time = time.perf_counter() - started
             result.errors.append(f"워크플로우 실행 중 예상치 못한 오류: {str(e)}")
             logger.error(f"워크플로우 실행 중 오류: {str(e)}", exc_info=True)
 
@@ -192,16 +472,17 @@ class WorkflowEngine:
             return {"error": "노드를 찾을 수 없습니다"}
 
         node = self.node_instances[node_id]
+        state = self.run_context.get_node_state(node_id)
         return {
             "node_id": node_id,
-            "status": node.status,
-            "result": node.result,
-            "error": node.error,
+            "status": state.status,
+            "result": state.result,
+            "error": state.error,
             "inputs": [
-                input_schema.__dict__ for input_schema in node.get_input_schema()
+                asdict(input_schema) for input_schema in node.get_input_schema()
             ],
             "outputs": [
-                output_schema.__dict__ for output_schema in node.get_output_schema()
+                asdict(output_schema) for output_schema in node.get_output_schema()
             ],
         }
 
@@ -214,14 +495,10 @@ class WorkflowEngine:
         return {
             "total_nodes": len(self.node_instances),
             "node_statuses": node_statuses,
-            "execution_context": self.execution_context,
+            "execution_context": self.run_context.execution_context,
         }
 
     def reset_workflow(self):
         """워크플로우 상태 초기화"""
-        self.execution_context.clear()
-        for node in self.node_instances.values():
-            node.status = "pending"
-            node.result = None
-            node.error = None
+        self.run_context = RunContext()
         logger.info("워크플로우 상태 초기화 완료")
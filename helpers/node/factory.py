@@ -1,48 +1,109 @@
 # 노드 팩토리
-from typing import Any, Dict
+import importlib
+from importlib.metadata import entry_points
+from typing import Any, Dict, List
 
 from helpers.node.node_base import BaseNode, NodeType
-from helpers.node.node_templates.condition import ConditionNode
-from helpers.node.node_templates.function import FunctionNode
-from helpers.node.node_templates.llm import LLMNode
-from helpers.node.node_templates.text_input import TextInputNode
-from helpers.node.node_templates.utility_nodes import (  # MergeNode,
-    DelayNode,
-    JSONOutputNode,
-    SplitNode,
-    TextOutputNode,
-    WebhookNode,
-)
+from setting.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 외부 노드 패키지는 이 그룹의 entry point 로 노드 클래스를 노출
+# 예) [project.entry-points."workflow.nodes"]
+#     MY_NODE = "my_package.nodes:MyNode"
+NODE_ENTRY_POINT_GROUP = "workflow.nodes"
+
+_TEMPLATES = "helpers.node.node_templates"
 
 
 class NodeFactory:
-    """노드 생성 팩토리"""
-
-    _node_classes: dict[NodeType, type[BaseNode]] = {
-        NodeType.TEXT_INPUT: TextInputNode,
-        NodeType.TEXT_OUTPUT: TextOutputNode,
-        NodeType.JSON_OUTPUT: JSONOutputNode,
-        NodeType.LLM_NODE: LLMNode,
-        NodeType.CONDITION: ConditionNode,
-        NodeType.FUNCTION: FunctionNode,
-        NodeType.DELAY: DelayNode,
-        NodeType.WEBHOOK: WebhookNode,
-        # NodeType.MERGE: MergeNode,
-        NodeType.SPLIT: SplitNode,
+    """노드 생성 팩토리
+
+    노드 클래스는 "모듈:클래스" 경로로 등록되어 있다가 해당 타입이 처음 사용될 때
+    import 됩니다. 등록되지 않은 타입은 entry point 로 설치된 플러그인에서 찾습니다.
+    """
+
+    # 노드 타입 이름 -> 노드 클래스 또는 "모듈:클래스" 경로
+    _node_classes: dict[str, type[BaseNode] | str] = {
+        NodeType.TEXT_INPUT.value: f"{_TEMPLATES}.text_input:TextInputNode",
+        NodeType.TEXT_OUTPUT.value: f"{_TEMPLATES}.utility_nodes:TextOutputNode",
+        NodeType.JSON_OUTPUT.value: f"{_TEMPLATES}.utility_nodes:JSONOutputNode",
+        NodeType.FILE_INPUT.value: f"{_TEMPLATES}.file_nodes:FileInputNode",
+        NodeType.FILE_OUTPUT.value: f"{_TEMPLATES}.file_nodes:FileOutputNode",
+        NodeType.LLM_NODE.value: f"{_TEMPLATES}.llm:LLMNode",
+        NodeType.CONDITION.value: f"{_TEMPLATES}.condition:ConditionNode",
+        NodeType.FUNCTION.value: f"{_TEMPLATES}.function:FunctionNode",
+        NodeType.DELAY.value: f"{_TEMPLATES}.utility_nodes:DelayNode",
+        NodeType.WEBHOOK.value: f"{_TEMPLATES}.utility_nodes:WebhookNode",
+        # NodeType.MERGE.value: f"{_TEMPLATES}.utility_nodes:MergeNode",
+        NodeType.SPLIT.value: f"{_TEMPLATES}.utility_nodes:SplitNode",
     }
+    _entry_points_loaded: bool = False
 
     @classmethod
     def create_node(
-        cls, node_type: NodeType, node_id: str, properties: Dict[str, Any]
+        cls, node_type: NodeType | str, node_id: str, properties: Dict[str, Any]
     ) -> BaseNode:
         """노드 타입에 따라 적절한 노드 인스턴스 생성"""
-        if node_type not in cls._node_classes:
-            raise ValueError(f"지원하지 않는 노드 타입: {node_type}")
-
-        node_class = cls._node_classes[node_type]
+        node_class = cls.get_node_class(node_type)
         return node_class(node_id, properties)
 
     @classmethod
-    def register_node_type(cls, node_type: NodeType, node_class: type[BaseNode]):
-        """새로운 노드 타입 등록"""
-        cls._node_classes[node_type] = node_class
+    def get_node_class(cls, node_type: NodeType | str) -> type[BaseNode]:
+        """노드 타입 이름으로 노드 클래스 조회 (처음 조회 시 import)"""
+        type_name = _type_name(node_type)
+        node_class = cls._node_classes.get(type_name)
+        if node_class is None and not cls._entry_points_loaded:
+            cls.load_entry_points()
+            node_class = cls._node_classes.get(type_name)
+        if node_class is None:
+            raise ValueError(f"지원하지 않는 노드 타입: {type_name}")
+
+        if isinstance(node_class, str):
+            node_class = _import_node_class(node_class)
+            cls._node_classes[type_name] = node_class
+        return node_class
+
+    @classmethod
+    def register_node_type(
+        cls, node_type: NodeType | str, node_class: type[BaseNode] | str
+    ):
+        """새로운 노드 타입 등록 (클래스 또는 "모듈:클래스" 경로)"""
+        cls._node_classes[_type_name(node_type)] = node_class
+
+    @classmethod
+    def is_registered(cls, node_type: NodeType | str) -> bool:
+        if not cls._entry_points_loaded:
+            cls.load_entry_points()
+        return _type_name(node_type) in cls._node_classes
+
+    @classmethod
+    def get_node_types(cls) -> List[str]:
+        """등록된 모든 노드 타입 이름 (플러그인 포함)"""
+        if not cls._entry_points_loaded:
+            cls.load_entry_points()
+        return list(cls._node_classes)
+
+    @classmethod
+    def load_entry_points(cls):
+        """설치된 플러그인 패키지의 노드 타입 등록 (클래스 import 는 지연)"""
+        cls._entry_points_loaded = True
+        for entry_point in entry_points(group=NODE_ENTRY_POINT_GROUP):
+            # 직접 등록된 타입이 플러그인보다 우선
+            if entry_point.name in cls._node_classes:
+                continue
+            cls._node_classes[entry_point.name] = entry_point.value
+            logger.info(f"플러그인 노드 타입 등록: {entry_point.name}")
+
+
+def _type_name(node_type: NodeType | str) -> str:
+    return node_type.value if isinstance(node_type, NodeType) else str(node_type)
+
+
+def _import_node_class(path: str) -> type[BaseNode]:
+    module_name, _, attr = path.partition(":")
+    module = importlib.import_module(module_name)
+    node_class = getattr(module, attr)
+    if not (isinstance(node_class, type) and issubclass(node_class, BaseNode)):
+        raise TypeError(f"BaseNode 하위 클래스가 아닙니다: {path}")
+    return node_class
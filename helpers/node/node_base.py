@@ -1,7 +1,7 @@
 import enum
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, ClassVar, Dict, FrozenSet, Tuple
 
 
 class NodeType(enum.Enum):
@@ -37,7 +37,7 @@ class NodeInputOutputType(enum.Enum):
     OBJECT = "OBJECT"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NodeInputOutput:
     name: str
     type: NodeInputOutputType
@@ -47,45 +47,52 @@ class NodeInputOutput:
 
 
 class BaseNode(ABC):
-    """워크플로우 노드의 기본 클래스"""
+    """워크플로우 노드의 기본 클래스
+
+    입출력 스키마는 클래스 속성으로 한 번만 선언하며, 실행 상태(status/result/error)는
+    노드 인스턴스가 아닌 실행 컨텍스트(RunContext)에 저장합니다.
+    """
+
+    __slots__ = ("node_id", "properties")
+
+    inputs: ClassVar[Tuple[NodeInputOutput, ...]] = ()
+    outputs: ClassVar[Tuple[NodeInputOutput, ...]] = ()
+    # True 면 blob 참조(helpers.utils.blob_store)를 내용으로 바꾸지 않고 그대로 입력받음
+    accepts_blob_refs: ClassVar[bool] = False
+    # 앞 노드가 주지 않으면 같은 이름의 노드 속성에서 읽는 입력 (실행 계획의 필수 입력 검사에 사용)
+    property_inputs: ClassVar[FrozenSet[str]] = frozenset()
 
     def __init__(self, node_id: str, properties: Dict[str, Any]):
         self.node_id = node_id
         self.properties = properties
-        self.inputs: List[NodeInputOutput] = []
-        self.outputs: List[NodeInputOutput] = []
-        self.status: str = "pending"  # pending, running, completed, failed
-        self.result: Any = None
-        self.error: str | None = None
 
     @abstractmethod
     def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """노드 실행 로직"""
         pass
 
+    async def execute_async(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """비동기 실행 로직 (이벤트 루프를 막는 노드는 재정의)"""
+        return self.execute(inputs)
+
+    @property
+    def executor_type(self) -> str:
+        """실행 방식 (inline: 이벤트 루프에서 동기 실행, async: 비동기 I/O 대기)"""
+        if type(self).execute_async is BaseNode.execute_async:
+            return "inline"
+        return "async"
+
     @abstractmethod
     def validate_inputs(self, inputs: Dict[str, Any]) -> bool:
         """입력 검증"""
         pass
 
-    def get_input_schema(self) -> List[NodeInputOutput]:
+    @classmethod
+    def get_input_schema(cls) -> Tuple[NodeInputOutput, ...]:
         """입력 스키마 반환"""
-        return self.inputs
+        return cls.inputs
 
-    def get_output_schema(self) -> List[NodeInputOutput]:
+    @classmethod
+    def get_output_schema(cls) -> Tuple[NodeInputOutput, ...]:
         """출력 스키마 반환"""
-        return self.outputs
-
-    def set_status(self, status: str):
-        """상태 설정"""
-        self.status = status
-
-    def set_result(self, result: Any):
-        """결과 설정"""
-        self.result = result
-        self.status = "completed"
-
-    def set_error(self, error: str):
-        """에러 설정"""
-        self.error = error
-        self.status = "failed"
+        return cls.outputs
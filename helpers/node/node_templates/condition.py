@@ -1,6 +1,11 @@
 from typing import Any, Dict
 
 from helpers.node.node_base import BaseNode, NodeInputOutput, NodeInputOutputType
+from helpers.utils.safe_expression import (
+    CompiledExpression,
+    ExpressionError,
+    compile_expression,
+)
 from setting.logger import get_logger
 
 logger = get_logger(__name__)
@@ -9,44 +14,62 @@ logger = get_logger(__name__)
 class ConditionNode(BaseNode):
     """조건문 노드"""
 
+    __slots__ = ("expression",)
+    property_inputs = frozenset({"condition"})
+
+    inputs = (
+        NodeInputOutput(
+            name="condition",
+            type=NodeInputOutputType.TEXT,
+            description="조건식",
+        ),
+        NodeInputOutput(
+            name="value",
+            type=NodeInputOutputType.TEXT,
+            description="비교할 값",
+        ),
+    )
+    outputs = (
+        NodeInputOutput(
+            name="true",
+            type=NodeInputOutputType.BOOLEAN,
+            description="조건이 참일 때",
+        ),
+        NodeInputOutput(
+            name="false",
+            type=NodeInputOutputType.BOOLEAN,
+            description="조건이 거짓일 때",
+        ),
+    )
+
     def __init__(self, node_id: str, properties: Dict[str, Any]):
         super().__init__(node_id, properties)
-        self.inputs = [
-            NodeInputOutput(
-                name="condition",
-                type=NodeInputOutputType.TEXT,
-                description="조건식",
-            ),
-            NodeInputOutput(
-                name="value",
-                type=NodeInputOutputType.TEXT,
-                description="비교할 값",
-            ),
-        ]
-        self.outputs = [
-            NodeInputOutput(
-                name="true",
-                type=NodeInputOutputType.BOOLEAN,
-                description="조건이 참일 때",
-            ),
-            NodeInputOutput(
-                name="false",
-                type=NodeInputOutputType.BOOLEAN,
-                description="조건이 거짓일 때",
-            ),
-        ]
+        # 속성에 정의된 조건식은 로드 시점에 한 번만 컴파일
+        self.expression: CompiledExpression | None = None
+        if properties.get("condition"):
+            self.expression = compile_expression(properties["condition"])
 
     def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
-        condition = inputs.get("condition", "")
         value = inputs.get("value", "")
 
-        # 간단한 조건 평가 (실제로는 더 복잡한 파싱 필요)
         try:
-            result = eval(condition.replace("value", f'"{value}"'))
+            expression = self._resolve_expression(inputs)
+            # value 는 문자열 치환 없이 변수로 바인딩
+            result = bool(expression.evaluate({"value": value, "inputs": inputs}))
             return {"true": result, "false": not result}
         except Exception as e:
             logger.error(f"조건문 실행 실패: {e}", exc_info=True)
             return {"true": False, "false": True}
 
     def validate_inputs(self, inputs: Dict[str, Any]) -> bool:
-        return "condition" in inputs and "value" in inputs
+        has_condition = "condition" in inputs or self.expression is not None
+        return has_condition and "value" in inputs
+
+    def _resolve_expression(self, inputs: Dict[str, Any]) -> CompiledExpression:
+        """입력으로 전달된 조건식이 있으면 우선 사용 (컴파일 결과는 캐시됨)"""
+        condition = inputs.get("condition")
+        if condition:
+            return compile_expression(condition)
+        if self.expression is None:
+            raise ExpressionError("조건식이 비어 있습니다")
+        return self.expression
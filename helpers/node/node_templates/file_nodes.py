@@ -0,0 +1,256 @@
+"""
+파일 입출력 노드
+
+FILE_INPUT 은 파일을 blob 저장소로 스트리밍하고 내용 대신 blob 참조를 출력하며,
+FILE_OUTPUT 은 blob 참조/문자열/배열을 청크 단위로 파일에 씁니다. 수백 MB 파일도
+전체를 하나의 str 로 메모리에 올리지 않고 SPLIT 등 참조를 직접 다루는 노드로 전달됩니다.
+
+- 로컬 파일은 FILE_NODE_ROOTS 아래 경로만 읽고 쓸 수 있습니다 (심볼릭 링크 포함).
+- 파일 I/O 는 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+"""
+
+import asyncio
+import mimetypes
+import mmap
+import os
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List
+
+from helpers.node.node_base import BaseNode, NodeInputOutput, NodeInputOutputType
+from helpers.utils.blob_store import (
+    BINARY_MEDIA_TYPE,
+    CHUNK_SIZE,
+    BlobRef,
+    get_blob_store,
+    is_blob_ref,
+)
+from helpers.utils.json_response import dumps
+from helpers.utils.ndjson import NDJSON_MEDIA_TYPE
+from setting.config import get_config
+from setting.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def resolve_node_path(path: str) -> str:
+    """FILE_NODE_ROOTS 안의 실제 경로로 변환 (상대 경로는 첫 번째 루트 기준)"""
+    roots = [os.path.realpath(root) for root in get_config().FILE_NODE_ROOTS]
+    if not roots:
+        raise PermissionError("FILE_NODE_ROOTS 가 설정되지 않았습니다")
+    resolved = os.path.realpath(os.path.join(roots[0], path))
+    if _containing_root(roots, resolved) is None:
+        raise PermissionError(f"허용되지 않은 파일 경로: {path}")
+    return resolved
+
+
+def relative_node_path(path: str) -> str:
+    """resolve_node_path 결과를 포함하는 루트 기준 상대 경로로 변환
+
+    실행 결과/API 응답에 서버의 디렉터리 구조가 드러나지 않도록 출력에 사용합니다.
+    """
+    roots = [os.path.realpath(root) for root in get_config().FILE_NODE_ROOTS]
+    root = _containing_root(roots, path)
+    if root is None:
+        raise PermissionError("허용되지 않은 파일 경로")
+    return os.path.relpath(path, root)
+
+
+def _containing_root(roots: List[str], path: str) -> str | None:
+    return next(
+        (root for root in roots if os.path.commonpath([root, path]) == root), None
+    )
+
+
+def _guess_media_type(path: str) -> str:
+    media_type, _ = mimetypes.guess_type(path)
+    if media_type is None:
+        return BINARY_MEDIA_TYPE
+    if media_type.startswith("text/"):
+        return f"{media_type}; charset=utf-8"
+    return media_type
+
+
+class _FileNode(BaseNode):
+    """파일 I/O 를 스레드에서 실행하는 노드"""
+
+    __slots__ = ()
+    accepts_blob_refs = True
+
+    async def execute_async(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.execute, inputs)
+
+    @property
+    def executor_type(self) -> str:
+        return "thread"
+
+
+class FileInputNode(_FileNode):
+    """파일 입력 노드 (업로드된 blob 참조 또는 FILE_NODE_ROOTS 아래 로컬 파일)"""
+
+    __slots__ = ()
+    property_inputs = frozenset({"path"})
+
+    inputs = (
+        NodeInputOutput(
+            name="file",
+            type=NodeInputOutputType.FILE,
+            description="업로드된 파일 (POST /blobs 가 반환한 blob 참조)",
+            required=False,
+        ),
+        NodeInputOutput(
+            name="path",
+            type=NodeInputOutputType.TEXT,
+            description="읽을 로컬 파일 경로 (없으면 path 속성 사용)",
+            required=False,
+        ),
+    )
+    outputs = (
+        NodeInputOutput(
+            name="data",
+            type=NodeInputOutputType.FILE,
+            description="파일 내용 (blob 참조)",
+        ),
+        NodeInputOutput(
+            name="file_name",
+            type=NodeInputOutputType.TEXT,
+            description="파일 이름",
+        ),
+    )
+
+    def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        uploaded = inputs.get("file")
+        if is_blob_ref(uploaded):
+            return {"data": uploaded, "file_name": inputs.get("file_name", "")}
+
+        path = resolve_node_path(self._path(inputs))
+        media_type = self.properties.get("media_type") or _guess_media_type(path)
+        ref = _store_file(path, media_type)
+        logger.info(f"노드 {self.node_id}: {path} ({ref.size} bytes) 를 blob 으로 저장")
+        return {"data": ref.to_dict(), "file_name": os.path.basename(path)}
+
+    def validate_inputs(self, inputs: Dict[str, Any]) -> bool:
+        return is_blob_ref(inputs.get("file")) or isinstance(self._path(inputs), str)
+
+    def _path(self, inputs: Dict[str, Any]) -> Any:
+        return inputs.get("path") or self.properties.get("path")
+
+
+def _store_file(path: str, media_type: str) -> BlobRef:
+    """파일을 mmap 해 CHUNK_SIZE 단위로 blob 저장소에 복사"""
+    store = get_blob_store()
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            # 빈 파일은 mmap 할 수 없음
+            return store.put(b"", media_type)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return store.put_chunks(
+                (
+                    mapped[start : start + CHUNK_SIZE]
+                    for start in range(0, size, CHUNK_SIZE)
+                ),
+                media_type,
+            )
+
+
+class FileOutputNode(_FileNode):
+    """파일 출력 노드 (path 속성의 파일에 임시 파일로 쓴 뒤 교체)
+
+    배열(NDJSON blob 포함)은 separator 속성(기본 줄바꿈)으로 이어서 씁니다.
+    """
+
+    __slots__ = ()
+
+    inputs = (
+        NodeInputOutput(
+            name="data",
+            type=NodeInputOutputType.JSON,
+            description="저장할 데이터 (blob 참조, 문자열, 배열 등)",
+            required=False,
+        ),
+        NodeInputOutput(
+            name="split_data",
+            type=NodeInputOutputType.ARRAY,
+            description="저장할 배열 (SPLIT 노드 출력)",
+            required=False,
+        ),
+        NodeInputOutput(
+            name="text",
+            type=NodeInputOutputType.TEXT,
+            description="저장할 텍스트",
+            required=False,
+        ),
+    )
+    outputs = (
+        NodeInputOutput(
+            name="path",
+            type=NodeInputOutputType.TEXT,
+            description="저장된 파일 경로 (FILE_NODE_ROOTS 기준 상대 경로)",
+        ),
+        NodeInputOutput(
+            name="size",
+            type=NodeInputOutputType.NUMBER,
+            description="저장된 크기(bytes)",
+        ),
+    )
+
+    _CONTENT_KEYS = ("data", "split_data", "text")
+
+    def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        value = next(inputs[key] for key in self._CONTENT_KEYS if key in inputs)
+        separator = self.properties.get("separator", "\n").encode("utf-8")
+        path = resolve_node_path(self.properties["path"])
+
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as file:
+                for chunk in _iter_bytes(value, separator):
+                    file.write(chunk)
+                    size += len(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        logger.info(f"노드 {self.node_id}: {path} ({size} bytes) 저장")
+        return {"path": relative_node_path(path), "size": size}
+
+    def validate_inputs(self, inputs: Dict[str, Any]) -> bool:
+        return bool(self.properties.get("path")) and any(
+            key in inputs for key in self._CONTENT_KEYS
+        )
+
+
+def _iter_bytes(value: Any, separator: bytes) -> Iterator[bytes]:
+    """저장할 값을 바이트 청크로 순회 (blob 은 mmap 으로 청크 단위로 읽음)"""
+    if is_blob_ref(value):
+        store = get_blob_store()
+        ref = BlobRef.from_value(value)
+        if ref.media_type == NDJSON_MEDIA_TYPE:
+            yield from _iter_records(store.iter_records(ref), separator)
+        else:
+            yield from store.iter_chunks(ref)
+    elif isinstance(value, str):
+        for start in range(0, len(value), CHUNK_SIZE):
+            yield value[start : start + CHUNK_SIZE].encode("utf-8")
+    elif isinstance(value, (bytes, bytearray)):
+        yield bytes(value)
+    elif isinstance(value, (list, tuple)):
+        yield from _iter_records(value, separator)
+    else:
+        yield dumps(value)
+
+
+def _iter_records(records: Iterable[Any], separator: bytes) -> Iterator[bytes]:
+    for index, record in enumerate(records):
+        if index:
+            yield separator
+        if isinstance(record, str):
+            yield record.encode("utf-8")
+        elif isinstance(record, (bytes, bytearray)):
+            yield bytes(record)
+        else:
+            yield dumps(record)
@@ -1,46 +1,77 @@
 from typing import Any, Dict
 
 from helpers.node.node_base import BaseNode, NodeInputOutput, NodeInputOutputType
+from helpers.utils.code_sandbox import get_sandbox_pool, run_code
+from setting.config import get_config
+
+EXECUTION_MODES = ("inline", "sandbox")
 
 
 class FunctionNode(BaseNode):
     """함수 실행 노드"""
 
+    __slots__ = ("execution_mode",)
+
+    inputs = (
+        NodeInputOutput(
+            name="code",
+            type=NodeInputOutputType.TEXT,
+            description="실행할 Python 코드",
+        ),
+        NodeInputOutput(
+            name="args",
+            type=NodeInputOutputType.JSON,
+            description="함수 인자들",
+            required=False,
+        ),
+    )
+    outputs = (
+        NodeInputOutput(
+            name="result",
+            type=NodeInputOutputType.JSON,
+            description="함수 실행 결과",
+        ),
+    )
+
     def __init__(self, node_id: str, properties: Dict[str, Any]):
         super().__init__(node_id, properties)
-        self.inputs = [
-            NodeInputOutput(
-                name="code",
-                type=NodeInputOutputType.TEXT,
-                description="실행할 Python 코드",
-            ),
-            NodeInputOutput(
-                name="args",
-                type=NodeInputOutputType.JSON,
-                description="함수 인자들",
-                required=False,
-            ),
-        ]
-        self.outputs = [
-            NodeInputOutput(
-                name="result",
-                type=NodeInputOutputType.JSON,
-                description="함수 실행 결과",
-            )
-        ]
+        # 실행 모드: inline(API 프로세스 내 실행) | sandbox(워커 프로세스 풀)
+        self.execution_mode = properties.get(
+            "execution_mode", get_config().FUNCTION_EXECUTION_MODE
+        )
+        if self.execution_mode not in EXECUTION_MODES:
+            raise ValueError(f"지원하지 않는 실행 모드: {self.execution_mode}")
 
     def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         code = inputs.get("code", "")
         args = inputs.get("args", {})
 
         try:
-            # 안전한 코드 실행을 위한 제한된 환경
-            local_vars = {"args": args}
-            exec(code, {"__builtins__": {}}, local_vars)
-            result = local_vars.get("result", None)
+            if self.execution_mode == "sandbox":
+                result = get_sandbox_pool().run(code, args)
+            else:
+                # 안전한 코드 실행을 위한 제한된 환경 (컴파일 결과는 캐시됨)
+                result = run_code(code, args)
             return {"result": result}
         except Exception as e:
             raise Exception(f"코드 실행 오류: {str(e)}")
 
+    async def execute_async(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        if self.execution_mode != "sandbox":
+            return self.execute(inputs)
+
+        code = inputs.get("code", "")
+        args = inputs.get("args", {})
+
+        try:
+            result = await get_sandbox_pool().run_async(code, args)
+            return {"result": result}
+        except Exception as e:
+            raise Exception(f"코드 실행 오류: {str(e)}")
+
+    @property
+    def executor_type(self) -> str:
+        return "process_pool" if self.execution_mode == "sandbox" else "inline"
+
     def validate_inputs(self, inputs: Dict[str, Any]) -> bool:
         return "code" in inputs and inputs["code"]
@@ -1,33 +1,46 @@
 from typing import Any, Dict
 
 from helpers.node.node_base import BaseNode, NodeInputOutput, NodeInputOutputType
+from helpers.utils.tracing import SPAN_KIND_CLIENT, get_tracer
 
 
 class LLMNode(BaseNode):
     """LLM 노드"""
 
-    def __init__(self, node_id: str, properties: Dict[str, Any]):
-        super().__init__(node_id, properties)
-        self.inputs = [
-            NodeInputOutput(
-                name="prompt",
-                type=NodeInputOutputType.TEXT,
-                description="LLM에 전달할 프롬프트",
-            ),
-            NodeInputOutput(
-                name="model",
-                type=NodeInputOutputType.TEXT,
-                description="사용할 모델명",
-                value="gpt-3.5-turbo",
-            ),
-        ]
-        self.outputs = [
-            NodeInputOutput(
-                name="response",
-                type=NodeInputOutputType.TEXT,
-                description="LLM 응답",
-            )
-        ]
+    __slots__ = ()
+
+    inputs = (
+        NodeInputOutput(
+            name="text",
+            type=NodeInputOutputType.TEXT,
+            description="입력 텍스트",
+        ),
+        NodeInputOutput(
+            name="prompt",
+            type=NodeInputOutputType.TEXT,
+            description="LLM에 전달할 프롬프트",
+            required=False,
+        ),
+        NodeInputOutput(
+            name="model",
+            type=NodeInputOutputType.TEXT,
+            description="사용할 모델명",
+            value="gpt-3.5-turbo",
+        ),
+    )
+    outputs = (
+        NodeInputOutput(
+            name="response",
+            type=NodeInputOutputType.TEXT,
+            description="LLM 응답",
+        ),
+        # 입력을 그대로 함께 반환
+        NodeInputOutput(
+            name="text",
+            type=NodeInputOutputType.TEXT,
+            description="입력 텍스트",
+        ),
+    )
 
     def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         # 실제 LLM 호출 로직은 여기에 구현
@@ -35,8 +48,12 @@ class LLMNode(BaseNode):
         prompt = inputs.get("prompt", "")
         model = inputs.get("model", "gpt-3.5-turbo")
 
-        # 모의 응답
-        response = f"LLM 응답 (모델: {model}): {prompt[:50]}..."
+        # 모의 응답 (실제 호출로 바꿀 때도 span 안에서 호출)
+        with get_tracer().start_span(
+            "llm.call", {"llm.model": model}, kind=SPAN_KIND_CLIENT
+        ) as span:
+            response = f"LLM 응답 (모델: {model}): {prompt[:50]}..."
+            span.set_attribute("llm.response_chars", len(response))
         inputs["response"] = response
         return inputs
 
@@ -1,10 +1,12 @@
+import asyncio
 import json
 import time
-from typing import Any, Dict
-
-import requests  # type: ignore
+from typing import Any, Dict, Iterator
 
 from helpers.node.node_base import BaseNode, NodeInputOutput, NodeInputOutputType
+from helpers.utils.blob_store import get_blob_store, is_blob_ref
+from helpers.utils.ndjson import NDJSON_MEDIA_TYPE, encode_line
+from helpers.utils.tracing import SPAN_KIND_CLIENT, get_tracer, inject_traceparent
 from setting.logger import get_logger
 
 logger = get_logger(__name__)
@@ -13,23 +15,23 @@ logger = get_logger(__name__)
 class DelayNode(BaseNode):
     """지연 노드"""
 
-    def __init__(self, node_id: str, properties: Dict[str, Any]):
-        super().__init__(node_id, properties)
-        self.inputs = [
-            NodeInputOutput(
-                name="delay_seconds",
-                type=NodeInputOutputType.NUMBER,
-                description="지연 시간(초)",
-                value=1,
-            )
-        ]
-        self.outputs = [
-            NodeInputOutput(
-                name="output",
-                type=NodeInputOutputType.TEXT,
-                description="지연 후 출력",
-            )
-        ]
+    __slots__ = ()
+
+    inputs = (
+        NodeInputOutput(
+            name="delay_seconds",
+            type=NodeInputOutputType.NUMBER,
+            description="지연 시간(초)",
+            value=1,
+        ),
+    )
+    outputs = (
+        NodeInputOutput(
+            name="output",
+            type=NodeInputOutputType.TEXT,
+            description="지연 후 출력",
+        ),
+    )
 
     def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         delay_seconds = inputs.get("delay_seconds", 1)
@@ -44,53 +46,70 @@ class DelayNode(BaseNode):
 class WebhookNode(BaseNode):
     """웹훅 노드"""
 
-    def __init__(self, node_id: str, properties: Dict[str, Any]):
-        super().__init__(node_id, properties)
-        self.inputs = [
-            NodeInputOutput(
-                name="url", type=NodeInputOutputType.TEXT, description="웹훅 URL"
-            ),
-            NodeInputOutput(
-                name="method",
-                type=NodeInputOutputType.TEXT,
-                description="HTTP 메서드",
-                value="POST",
-            ),
-            NodeInputOutput(
-                name="headers",
-                type=NodeInputOutputType.JSON,
-                description="HTTP 헤더",
-                required=False,
-            ),
-            NodeInputOutput(
-                name="data",
-                type=NodeInputOutputType.JSON,
-                description="전송할 데이터",
-                required=False,
-            ),
-        ]
-        self.outputs = [
-            NodeInputOutput(
-                name="response",
-                type=NodeInputOutputType.JSON,
-                description="웹훅 응답",
-            ),
-            NodeInputOutput(
-                name="status_code",
-                type=NodeInputOutputType.NUMBER,
-                description="HTTP 상태 코드",
-            ),
-        ]
+    __slots__ = ()
+
+    inputs = (
+        NodeInputOutput(
+            name="url", type=NodeInputOutputType.TEXT, description="웹훅 URL"
+        ),
+        NodeInputOutput(
+            name="method",
+            type=NodeInputOutputType.TEXT,
+            description="HTTP 메서드",
+            value="POST",
+        ),
+        NodeInputOutput(
+            name="headers",
+            type=NodeInputOutputType.JSON,
+            description="HTTP 헤더",
+            required=False,
+        ),
+        NodeInputOutput(
+            name="data",
+            type=NodeInputOutputType.JSON,
+            description="전송할 데이터",
+            required=False,
+        ),
+    )
+    outputs = (
+        NodeInputOutput(
+            name="response",
+            type=NodeInputOutputType.JSON,
+            description="웹훅 응답",
+        ),
+        NodeInputOutput(
+            name="status_code",
+            type=NodeInputOutputType.NUMBER,
+            description="HTTP 상태 코드",
+        ),
+    )
 
     def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         url = inputs.get("url")
         method = inputs.get("method", "POST").upper()
-        headers = inputs.get("headers", {})
+        # 입력 dict 는 다른 노드와 공유될 수 있으므로 복사 후 trace 헤더 추가
+        headers = dict(inputs.get("headers") or {})
         data = inputs.get("data", {})
 
         if not url:
             raise ValueError("웹훅 URL이 필요합니다")
 
+        # requests 는 웹훅 노드가 실제로 사용될 때만 import
+        import requests  # type: ignore
+
+        with get_tracer().start_span(
+            f"HTTP {method}",
+            {"http.method": method, "http.url": url},
+            kind=SPAN_KIND_CLIENT,
+        ) as span:
+            inject_traceparent(headers)
+            result = self._request(requests, method, url, headers, data)
+            span.set_attribute("http.status_code", result["status_code"])
+            return result
+
+    def _request(
+        self, requests, method: str, url: str, headers: Dict[str, str], data: Any
+    ) -> Dict[str, Any]:
         try:
             if method == "GET":
                 response = requests.get(url, headers=headers, timeout=30)
@@ -122,41 +141,41 @@ class WebhookNode(BaseNode):
 # class MergeNode(BaseNode):
 #     """데이터 병합 노드"""
 
-#     def __init__(self, node_id: str, properties: Dict[str, Any]):
-#         super().__init__(node_id, properties)
-#         self.inputs = [
-#             NodeInputOutput(
-#                 name="input1",
-#                 type=NodeInputOutputType.JSON,
-#                 description="첫 번째 입력",
-#                 required=False,
-#             ),
-#             NodeInputOutput(
-#                 name="input2",
-#                 type=NodeInputOutputType.JSON,
-#                 description="두 번째 입력",
-#                 required=False,
-#             ),
-#             NodeInputOutput(
-#                 name="input3",
-#                 type=NodeInputOutputType.JSON,
-#                 description="세 번째 입력",
-#                 required=False,
-#             ),
-#             NodeInputOutput(
-#                 name="merge_strategy",
-#                 type=NodeInputOutputType.TEXT,
-#                 description="병합 전략",
-#                 value="merge",
-#             ),
-#         ]
-#         self.outputs = [
-#             NodeInputOutput(
-#                 name="merged_data",
-#                 type=NodeInputOutputType.JSON,
-#                 description="병합된 데이터",
-#             )
-#         ]
+#     __slots__ = ()
+
+#     inputs = (
+#         NodeInputOutput(
+#             name="input1",
+#             type=NodeInputOutputType.JSON,
+#             description="첫 번째 입력",
+#             required=False,
+#         ),
+#         NodeInputOutput(
+#             name="input2",
+#             type=NodeInputOutputType.JSON,
+#             description="두 번째 입력",
+#             required=False,
+#         ),
+#         NodeInputOutput(
+#             name="input3",
+#             type=NodeInputOutputType.JSON,
+#             description="세 번째 입력",
+#             required=False,
+#         ),
+#         NodeInputOutput(
+#             name="merge_strategy",
+#             type=NodeInputOutputType.TEXT,
+#             description="병합 전략",
+#             value="merge",
+#         ),
+#     )
+#     outputs = (
+#         NodeInputOutput(
+#             name="merged_data",
+#             type=NodeInputOutputType.JSON,
+#             description="병합된 데이터",
+#         ),
+#     )
 
 #     def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
 #         merge_strategy = inputs.get("merge_strategy", "merge")
@@ -191,72 +210,127 @@ class WebhookNode(BaseNode):
 
 
 class SplitNode(BaseNode):
-    """데이터 분할 노드"""
-
-    def __init__(self, node_id: str, properties: Dict[str, Any]):
-        super().__init__(node_id, properties)
-        self.inputs = [
-            NodeInputOutput(
-                name="data",
-                type=NodeInputOutputType.TEXT,
-                description="분할할 데이터",
-            ),
-            NodeInputOutput(
-                name="separator",
-                type=NodeInputOutputType.TEXT,
-                description="구분자",
-                value=",",
-            ),
-            NodeInputOutput(
-                name="max_splits",
-                type=NodeInputOutputType.NUMBER,
-                description="최대 분할 수",
-                required=False,
-            ),
-        ]
-        self.outputs = [
-            NodeInputOutput(
-                name="split_data",
-                type=NodeInputOutputType.ARRAY,
-                description="분할된 데이터 배열",
-            )
-        ]
+    """데이터 분할 노드
+
+    data 가 blob 참조(FILE_INPUT 출력 등)면 내용을 str 로 읽지 않고 mmap 에서 구분자를
+    찾아가며 분할하고, 결과도 NDJSON blob 참조로 출력합니다.
+    """
+
+    __slots__ = ()
+    accepts_blob_refs = True
+    property_inputs = frozenset({"separator", "max_splits"})
+
+    inputs = (
+        NodeInputOutput(
+            name="data",
+            type=NodeInputOutputType.TEXT,
+            description="분할할 데이터",
+        ),
+        NodeInputOutput(
+            name="separator",
+            type=NodeInputOutputType.TEXT,
+            description="구분자",
+            value=",",
+        ),
+        NodeInputOutput(
+            name="max_splits",
+            type=NodeInputOutputType.NUMBER,
+            description="최대 분할 수",
+            required=False,
+        ),
+    )
+    outputs = (
+        NodeInputOutput(
+            name="split_data",
+            type=NodeInputOutputType.ARRAY,
+            description="분할된 데이터 배열",
+        ),
+        NodeInputOutput(
+            name="count",
+            type=NodeInputOutputType.NUMBER,
+            description="분할된 데이터 수",
+        ),
+    )
 
     def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         data = inputs.get("data", "")
-        separator = inputs.get("separator", ",")
-        max_splits = inputs.get("max_splits")
+        # 앞 노드가 주지 않은 설정은 노드 속성에서 가져옴
+        separator = inputs.get("separator", self.properties.get("separator", ","))
+        max_splits = inputs.get("max_splits", self.properties.get("max_splits"))
+
+        if is_blob_ref(data):
+            return self._split_blob(data, separator, max_splits)
 
         if max_splits:
             split_data = data.split(separator, max_splits)
         else:
             split_data = data.split(separator)
 
-        return {"split_data": split_data}
+        return {"split_data": split_data, "count": len(split_data)}
+
+    async def execute_async(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        # 대용량 blob 분할은 이벤트 루프를 막지 않도록 스레드에서 실행
+        if is_blob_ref(inputs.get("data")):
+            return await asyncio.to_thread(self.execute, inputs)
+        return self.execute(inputs)
 
     def validate_inputs(self, inputs: Dict[str, Any]) -> bool:
         return "data" in inputs and inputs["data"]
 
+    @staticmethod
+    def _split_blob(
+        data: Dict[str, Any], separator: str, max_splits: int | None
+    ) -> Dict[str, Any]:
+        if not separator:
+            raise ValueError("빈 구분자로는 분할할 수 없습니다")
+        store = get_blob_store()
+        count = 0
+        with store.open_mmap(data) as mapped, store.writer(NDJSON_MEDIA_TYPE) as writer:
+            for piece in _iter_split(mapped, separator.encode("utf-8"), max_splits):
+                writer.write(encode_line(str(piece, "utf-8")))
+                count += 1
+        return {"split_data": writer.ref.to_dict(), "count": count}
+
+
+def _iter_split(
+    buffer: Any, separator: bytes, max_splits: int | None
+) -> Iterator[bytes]:
+    """str.split 과 같은 규칙으로 분할 (mmap 은 find 로 필요한 부분만 읽음)
+
+    UTF-8 은 다른 문자의 바이트 중간에서 구분자가 일치하지 않으므로 바이트 단위로
+    분할해도 문자가 잘리지 않습니다.
+    """
+    start = splits = 0
+    while not max_splits or splits < max_splits:
+        end = buffer.find(separator, start)
+        if end < 0:
+            break
+        yield buffer[start:end]
+        start = end + len(separator)
+        splits += 1
+    yield buffer[start:]
+
 
 class TextOutputNode(BaseNode):
-    """텍스트 출력 노드"""
-
-    def __init__(self, node_id: str, properties: Dict[str, Any]):
-        super().__init__(node_id, properties)
-        self.inputs = [
-            NodeInputOutput(
-                name="text",
-                type=NodeInputOutputType.TEXT,
-                description="출력할 텍스트",
-            )
-        ]
-        self.outputs = [
-            NodeInputOutput(
-                name="output",
-                type=NodeInputOutputType.TEXT,
-                description="출력된 텍스트",
-            )
-        ]
+    """텍스트 출력 노드 (blob 참조는 내용을 읽지 않고 그대로 출력)"""
+
+    __slots__ = ()
+    accepts_blob_refs = True
+
+    inputs = (
+        NodeInputOutput(
+            name="text",
+            type=NodeInputOutputType.TEXT,
+            description="출력할 텍스트",
+        ),
+    )
+    outputs = (
+        NodeInputOutput(
+            name="output",
+            type=NodeInputOutputType.TEXT,
+            description="출력된 텍스트",
+        ),
+    )
 
     def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         text = inputs.get("text", "")
@@ -271,22 +345,22 @@ class TextOutputNode(BaseNode):
 class JSONOutputNode(BaseNode):
     """JSON 출력 노드"""
 
-    def __init__(self, node_id: str, properties: Dict[str, Any]):
-        super().__init__(node_id, properties)
-        self.inputs = [
-            NodeInputOutput(
-                name="data",
-                type=NodeInputOutputType.JSON,
-                description="출력할 JSON 데이터",
-            )
-        ]
-        self.outputs = [
-            NodeInputOutput(
-                name="output",
-                type=NodeInputOutputType.JSON,
-                description="출력된 JSON 데이터",
-            )
-        ]
+    __slots__ = ()
+
+    inputs = (
+        NodeInputOutput(
+            name="data",
+            type=NodeInputOutputType.JSON,
+            description="출력할 JSON 데이터",
+        ),
+    )
+    outputs = (
+        NodeInputOutput(
+            name="output",
+            type=NodeInputOutputType.JSON,
+            description="출력된 JSON 데이터",
+        ),
+    )
 
     def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         data = inputs.get("data", {})
@@ -0,0 +1,271 @@
+"""
+대용량 데이터용 로컬 blob 저장소
+
+노드 출력 중 BLOB_INLINE_THRESHOLD 보다 큰 문자열/바이트는 내용 해시(sha256) 이름의
+파일로 저장하고, 실행 컨텍스트와 API 응답에는 참조(blob ref)만 담습니다.
+여러 노드를 거치는 수 MB 문서도 실행 컨텍스트/실행 이력/응답마다 복사되지 않습니다.
+
+- 같은 내용은 같은 파일 하나로 저장됩니다 (내용 주소 지정).
+- 파일은 임시 파일에 쓴 뒤 rename 하므로 읽는 쪽은 완성된 파일만 봅니다.
+- 읽기는 mmap 을 사용하므로 필요한 부분만 페이지 캐시에서 읽힙니다.
+- 참조는 JSON 으로 직렬화할 수 있는 dict 입니다.
+  {"$blob": "sha256:<hex>", "size": <bytes>, "media_type": "..."}
+- media_type 이 NDJSON 인 blob 은 한 줄에 하나씩 값을 담은 배열이며, 복원하면 list 가
+  됩니다 (SPLIT 노드가 대용량 입력을 분할한 결과 등).
+- 저장된 blob 은 자동으로 삭제되지 않습니다.
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List
+
+from helpers.utils.json_response import loads
+from helpers.utils.ndjson import NDJSON_MEDIA_TYPE
+from setting.logger import get_logger
+
+logger = get_logger(__name__)
+
+BLOB_REF_KEY = "$blob"
+TEXT_MEDIA_TYPE = "text/plain; charset=utf-8"
+BINARY_MEDIA_TYPE = "application/octet-stream"
+# 스트리밍 저장/복사 단위
+CHUNK_SIZE = 1024 * 1024
+
+_DIGEST_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+class BlobNotFoundError(LookupError):
+    """저장소에 없는 blob"""
+
+
+@dataclass(frozen=True, slots=True)
+class BlobRef:
+    """저장된 blob 참조"""
+
+    digest: str
+    size: int
+    media_type: str = BINARY_MEDIA_TYPE
+
+    @property
+    def is_text(self) -> bool:
+        return self.media_type.startswith("text/")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            BLOB_REF_KEY: f"sha256:{self.digest}",
+            "size": self.size,
+            "media_type": self.media_type,
+        }
+
+    @classmethod
+    def from_value(cls, value: Any) -> "BlobRef":
+        """blob ref dict (또는 BlobRef) 를 BlobRef 로 변환"""
+        if isinstance(value, BlobRef):
+            return value
+        if not is_blob_ref(value):
+            raise ValueError(f"blob 참조가 아닙니다: {value!r}")
+        return cls(
+            digest=value[BLOB_REF_KEY].removeprefix("sha256:"),
+            size=value.get("size", 0),
+            media_type=value.get("media_type", BINARY_MEDIA_TYPE),
+        )
+
+
+def is_blob_ref(value: Any) -> bool:
+    return isinstance(value, dict) and isinstance(value.get(BLOB_REF_KEY), str)
+
+
+class BlobStore:
+    """파일 시스템 기반 내용 주소 지정 blob 저장소
+
+    inline_threshold 보다 큰 값만 offload 하며, 0 이하면 offload 하지 않습니다.
+    """
+
+    def __init__(self, root: str, inline_threshold: int = 1024 * 1024):
+        self.root = os.path.abspath(root)
+        self.inline_threshold = inline_threshold
+        self._tmp_dir = os.path.join(self.root, "tmp")
+
+    def path(self, digest: str) -> str:
+        """digest 의 저장 경로 (앞 2글자로 디렉터리 분산)"""
+        if not _DIGEST_PATTERN.fullmatch(digest):
+            raise ValueError(f"잘못된 blob digest: {digest}")
+        return os.path.join(self.root, digest[:2], digest[2:])
+
+    def exists(self, ref: BlobRef | Dict[str, Any]) -> bool:
+        return os.path.exists(self.path(BlobRef.from_value(ref).digest))
+
+    # === 저장 ===
+    def put(self, data: bytes | str, media_type: str | None = None) -> BlobRef:
+        """바이트 또는 문자열(UTF-8) 저장"""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+            media_type = media_type or TEXT_MEDIA_TYPE
+        return self.put_chunks((data,), media_type or BINARY_MEDIA_TYPE)
+
+    def put_file(self, file: BinaryIO, media_type: str = BINARY_MEDIA_TYPE) -> BlobRef:
+        """파일 객체 내용을 CHUNK_SIZE 단위로 읽어 저장"""
+        return self.put_chunks(iter(lambda: file.read(CHUNK_SIZE), b""), media_type)
+
+    def put_chunks(
+        self, chunks: Iterable[bytes], media_type: str = BINARY_MEDIA_TYPE
+    ) -> BlobRef:
+        """청크 스트림을 해시하며 임시 파일에 쓴 뒤 digest 경로로 이동"""
+        with self.writer(media_type) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+        return writer.ref
+
+    def writer(self, media_type: str = BINARY_MEDIA_TYPE) -> "BlobWriter":
+        """청크를 차례로 써서 blob 을 만드는 writer (with 블록이 끝나면 저장)"""
+        return BlobWriter(self, media_type)
+
+    def offload(self, value: Any) -> Any:
+        """임계값보다 큰 문자열/바이트는 저장 후 참조 dict 로, 그 외는 그대로 반환
+
+        문자열은 인코딩 없이 길이(문자 수)로 먼저 비교합니다.
+        """
+        if self.should_offload(value):
+            return self.put(value).to_dict()
+        return value
+
+    def should_offload(self, value: Any) -> bool:
+        """offload 대상(임계값보다 큰 문자열/바이트)인지 여부 (파일 I/O 없음)"""
+        return (
+            self.inline_threshold > 0
+            and isinstance(value, (str, bytes, bytearray))
+            and len(value) > self.inline_threshold
+        )
+
+    # === 읽기 ===
+    @contextmanager
+    def open_mmap(self, ref: BlobRef | Dict[str, Any]) -> Iterator[mmap.mmap | bytes]:
+        """blob 파일을 읽기 전용으로 mmap (with 블록 안에서만 유효)
+
+        find/슬라이싱으로 필요한 부분만 읽을 수 있으며, 빈 파일은 mmap 할 수 없으므로
+        b"" 를 반환합니다.
+        """
+        path = self.path(BlobRef.from_value(ref).digest)
+        try:
+            file = open(path, "rb")
+        except FileNotFoundError:
+            raise BlobNotFoundError(f"blob 을 찾을 수 없습니다: {path}")
+        with file:
+            if os.fstat(file.fileno()).st_size == 0:
+                yield b""
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+    @contextmanager
+    def open_view(self, ref: BlobRef | Dict[str, Any]) -> Iterator[memoryview]:
+        """blob 내용을 mmap 한 읽기 전용 memoryview (with 블록 안에서만 유효)"""
+        with self.open_mmap(ref) as mapped:
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                view.release()
+
+    def read_bytes(self, ref: BlobRef | Dict[str, Any]) -> bytes:
+        with self.open_view(ref) as view:
+            return view.tobytes()
+
+    def load(self, ref: BlobRef | Dict[str, Any]) -> str | bytes | List[Any]:
+        """참조를 원래 값으로 복원 (텍스트 blob 은 str, NDJSON 은 list, 그 외는 bytes)"""
+        blob = BlobRef.from_value(ref)
+        if blob.media_type == NDJSON_MEDIA_TYPE:
+            return list(self.iter_records(blob))
+        with self.open_view(blob) as view:
+            if blob.is_text:
+                return str(view, "utf-8")
+            return view.tobytes()
+
+    def iter_chunks(
+        self, ref: BlobRef | Dict[str, Any], chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """blob 내용을 chunk_size 단위로 순회"""
+        with self.open_view(ref) as view:
+            for start in range(0, len(view), chunk_size):
+                yield view[start : start + chunk_size].tobytes()
+
+    def iter_records(self, ref: BlobRef | Dict[str, Any]) -> Iterator[Any]:
+        """NDJSON blob 의 값을 한 줄씩 순회 (빈 줄은 무시)"""
+        with self.open_mmap(ref) as mapped:
+            start, size = 0, len(mapped)
+            while start < size:
+                end = mapped.find(b"\n", start)
+                if end < 0:
+                    end = size
+                line = mapped[start:end]
+                if line.strip():
+                    yield loads(line)
+                start = end + 1
+
+
+class BlobWriter:
+    """청크를 해시하며 임시 파일에 쓰고, 정상 종료 시 digest 경로로 이동
+
+    예외로 끝나면 임시 파일을 지우며, 저장된 참조는 with 블록이 끝난 뒤 ref 로 얻습니다.
+    """
+
+    def __init__(self, store: BlobStore, media_type: str = BINARY_MEDIA_TYPE):
+        self.store = store
+        self.media_type = media_type
+        self.size = 0
+        self.ref: BlobRef | None = None
+        self._hasher = hashlib.sha256()
+        self._file: BinaryIO | None = None
+        self._tmp_path = ""
+
+    def __enter__(self) -> "BlobWriter":
+        os.makedirs(self.store._tmp_dir, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(dir=self.store._tmp_dir)
+        self._file = os.fdopen(fd, "wb")
+        return self
+
+    def write(self, chunk: bytes):
+        self._hasher.update(chunk)
+        self._file.write(chunk)
+        self.size += len(chunk)
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self._file.close()
+            if exc_type is None:
+                self.ref = self._commit()
+        finally:
+            if os.path.exists(self._tmp_path):
+                os.unlink(self._tmp_path)
+
+    def _commit(self) -> BlobRef:
+        digest = self._hasher.hexdigest()
+        path = self.store.path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(self._tmp_path, path)
+        return BlobRef(digest=digest, size=self.size, media_type=self.media_type)
+
+
+_blob_store: BlobStore | None = None
+_blob_store_lock = threading.Lock()
+
+
+def get_blob_store() -> BlobStore:
+    """설정값 기반 전역 blob 저장소"""
+    global _blob_store
+    with _blob_store_lock:
+        if _blob_store is None:
+            from setting.config import get_config
+
+            config = get_config()
+            _blob_store = BlobStore(
+                config.BLOB_STORE_DIR, inline_threshold=config.BLOB_INLINE_THRESHOLD
+            )
+        return _blob_store
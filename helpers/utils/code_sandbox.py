@@ -0,0 +1,236 @@
+"""
+FUNCTION 노드용 코드 실행 모듈
+
+- 소스 코드는 해시 기준으로 한 번만 컴파일되어 캐시됩니다.
+- 샌드박스 모드에서는 미리 띄워둔 워커 프로세스 풀에서 실행되며,
+  호출마다 CPU 시간 제한과 워커 메모리 제한이 적용됩니다.
+  인자와 결과는 JSON 으로 직렬화되어 프로세스 간에 전달됩니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import resource
+import signal
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import CodeType
+from typing import Any, Dict
+
+from setting.logger import get_logger
+
+logger = get_logger(__name__)
+
+CODE_CACHE_SIZE = 512
+
+_code_cache: "OrderedDict[str, CodeType]" = OrderedDict()
+_code_cache_lock = threading.Lock()
+
+
+class SandboxError(Exception):
+    """샌드박스 실행 실패"""
+
+
+class SandboxTimeoutError(SandboxError):
+    """CPU 시간 제한 초과"""
+
+
+def code_hash(code: str) -> str:
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
+def compile_code(code: str) -> CodeType:
+    """소스 코드를 컴파일 (해시 기준 LRU 캐시)"""
+    digest = code_hash(code)
+    with _code_cache_lock:
+        compiled = _code_cache.get(digest)
+        if compiled is not None:
+            _code_cache.move_to_end(digest)
+            return compiled
+
+    compiled = compile(code, f"<function:{digest[:12]}>", "exec")
+
+    with _code_cache_lock:
+        _code_cache[digest] = compiled
+        if len(_code_cache) > CODE_CACHE_SIZE:
+            _code_cache.popitem(last=False)
+    return compiled
+
+
+def run_code(code: str, args: Any) -> Any:
+    """제한된 전역 환경에서 코드 실행 후 `result` 변수 반환"""
+    local_vars: Dict[str, Any] = {"args": args}
+    exec(compile_code(code), {"__builtins__": {}}, local_vars)
+    return local_vars.get("result", None)
+
+
+# === 워커 프로세스 측 ===
+_cpu_limit_signals = 0
+
+
+def _raise_cpu_limit(signum, frame):
+    global _cpu_limit_signals
+    _cpu_limit_signals += 1
+    if _cpu_limit_signals > 1:
+        # 사용자 코드가 예외를 삼키고 계속 실행하는 경우 워커 종료
+        os._exit(1)
+    raise SandboxTimeoutError("CPU 시간 제한을 초과했습니다")
+
+
+def _init_worker(memory_limit_bytes: int | None):
+    """워커 초기화: 메모리 제한 및 CPU 제한 시그널 핸들러 설정"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGXCPU, _raise_cpu_limit)
+    if memory_limit_bytes:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, hard))
+
+
+def _cpu_seconds_used() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _sandbox_call(code: str, args_json: str, cpu_limit_seconds: int) -> str:
+    """워커에서 실행되는 함수. 인자/결과는 JSON 문자열로 주고받음"""
+    global _cpu_limit_signals
+    _cpu_limit_signals = 0
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    # soft limit 만 조정하고 hard limit 은 유지 (비특권 프로세스는 hard limit 을 되돌릴 수 없음)
+    soft = math.ceil(_cpu_seconds_used()) + cpu_limit_seconds
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    try:
+        result = run_code(code, json.loads(args_json))
+        return json.dumps({"result": result}, ensure_ascii=False)
+    except SandboxTimeoutError as e:
+        return json.dumps({"error": str(e), "timeout": True}, ensure_ascii=False)
+    except MemoryError:
+        return json.dumps({"error": "메모리 제한을 초과했습니다"}, ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"{type(e).__name__}: {e}"}, ensure_ascii=False)
+    finally:
+        resource.setrlimit(resource.RLIMIT_CPU, (hard, hard))
+
+
+def _noop() -> int:
+    return os.getpid()
+
+
+# === API 프로세스 측 ===
+class SandboxPool:
+    """사전 기동된 샌드박스 워커 프로세스 풀"""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        cpu_limit_seconds: int = 5,
+        memory_limit_mb: int | None = 512,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cpu_limit_seconds = cpu_limit_seconds
+        self.memory_limit_bytes = (
+            memory_limit_mb * 1024 * 1024 if memory_limit_mb else None
+        )
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("forkserver"),
+                    initializer=_init_worker,
+                    initargs=(self.memory_limit_bytes,),
+                )
+            return self._executor
+
+    def warm_up(self):
+        """모든 워커 프로세스를 미리 기동"""
+        executor = self._get_executor()
+        futures = [executor.submit(_noop) for _ in range(self.max_workers)]
+        pids = {future.result() for future in futures}
+        logger.info(f"샌드박스 워커 기동 완료: {len(pids)}개 프로세스")
+
+    def submit(self, code: str, args: Any) -> Future:
+        try:
+            args_json = json.dumps(args, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            raise SandboxError(f"인자를 직렬화할 수 없습니다: {e}") from e
+        return self._get_executor().submit(
+            _sandbox_call, code, args_json, self.cpu_limit_seconds
+        )
+
+    def run(self, code: str, args: Any) -> Any:
+        """동기 실행 (결과 대기)"""
+        return self._handle_result(self._wait(self.submit(code, args)))
+
+    async def run_async(self, code: str, args: Any) -> Any:
+        """이벤트 루프를 막지 않는 비동기 실행"""
+        future = asyncio.wrap_future(self.submit(code, args))
+        try:
+            payload = await future
+        except BrokenProcessPool as e:
+            self._reset()
+            raise SandboxError("샌드박스 워커가 비정상 종료되었습니다") from e
+        return self._handle_result(payload)
+
+    def _wait(self, future: Future) -> str:
+        try:
+            return future.result()
+        except BrokenProcessPool as e:
+            self._reset()
+            raise SandboxError("샌드박스 워커가 비정상 종료되었습니다") from e
+
+    def _handle_result(self, payload: str) -> Any:
+        data = json.loads(payload)
+        if "error" in data:
+            if data.get("timeout"):
+                raise SandboxTimeoutError(data["error"])
+            raise SandboxError(data["error"])
+        return data["result"]
+
+    def _reset(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+
+_sandbox_pool: SandboxPool | None = None
+_sandbox_pool_lock = threading.Lock()
+
+
+def get_sandbox_pool() -> SandboxPool:
+    """설정값 기반 전역 샌드박스 풀"""
+    global _sandbox_pool
+    with _sandbox_pool_lock:
+        if _sandbox_pool is None:
+            from setting.config import get_config
+
+            config = get_config()
+            _sandbox_pool = SandboxPool(
+                max_workers=config.FUNCTION_SANDBOX_WORKERS,
+                cpu_limit_seconds=config.FUNCTION_SANDBOX_CPU_SECONDS,
+                memory_limit_mb=config.FUNCTION_SANDBOX_MEMORY_MB,
+            )
+        return _sandbox_pool
+
+
+def shutdown_sandbox_pool():
+    global _sandbox_pool
+    with _sandbox_pool_lock:
+        if _sandbox_pool is not None:
+            _sandbox_pool.shutdown()
+            _sandbox_pool = None
@@ -0,0 +1,187 @@
+"""
+응답 압축 미들웨어 (br / gzip)
+
+Accept-Encoding 에 따라 brotli(설치된 경우) 또는 gzip 으로 응답을 압축합니다.
+
+- 한 번에 전송되는 응답은 minimum_size 이상일 때만 압축합니다.
+- 스트리밍 응답은 청크마다 압축 후 flush 하므로 스트리밍 특성이 유지됩니다.
+- 이미 인코딩된 응답이나 압축 효과가 없는 content-type 은 그대로 전달합니다.
+"""
+
+import zlib
+from typing import List
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli 는 선택 의존성
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/msgpack",
+    "application/x-msgpack",
+    "application/vnd.msgpack",
+    "application/javascript",
+    "application/xml",
+)
+
+
+class _GzipCompressor:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliCompressor:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def select_encoding(accept_encoding: str) -> str | None:
+    """Accept-Encoding 에서 사용할 인코딩 선택 (br > gzip, q=0 은 제외)"""
+    accepted: List[str] = []
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if quality > 0:
+            accepted.append(name.strip())
+
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def _is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";")[0].strip().lower()
+    return media_type.endswith("+json") or media_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.initial_message: Message | None = None
+        self.started = False
+        self.passthrough = False
+        self.compressor: _GzipCompressor | _BrotliCompressor | None = None
+
+    def _create_compressor(self):
+        if self.encoding == "br":
+            return _BrotliCompressor(self.middleware.brotli_quality)
+        return _GzipCompressor(self.middleware.gzip_level)
+
+    async def send(self, message: Message):
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # 본문 크기를 보고 압축 여부를 결정할 때까지 헤더 전송 보류
+            self.initial_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = "content-encoding" in headers or not _is_compressible(
+                headers.get("content-type", "")
+            )
+            return
+
+        if message_type != "http.response.body":
+            await self._send(message)
+            return
+
+        if self.passthrough:
+            await self._start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            if not more_body and len(body) < self.middleware.minimum_size:
+                # 작은 응답은 압축하지 않음
+                self.passthrough = True
+                await self._start()
+                await self._send(message)
+                return
+
+            self.compressor = self._create_compressor()
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                # 인코딩된 표현은 바이트가 달라지므로 약한 ETag 로 변경
+                headers["ETag"] = f"W/{etag}"
+
+            if not more_body:
+                compressed = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(compressed))
+                await self._start()
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+
+            del headers["Content-Length"]
+            await self._start()
+
+        data = self.compressor.compress(body)
+        if not more_body:
+            data += self.compressor.finish()
+        await self._send(
+            {"type": "http.response.body", "body": data, "more_body": more_body}
+        )
+
+    async def _start(self):
+        if not self.started:
+            self.started = True
+            await self._send(self.initial_message)
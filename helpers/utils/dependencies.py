@@ -10,6 +10,7 @@ from services.graph.graph_service import GraphService
 from services.graph.vertex_service import VertexService
 from services.workflow.workflow_execution_service import WorkflowExecutionService
 from services.workflow.workflow_persistence_service import WorkflowPersistenceService
+from services.workflow.workflow_run_status_service import WorkflowRunStatusService
 
 
 async def get_graph_repository(
@@ -64,6 +65,11 @@ async def get_workflow_execution_service(
     return WorkflowExecutionService(persistence_service=persistence_service)
 
 
+async def get_workflow_run_status_service() -> WorkflowRunStatusService:
+    """워크플로우 실행 상태 조회 서비스 의존성 (DB 세션 불필요)"""
+    return WorkflowRunStatusService()
+
+
 async def get_graph_service(
     graph_repository: GraphRepository = Depends(get_graph_repository),
 ) -> GraphService:
@@ -0,0 +1,77 @@
+"""
+빠른 JSON 직렬화
+
+orjson 이 설치되어 있으면 사용하고, 없으면 표준 json 으로 동작합니다.
+datetime/date/UUID 는 두 경우 모두 ISO 문자열로 직렬화되므로
+호출 측에서 isoformat() 으로 미리 변환할 필요가 없습니다.
+bytes 는 base64 문자열로 직렬화하며, 변환 규칙이 없는 타입은 TypeError 를 발생시킵니다.
+"""
+
+import base64
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 은 선택 의존성
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """기본 인코더가 처리하지 못하는 값 변환"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"JSON 으로 직렬화할 수 없는 타입입니다: {type(value).__name__}")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(content: Any) -> bytes:
+        """JSON bytes 로 직렬화"""
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+    loads = orjson.loads
+
+else:
+
+    def dumps(content: Any) -> bytes:
+        """JSON bytes 로 직렬화"""
+        return json.dumps(
+            content,
+            default=_default,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+    loads = json.loads
+
+
+class FastJSONResponse(JSONResponse):
+    """dumps 로 직렬화하는 JSON 응답
+
+    엔드포인트에서 이 응답을 직접 반환하면 FastAPI 의 jsonable_encoder 변환 단계도
+    거치지 않습니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,302 @@
+"""
+Prometheus 텍스트 포맷 메트릭
+
+외부 의존성 없이 Counter / Gauge / Histogram 과 스크레이프 시점에 값을 읽는
+collector 를 제공하며, REGISTRY.render() 가 Prometheus 텍스트 포맷(0.0.4)을 만듭니다.
+
+- 라벨 값 조합별 child 는 dict 에 캐시되므로 기록 비용은 dict 조회 + 덧셈입니다.
+- 기록은 이벤트 루프 스레드에서 한다고 가정하며 락을 사용하지 않습니다.
+- 라벨 값은 NodeType, 라우트 템플릿처럼 종류가 제한된 값만 사용해야 합니다
+  (요청 경로, graph_id 등을 라벨로 쓰면 시계열 수가 무한히 늘어남).
+"""
+
+import bisect
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# (metric 이름, 타입, 설명, [(sample 이름, 라벨, 값), ...])
+Sample = Tuple[str, Dict[str, str], float]
+MetricFamily = Tuple[str, str, str, List[Sample]]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape(value: str) -> str:
+    return _escape_help(value).replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+class _Metric(ABC):
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+
+    def labels(self, *values: str):
+        """라벨 값 조합의 child 반환 (라벨 순서대로 전달)"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name}: 라벨 개수가 맞지 않습니다 {values}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    @abstractmethod
+    def _new_child(self):
+        """라벨 값 조합 하나의 값을 담을 child 생성"""
+        pass
+
+    def _label_dict(self, values: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, values))
+
+    @abstractmethod
+    def collect(self) -> MetricFamily:
+        """현재 값을 노출 형식으로 수집"""
+        pass
+
+
+class _ValueChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+
+class Counter(_Metric):
+    """단조 증가 카운터 (이름은 _total 로 끝나도록 작성)"""
+
+    type_name = "counter"
+
+    def _new_child(self):
+        return _ValueChild()
+
+    def inc(self, amount: float = 1.0):
+        self._children[()].inc(amount)
+
+    def collect(self) -> MetricFamily:
+        samples = [
+            (self.name, self._label_dict(values), child.value)
+            for values, child in self._children.items()
+        ]
+        return self.name, self.type_name, self.documentation, samples
+
+
+class Gauge(Counter):
+    """증감 가능한 값"""
+
+    type_name = "gauge"
+
+    def dec(self, amount: float = 1.0):
+        self._children[()].dec(amount)
+
+    def set(self, value: float):
+        self._children[()].set(value)
+
+
+class _HistogramChild:
+    __slots__ = ("upper_bounds", "bucket_counts", "sum", "count")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        self.bucket_counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        # 버킷별 개수만 기록하고 누적(le) 값은 스크레이프 시 계산
+        self.bucket_counts[bisect.bisect_left(self.upper_bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Histogram(_Metric):
+    """버킷 히스토그램 (값은 초 단위 권장)"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.upper_bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.upper_bounds)
+
+    def observe(self, value: float):
+        self._children[()].observe(value)
+
+    def collect(self) -> MetricFamily:
+        samples: List[Sample] = []
+        for values, child in self._children.items():
+            labels = self._label_dict(values)
+            cumulative = 0
+            for bound, count in zip(
+                (*self.upper_bounds, math.inf), child.bucket_counts
+            ):
+                cumulative += count
+                samples.append(
+                    (
+                        f"{self.name}_bucket",
+                        {**labels, "le": _format_value(bound)},
+                        cumulative,
+                    )
+                )
+            samples.append((f"{self.name}_sum", labels, child.sum))
+            samples.append((f"{self.name}_count", labels, child.count))
+        return self.name, self.type_name, self.documentation, samples
+
+
+class MetricsRegistry:
+    """메트릭/collector 목록과 텍스트 포맷 출력"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[MetricFamily]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 메트릭: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[MetricFamily]]):
+        """스크레이프 시점에 호출되어 MetricFamily 들을 반환하는 함수 등록"""
+        self._collectors.append(collector)
+        return collector
+
+    def collect(self) -> List[MetricFamily]:
+        families = [metric.collect() for metric in self._metrics.values()]
+        for collector in self._collectors:
+            families.extend(collector())
+        return families
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for name, type_name, documentation, samples in self.collect():
+            lines.append(f"# HELP {name} {_escape_help(documentation)}")
+            lines.append(f"# TYPE {name} {type_name}")
+            for sample_name, labels, value in samples:
+                lines.append(
+                    f"{sample_name}{_format_labels(labels)} {_format_value(value)}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests_total",
+    "HTTP 요청 수",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (응답 본문 전송 완료까지)",
+    ("method", "route"),
+)
+
+
+class MetricsMiddleware:
+    """엔드포인트(라우트 템플릿)별 요청 수/처리 시간 기록
+
+    라벨에는 실제 경로 대신 매칭된 라우트 템플릿(/workflows/{graph_id})을 사용하고,
+    매칭되지 않은 요청은 route="unmatched" 로 묶습니다.
+    """
+
+    def __init__(self, app: ASGIApp, excluded_paths: Sequence[str] = ("/metrics",)):
+        self.app = app
+        self.excluded_paths = frozenset(excluded_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # 라우팅 후 scope 에 매칭된 route 가 기록됨
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            HTTP_REQUESTS.labels(method, route_path, str(status_code)).inc()
+            HTTP_REQUEST_DURATION.labels(method, route_path).observe(
+                time.perf_counter() - started
+            )
@@ -0,0 +1,52 @@
+"""
+NDJSON(줄 단위 JSON) 스트림 처리
+
+대용량 워크플로우를 한 번에 메모리에 올리지 않고 줄 단위로 읽고 쓰기 위해 사용합니다.
+"""
+
+from typing import Any, AsyncIterable, AsyncIterator
+
+from helpers.utils.json_response import dumps, loads
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# 한 줄(레코드)의 최대 크기
+MAX_LINE_SIZE = 16 * 1024 * 1024
+
+
+class NDJSONError(ValueError):
+    """잘못된 NDJSON 입력"""
+
+
+def encode_line(record: Any) -> bytes:
+    return dumps(record) + b"\n"
+
+
+async def iter_ndjson(
+    chunks: AsyncIterable[bytes], max_line_size: int = MAX_LINE_SIZE
+) -> AsyncIterator[Any]:
+    """바이트 청크 스트림을 점진적으로 파싱해 레코드 단위로 반환 (빈 줄은 무시)"""
+    buffer = b""
+    line_number = 0
+    async for chunk in chunks:
+        buffer += chunk
+        if b"\n" not in chunk:
+            if len(buffer) > max_line_size:
+                raise NDJSONError(f"{line_number + 1}번째 줄이 너무 깁니다")
+            continue
+        *lines, buffer = buffer.split(b"\n")
+        if len(buffer) > max_line_size:
+            raise NDJSONError(f"{line_number + len(lines) + 1}번째 줄이 너무 깁니다")
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield _parse(line, line_number)
+    if buffer.strip():
+        yield _parse(buffer, line_number + 1)
+
+
+def _parse(line: bytes, line_number: int) -> Any:
+    try:
+        return loads(line)
+    except ValueError as e:
+        raise NDJSONError(f"{line_number}번째 줄 JSON 파싱 실패: {e}")
@@ -0,0 +1,86 @@
+"""
+요청/응답 콘텐츠 협상 (JSON / MessagePack)
+
+NegotiatingRoute 를 라우터의 route_class 로 지정하면
+
+- `Content-Type: application/msgpack` 요청 본문을 디코딩해 JSON 본문과 똑같이
+  pydantic 모델로 검증합니다. 바이너리 워크플로우 포맷 문서는 워크플로우 생성 요청
+  형식으로 펼쳐집니다.
+- JSON 본문은 orjson(설치된 경우)으로 파싱합니다.
+"""
+
+from typing import Any, Callable
+
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+
+from helpers.utils import workflow_codec
+from helpers.utils.json_response import FastJSONResponse, loads
+
+_MSGPACK_SCOPE_KEY = "workflow.msgpack_body"
+
+
+class MsgPackResponse(Response):
+    media_type = workflow_codec.MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return workflow_codec.packb(content)
+
+
+class NegotiatingRequest(Request):
+    """msgpack 본문을 JSON 본문처럼 다루는 Request"""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            body = await self.body()
+            if self.scope.get(_MSGPACK_SCOPE_KEY):
+                document = workflow_codec.unpackb(body)
+                if workflow_codec.is_encoded_workflow(document):
+                    document = workflow_codec.expand_workflow(document)
+                self._json = document
+            else:
+                self._json = loads(body)
+        return self._json
+
+
+class NegotiatingRoute(APIRoute):
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def negotiating_handler(request: Request) -> Response:
+            scope = request.scope
+            content_type = request.headers.get("content-type")
+            if workflow_codec.is_msgpack(content_type):
+                if not workflow_codec.is_available():
+                    raise HTTPException(
+                        status_code=415, detail="msgpack 본문을 지원하지 않습니다"
+                    )
+                # FastAPI 가 본문을 json() 으로 읽도록 content-type 을 바꾸고 원래 형식을 표시
+                scope = {
+                    **scope,
+                    "headers": [
+                        (key, value)
+                        for key, value in scope["headers"]
+                        if key != b"content-type"
+                    ]
+                    + [(b"content-type", b"application/json")],
+                    _MSGPACK_SCOPE_KEY: True,
+                }
+            try:
+                return await handler(NegotiatingRequest(scope, request.receive))
+            except workflow_codec.WorkflowCodecError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+        return negotiating_handler
+
+
+def negotiated_response(
+    content: Any, accept: str | None, **kwargs: Any
+) -> FastJSONResponse | MsgPackResponse:
+    """Accept 헤더에 따라 JSON 또는 msgpack 응답 생성"""
+    headers = {**(kwargs.pop("headers", None) or {}), "Vary": "Accept"}
+    if workflow_codec.prefers_msgpack(accept):
+        return MsgPackResponse(content, headers=headers, **kwargs)
+    return FastJSONResponse(content, headers=headers, **kwargs)
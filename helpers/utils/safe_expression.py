@@ -0,0 +1,298 @@
+"""
+제한된 조건식 컴파일러
+
+조건식을 한 번만 파싱하여 허용된 AST 노드만으로 구성된 클로저 트리로 컴파일합니다.
+`eval` 을 사용하지 않으며, 변수는 문자열 치환이 아닌 이름 바인딩으로 전달됩니다.
+"""
+
+import ast
+import operator
+from functools import lru_cache
+from typing import Any, Callable, Dict, Mapping
+
+Evaluator = Callable[[Mapping[str, Any]], Any]
+
+MAX_EXPRESSION_LENGTH = 1000
+# 시퀀스 반복(*) 결과의 최대 길이 (문자/바이트/요소 수)
+MAX_SEQUENCE_RESULT_SIZE = 100_000
+
+_COMPARE_OPERATORS: Dict[type, Callable[[Any, Any], bool]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+    ast.In: lambda left, right: left in right,
+    ast.NotIn: lambda left, right: left not in right,
+}
+
+_BINARY_OPERATORS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: lambda left, right: _safe_mult(left, right),
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: lambda left, right: _safe_mod(left, right),
+}
+
+_UNARY_OPERATORS: Dict[type, Callable[[Any], Any]] = {
+    ast.Not: operator.not_,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+# 조건식에서 호출 가능한 함수 목록
+SAFE_FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "len": len,
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "abs": abs,
+    "min": min,
+    "max": max,
+    "round": round,
+    "any": any,
+    "all": all,
+}
+
+# 문자열 값에서 호출 가능한 메서드 목록 (예: value.startswith("a"))
+SAFE_METHODS = frozenset(
+    {
+        "lower",
+        "upper",
+        "strip",
+        "lstrip",
+        "rstrip",
+        "startswith",
+        "endswith",
+        "isdigit",
+        "isalpha",
+        "get",
+        "keys",
+        "values",
+    }
+)
+
+
+class ExpressionError(ValueError):
+    """허용되지 않거나 잘못된 조건식"""
+
+
+class CompiledExpression:
+    """컴파일된 조건식"""
+
+    __slots__ = ("source", "_evaluator")
+
+    def __init__(self, source: str, evaluator: Evaluator):
+        self.source = source
+        self._evaluator = evaluator
+
+    def evaluate(self, variables: Mapping[str, Any]) -> Any:
+        """바인딩된 변수로 조건식 평가"""
+        return self._evaluator(variables)
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.source!r})"
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(source: str) -> CompiledExpression:
+    """조건식을 파싱/검증하여 평가 함수로 컴파일 (소스 문자열 기준 캐시)"""
+    if not isinstance(source, str) or not source.strip():
+        raise ExpressionError("조건식이 비어 있습니다")
+    if len(source) > MAX_EXPRESSION_LENGTH:
+        raise ExpressionError(f"조건식이 너무 깁니다 (최대 {MAX_EXPRESSION_LENGTH}자)")
+
+    try:
+        tree = ast.parse(source.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ExpressionError(f"조건식 문법 오류: {e.msg}") from e
+
+    return CompiledExpression(source, _compile_node(tree.body))
+
+
+def _compile_node(node: ast.AST) -> Evaluator:
+    """AST 노드를 평가 클로저로 변환"""
+    if isinstance(node, ast.Constant):
+        constant = node.value
+        return lambda variables: constant
+
+    if isinstance(node, ast.Name):
+        name = node.id
+        if name in SAFE_FUNCTIONS:
+            raise ExpressionError(f"함수는 호출 형태로만 사용할 수 있습니다: {name}")
+
+        def _lookup(variables: Mapping[str, Any]) -> Any:
+            try:
+                return variables[name]
+            except KeyError:
+                raise ExpressionError(f"정의되지 않은 변수: {name}") from None
+
+        return _lookup
+
+    if isinstance(node, ast.BoolOp):
+        operands = [_compile_node(value) for value in node.values]
+        if isinstance(node.op, ast.And):
+
+            def _and(variables: Mapping[str, Any]) -> Any:
+                result: Any = True
+                for operand in operands:
+                    result = operand(variables)
+                    if not result:
+                        return result
+                return result
+
+            return _and
+
+        def _or(variables: Mapping[str, Any]) -> Any:
+            result: Any = False
+            for operand in operands:
+                result = operand(variables)
+                if result:
+                    return result
+            return result
+
+        return _or
+
+    if isinstance(node, ast.Compare):
+        left = _compile_node(node.left)
+        comparisons = [
+            (_lookup_operator(_COMPARE_OPERATORS, op), _compile_node(comparator))
+            for op, comparator in zip(node.ops, node.comparators)
+        ]
+
+        def _compare(variables: Mapping[str, Any]) -> bool:
+            current = left(variables)
+            for compare, right in comparisons:
+                value = right(variables)
+                if not compare(current, value):
+                    return False
+                current = value
+            return True
+
+        return _compare
+
+    if isinstance(node, ast.UnaryOp):
+        unary = _lookup_operator(_UNARY_OPERATORS, node.op)
+        operand = _compile_node(node.operand)
+        return lambda variables: unary(operand(variables))
+
+    if isinstance(node, ast.BinOp):
+        binary = _lookup_operator(_BINARY_OPERATORS, node.op)
+        left_operand = _compile_node(node.left)
+        right_operand = _compile_node(node.right)
+        return lambda variables: binary(
+            left_operand(variables), right_operand(variables)
+        )
+
+    if isinstance(node, ast.IfExp):
+        test = _compile_node(node.test)
+        body = _compile_node(node.body)
+        orelse = _compile_node(node.orelse)
+        return lambda variables: (
+            body(variables) if test(variables) else orelse(variables)
+        )
+
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        elements = [_compile_node(element) for element in node.elts]
+        container: Callable[[Any], Any] = {
+            ast.List: list,
+            ast.Tuple: tuple,
+            ast.Set: set,
+        }[type(node)]
+        return lambda variables: container(element(variables) for element in elements)
+
+    if isinstance(node, ast.Dict):
+        if any(key is None for key in node.keys):
+            raise ExpressionError("딕셔너리 언패킹(**)은 지원하지 않습니다")
+        keys = [_compile_node(key) for key in node.keys if key is not None]
+        values = [_compile_node(value) for value in node.values]
+        return lambda variables: {
+            key(variables): value(variables) for key, value in zip(keys, values)
+        }
+
+    if isinstance(node, ast.Subscript):
+        target = _compile_node(node.value)
+        if isinstance(node.slice, ast.Slice):
+            lower = _compile_optional(node.slice.lower)
+            upper = _compile_optional(node.slice.upper)
+            step = _compile_optional(node.slice.step)
+            return lambda variables: target(variables)[
+                lower(variables) : upper(variables) : step(variables)
+            ]
+        index = _compile_node(node.slice)
+        return lambda variables: target(variables)[index(variables)]
+
+    if isinstance(node, ast.Call):
+        return _compile_call(node)
+
+    raise ExpressionError(f"허용되지 않는 표현식입니다: {type(node).__name__}")
+
+
+def _compile_call(node: ast.Call) -> Evaluator:
+    """허용된 함수/메서드 호출 컴파일"""
+    if node.keywords:
+        raise ExpressionError("키워드 인자는 지원하지 않습니다")
+    if any(isinstance(arg, ast.Starred) for arg in node.args):
+        raise ExpressionError("인자 언패킹(*)은 지원하지 않습니다")
+
+    args = [_compile_node(arg) for arg in node.args]
+
+    if isinstance(node.func, ast.Name):
+        function = SAFE_FUNCTIONS.get(node.func.id)
+        if function is None:
+            raise ExpressionError(f"허용되지 않는 함수입니다: {node.func.id}")
+        return lambda variables: function(*(arg(variables) for arg in args))
+
+    if isinstance(node.func, ast.Attribute):
+        method_name = node.func.attr
+        if method_name not in SAFE_METHODS:
+            raise ExpressionError(f"허용되지 않는 메서드입니다: {method_name}")
+        target = _compile_node(node.func.value)
+        return lambda variables: getattr(target(variables), method_name)(
+            *(arg(variables) for arg in args)
+        )
+
+    raise ExpressionError("허용되지 않는 호출 형태입니다")
+
+
+def _safe_mult(left: Any, right: Any) -> Any:
+    """시퀀스 반복으로 인한 과도한 메모리 할당 방지
+
+    반복 횟수만 제한하면 반복 결과를 다시 반복해 크기가 곱으로 커지므로,
+    결과 길이(len(sequence) * count)를 계산해 미리 제한합니다.
+    """
+    for sequence, count in ((left, right), (right, left)):
+        if (
+            isinstance(sequence, (str, bytes, list, tuple))
+            and isinstance(count, int)
+            and len(sequence) * count > MAX_SEQUENCE_RESULT_SIZE
+        ):
+            raise ExpressionError("시퀀스 반복 결과가 너무 큽니다")
+    return left * right
+
+
+def _safe_mod(left: Any, right: Any) -> Any:
+    """문자열 % 포매팅 금지 ('%0300000000d' % 1 처럼 결과 크기를 제한할 수 없음)"""
+    if isinstance(left, (str, bytes)):
+        raise ExpressionError("문자열 % 포매팅은 지원하지 않습니다")
+    return left % right
+
+
+def _compile_optional(node: ast.AST | None) -> Evaluator:
+    if node is None:
+        return lambda variables: None
+    return _compile_node(node)
+
+
+def _lookup_operator(table: Dict[type, Any], op: ast.AST) -> Any:
+    try:
+        return table[type(op)]
+    except KeyError:
+        raise ExpressionError(
+            f"허용되지 않는 연산자입니다: {type(op).__name__}"
+        ) from None
@@ -0,0 +1,409 @@
+"""
+실행 추적 (trace span)
+
+워크플로우 실행 1회를 하나의 trace 로, 노드 실행 / DB 로드·저장 / 외부 HTTP·LLM 호출을
+그 하위 span 으로 기록합니다. 현재 span 은 contextvar 로 전달되므로 async 코드에서도
+별도 인자 없이 부모-자식 관계가 유지됩니다.
+
+- span id 와 traceparent 헤더는 W3C Trace Context 형식이라 OpenTelemetry 를 쓰는
+  다른 서비스와 trace 를 이어 볼 수 있습니다.
+- 끝난 span 은 BatchSpanProcessor 가 큐에 넣고 백그라운드 스레드에서 모아 내보내므로
+  실행 경로에서 파일/네트워크 I/O 를 기다리지 않습니다.
+- 내보내기: TRACING_EXPORTER=file (JSON Lines) | otlp (OTLP/HTTP JSON, 수집기 /v1/traces)
+  설정하지 않으면 span 은 만들어지지만 (traceparent 전파용) 내보내지 않습니다.
+"""
+
+import json
+import os
+import queue
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, MutableMapping, Sequence
+
+from setting.logger import get_logger
+
+logger = get_logger(__name__)
+
+TRACEPARENT_HEADER = "traceparent"
+
+SPAN_KIND_INTERNAL = "internal"
+SPAN_KIND_CLIENT = "client"
+
+# OTLP JSON 의 SpanKind 값
+_OTLP_SPAN_KINDS = {SPAN_KIND_INTERNAL: 1, SPAN_KIND_CLIENT: 3}
+
+
+@dataclass(slots=True)
+class Span:
+    """추적 구간 (시각은 epoch ns, 소요 시간은 단조 시계 기준)"""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None = None
+    kind: str = SPAN_KIND_INTERNAL
+    start_time_ns: int = 0
+    end_time_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"  # ok, error
+    status_message: str | None = None
+    _start_perf_ns: int = 0
+
+    @property
+    def duration(self) -> float:
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        self.attributes.update(attributes)
+
+    def record_error(self, error: BaseException):
+        self.status = "error"
+        self.status_message = str(error)
+        self.attributes["error.type"] = type(error).__name__
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "kind": self.kind,
+            "start_time_ns": self.start_time_ns,
+            "end_time_ns": self.end_time_ns,
+            "duration": self.duration,
+            "attributes": self.attributes,
+            "status": self.status,
+            "status_message": self.status_message,
+        }
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+def inject_traceparent(headers: MutableMapping[str, str] | None = None):
+    """현재 span 의 traceparent 를 헤더에 추가 (span 밖이면 그대로 반환)"""
+    headers = {} if headers is None else headers
+    span = _current_span.get()
+    if span is not None:
+        headers[TRACEPARENT_HEADER] = span.traceparent
+    return headers
+
+
+def parse_traceparent(value: str | None) -> tuple[str, str] | None:
+    """traceparent 헤더에서 (trace_id, parent span_id) 추출"""
+    if not value:
+        return None
+    parts = value.strip().split("-")
+    if len(parts) < 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    return parts[1], parts[2]
+
+
+class SpanExporter(ABC):
+    """끝난 span 목록을 내보내는 인터페이스 (백그라운드 스레드에서 호출)"""
+
+    @abstractmethod
+    def export(self, spans: Sequence[Span]):
+        """span 목록 내보내기"""
+        pass
+
+    def shutdown(self):
+        """종료 시 자원 정리 (필요한 exporter 만 재정의)"""
+        pass
+
+
+class FileSpanExporter(SpanExporter):
+    """span 을 JSON Lines 파일로 기록"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def export(self, spans: Sequence[Span]):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for span in spans:
+                f.write(json.dumps(span.to_dict(), ensure_ascii=False, default=str))
+                f.write("\n")
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp_json(spans: Sequence[Span], service_name: str) -> Dict[str, Any]:
+    """OTLP/HTTP JSON (ExportTraceServiceRequest) 형식으로 변환"""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {
+                            "key": "service.name",
+                            "value": {"stringValue": service_name},
+                        }
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "workflow-engine"},
+                        "spans": [
+                            {
+                                "traceId": span.trace_id,
+                                "spanId": span.span_id,
+                                "parentSpanId": span.parent_id or "",
+                                "name": span.name,
+                                "kind": _OTLP_SPAN_KINDS.get(span.kind, 1),
+                                "startTimeUnixNano": str(span.start_time_ns),
+                                "endTimeUnixNano": str(span.end_time_ns),
+                                "attributes": [
+                                    {"key": key, "value": _otlp_value(value)}
+                                    for key, value in span.attributes.items()
+                                ],
+                                "status": (
+                                    {"code": 2, "message": span.status_message or ""}
+                                    if span.status == "error"
+                                    else {"code": 1}
+                                ),
+                            }
+                            for span in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class OTLPJsonExporter(SpanExporter):
+    """OTLP/HTTP JSON 으로 수집기(collector)에 전송"""
+
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 5.0):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+
+    def export(self, spans: Sequence[Span]):
+        import requests  # type: ignore
+
+        response = requests.post(
+            self.endpoint,
+            json=to_otlp_json(spans, self.service_name),
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+
+
+class SimpleSpanProcessor:
+    """span 이 끝날 때마다 바로 내보냄 (테스트/디버깅용)"""
+
+    def __init__(self, exporter: SpanExporter):
+        self.exporter = exporter
+
+    def on_end(self, span: Span):
+        try:
+            self.exporter.export([span])
+        except Exception as e:
+            logger.error(f"span 내보내기 실패: {e}", exc_info=True)
+
+    def force_flush(self):
+        pass
+
+    def shutdown(self):
+        self.exporter.shutdown()
+
+
+_STOP = object()
+
+
+class BatchSpanProcessor:
+    """span 을 큐에 모았다가 백그라운드 스레드에서 배치로 내보냄
+
+    큐가 가득 차면 span 을 버리고 dropped 로 집계합니다 (실행 경로를 막지 않음).
+    flush/종료 요청도 같은 큐로 전달하므로 요청 전에 끝난 span 은 모두 내보내집니다.
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        max_batch_size: int = 512,
+        schedule_delay: float = 1.0,
+        max_queue_size: int = 8192,
+    ):
+        self.exporter = exporter
+        self.max_batch_size = max_batch_size
+        self.schedule_delay = schedule_delay
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(max_queue_size)
+        self._thread = threading.Thread(
+            target=self._worker, name="span-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def on_end(self, span: Span):
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def force_flush(self, timeout: float = 5.0) -> bool:
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def shutdown(self, timeout: float = 5.0):
+        if self._thread.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                pass
+            self._thread.join(timeout)
+        self.exporter.shutdown()
+
+    def _worker(self):
+        batch: List[Span] = []
+        deadline = time.monotonic() + self.schedule_delay
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, Span):
+                batch.append(item)
+                if len(batch) < self.max_batch_size and time.monotonic() < deadline:
+                    continue
+            self._export(batch)
+            batch = []
+            deadline = time.monotonic() + self.schedule_delay
+
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is _STOP:
+                return
+
+    def _export(self, batch: List[Span]):
+        if not batch:
+            return
+        try:
+            self.exporter.export(batch)
+        except Exception as e:
+            logger.error(f"span 내보내기 실패 ({len(batch)}개): {e}", exc_info=True)
+
+
+class Tracer:
+    """span 생성 및 현재 span 관리"""
+
+    def __init__(self, processor: SimpleSpanProcessor | BatchSpanProcessor | None):
+        self.processor = processor
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        attributes: Dict[str, Any] | None = None,
+        kind: str = SPAN_KIND_INTERNAL,
+        traceparent: str | None = None,
+    ) -> Iterator[Span]:
+        """현재 span 의 자식 span 시작 (현재 span 이 없으면 새 trace 또는 traceparent 이어받기)"""
+        parent = _current_span.get()
+        if parent is not None:
+            trace_id, parent_id = parent.trace_id, parent.span_id
+        else:
+            trace_id, parent_id = parse_traceparent(traceparent) or (
+                f"{random.getrandbits(128):032x}",
+                None,
+            )
+        span = Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_id=parent_id,
+            kind=kind,
+            start_time_ns=time.time_ns(),
+            attributes=dict(attributes) if attributes else {},
+            _start_perf_ns=time.perf_counter_ns(),
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_time_ns = span.start_time_ns + (
+                time.perf_counter_ns() - span._start_perf_ns
+            )
+            if self.processor is not None:
+                self.processor.on_end(span)
+
+    def shutdown(self):
+        if self.processor is not None:
+            self.processor.shutdown()
+
+
+_tracer: Tracer | None = None
+
+
+def _create_processor(config) -> BatchSpanProcessor | None:
+    exporter_name = (config.TRACING_EXPORTER or "").lower()
+    if not exporter_name:
+        return None
+    if exporter_name == "file":
+        exporter: SpanExporter = FileSpanExporter(config.TRACING_FILE_PATH)
+    elif exporter_name == "otlp":
+        exporter = OTLPJsonExporter(
+            config.TRACING_OTLP_ENDPOINT, config.TRACING_SERVICE_NAME
+        )
+    else:
+        raise ValueError(f"지원하지 않는 TRACING_EXPORTER: {config.TRACING_EXPORTER}")
+    return BatchSpanProcessor(exporter)
+
+
+def get_tracer() -> Tracer:
+    """설정값 기반 전역 tracer"""
+    global _tracer
+    if _tracer is None:
+        from setting.config import get_config
+
+        _tracer = Tracer(_create_processor(get_config()))
+    return _tracer
+
+
+def set_tracer(tracer: Tracer | None):
+    """전역 tracer 교체 (None 이면 다음 get_tracer() 에서 설정값으로 다시 생성)"""
+    global _tracer
+    _tracer = tracer
+
+
+def shutdown_tracer():
+    """남은 span 을 내보내고 종료"""
+    if _tracer is not None:
+        _tracer.shutdown()
@@ -0,0 +1,189 @@
+"""
+워크플로우 바이너리 포맷 (MessagePack)
+
+그래프 + 버텍스 + 엣지 정의를 JSON 보다 작고 빠르게 직렬화합니다.
+
+    {
+        "v": 1,
+        "graph": {"id", "name", "description", "properties"},
+        "types": ["TEXT_INPUT", "default", ...],     # 노드/엣지 타입 문자열 테이블
+        "vertices": [[id, type_index, properties], ...],
+        "edges": [[source_index, target_index, type_index, properties], ...],
+    }
+
+- 타입 문자열은 한 번만 저장하고 인덱스로 참조합니다.
+- 엣지의 source/target 은 버텍스 id 대신 vertices 배열의 위치를 저장합니다.
+- 생성/조회 타임스탬프는 포함하지 않습니다 (정의만 표현).
+
+msgpack 이 설치되어 있지 않으면 is_available() 이 False 이며,
+이 경우 API 는 JSON 으로만 응답합니다.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from database.graph.edge import Edge
+from database.graph.graph import Graph
+from database.graph.vertex import Vertex
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack 은 선택 의존성
+    msgpack = None
+
+FORMAT_VERSION = 1
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = (
+    "application/msgpack",
+    "application/x-msgpack",
+    "application/vnd.msgpack",
+)
+
+
+class WorkflowCodecError(ValueError):
+    """바이너리 워크플로우 디코딩 실패"""
+
+
+def is_available() -> bool:
+    return msgpack is not None
+
+
+def is_msgpack(media_type: str | None) -> bool:
+    if not media_type:
+        return False
+    return media_type.split(";")[0].strip().lower() in MSGPACK_MEDIA_TYPES
+
+
+def prefers_msgpack(accept: str | None) -> bool:
+    """Accept 헤더가 JSON 보다 msgpack 을 우선하는지"""
+    if not accept or not is_available():
+        return False
+    best_quality = {"msgpack": 0.0, "json": 0.0}
+    for item in accept.split(","):
+        media_type, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if is_msgpack(media_type):
+            best_quality["msgpack"] = max(best_quality["msgpack"], quality)
+        elif media_type.strip().lower() in ("application/json", "*/*"):
+            best_quality["json"] = max(best_quality["json"], quality)
+    return (
+        best_quality["msgpack"] > 0 and best_quality["msgpack"] >= best_quality["json"]
+    )
+
+
+def packb(content: Any) -> bytes:
+    return msgpack.packb(content, use_bin_type=True)
+
+
+def unpackb(data: bytes) -> Any:
+    try:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+    except Exception as e:
+        raise WorkflowCodecError(f"msgpack 디코딩 실패: {e}")
+
+
+def encode_workflow(graph: Graph, vertices: List[Vertex], edges: List[Edge]) -> bytes:
+    """워크플로우를 바이너리 포맷으로 직렬화"""
+    types: List[str] = []
+    type_index: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        index = type_index.get(value)
+        if index is None:
+            index = type_index[value] = len(types)
+            types.append(value)
+        return index
+
+    vertex_index = {vertex.id: index for index, vertex in enumerate(vertices)}
+    vertex_rows = [
+        [vertex.id, intern(vertex.type), vertex.properties] for vertex in vertices
+    ]
+    edge_rows = []
+    for edge in edges:
+        try:
+            source, target = vertex_index[edge.source_id], vertex_index[edge.target_id]
+        except KeyError as e:
+            raise WorkflowCodecError(f"그래프에 없는 버텍스를 참조하는 엣지: {e}")
+        edge_rows.append([source, target, intern(edge.type), edge.properties])
+
+    return packb(
+        {
+            "v": FORMAT_VERSION,
+            "graph": {
+                "id": graph.id,
+                "name": graph.name,
+                "description": graph.description,
+                "properties": graph.properties,
+            },
+            "types": types,
+            "vertices": vertex_rows,
+            "edges": edge_rows,
+        }
+    )
+
+
+def is_encoded_workflow(document: Any) -> bool:
+    return isinstance(document, dict) and "v" in document and "types" in document
+
+
+def expand_workflow(document: Dict[str, Any]) -> Dict[str, Any]:
+    """바이너리 포맷 문서를 워크플로우 생성 요청 형식으로 변환
+
+    엣지의 source/target 은 버텍스 id 로 복원됩니다.
+    """
+    try:
+        if document["v"] != FORMAT_VERSION:
+            raise WorkflowCodecError(f"지원하지 않는 포맷 버전: {document['v']}")
+        types = document["types"]
+        graph = document.get("graph", {})
+        vertices, edges = _expand_elements(
+            types, document["vertices"], document["edges"]
+        )
+    except WorkflowCodecError:
+        raise
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        raise WorkflowCodecError(f"잘못된 워크플로우 포맷: {e}")
+
+    return {
+        "name": graph.get("name", ""),
+        "description": graph.get("description", ""),
+        "properties": graph.get("properties", {}),
+        "vertices": vertices,
+        "edges": edges,
+    }
+
+
+def decode_workflow(data: bytes) -> Dict[str, Any]:
+    """바이너리 워크플로우를 생성 요청 형식(dict)으로 디코딩"""
+    document = unpackb(data)
+    if not is_encoded_workflow(document):
+        raise WorkflowCodecError("워크플로우 포맷이 아닙니다")
+    return expand_workflow(document)
+
+
+def _expand_elements(
+    types: List[str], vertex_rows: List[list], edge_rows: List[list]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    vertices = [
+        {"id": vertex_id, "type": types[type_index], "properties": properties}
+        for vertex_id, type_index, properties in vertex_rows
+    ]
+    edges = []
+    for source, target, type_index, properties in edge_rows:
+        if not (0 <= source < len(vertices) and 0 <= target < len(vertices)):
+            raise WorkflowCodecError(f"잘못된 버텍스 인덱스: {source}, {target}")
+        edges.append(
+            {
+                "source_id": vertices[source]["id"],
+                "target_id": vertices[target]["id"],
+                "type": types[type_index],
+                "properties": properties,
+            }
+        )
+    return vertices, edges
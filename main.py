@@ -5,16 +5,54 @@ from contextlib import asynccontextmanager
 import uvicorn
 from fastapi import FastAPI
 
-from database.setup import create_tables, validate
+from database.setup import AsyncSessionLocal, create_tables, dispose_engine, validate
+from helpers.engine.run_state_store import set_run_state_store
+from helpers.utils.code_sandbox import get_sandbox_pool, shutdown_sandbox_pool
+from helpers.utils.compression import CompressionMiddleware
+from helpers.utils.json_response import FastJSONResponse
+from helpers.utils.metrics import MetricsMiddleware
+from helpers.utils.tracing import shutdown_tracer
+from routers.v1.blob.blob_router import router as blob_router
 from routers.v1.graph.workflow_router import router as workflow_router
+from routers.v1.system.metrics_router import router as metrics_router
+from routers.v1.system.system_router import router as system_router
+from services.workflow.run_history import PersistentRunStateStore, RunHistoryWriter
+from setting.config import get_config
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    config = get_config()
     # 서버 시작 시 테이블 생성
     await create_tables()
+    # FUNCTION 노드 샌드박스 모드 사용 시 워커 프로세스 사전 기동
+    if config.FUNCTION_EXECUTION_MODE == "sandbox":
+        await asyncio.to_thread(get_sandbox_pool().warm_up)
+    # 실행 이력을 DB 에 배치 기록하는 실행 상태 저장소 사용
+    run_history_writer = None
+    if config.RUN_HISTORY_ENABLED:
+        run_history_writer = RunHistoryWriter(
+            AsyncSessionLocal,
+            batch_size=config.RUN_HISTORY_BATCH_SIZE,
+            flush_interval=config.RUN_HISTORY_FLUSH_INTERVAL,
+            max_pending=config.RUN_HISTORY_MAX_PENDING,
+        )
+        run_history_writer.start()
+        set_run_state_store(
+            PersistentRunStateStore(
+                run_history_writer,
+                AsyncSessionLocal,
+                max_runs=config.RUN_STATE_MAX_RUNS,
+            )
+        )
+    app.state.run_history_writer = run_history_writer
     yield
     # 서버 종료 시 정리 작업 (필요한 경우)
+    if run_history_writer is not None:
+        await run_history_writer.stop()
+    shutdown_sandbox_pool()
+    shutdown_tracer()
+    await dispose_engine()
 
 
 app = FastAPI(
@@ -46,11 +84,22 @@ app = FastAPI(
         "url": "https://opensource.org/licenses/MIT",
     },
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
 )
 
+config = get_config()
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=config.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=config.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=config.COMPRESSION_BROTLI_QUALITY,
+)
+# 압축 바깥에서 측정해 응답 압축/전송 시간까지 요청 처리 시간에 포함
+app.add_middleware(MetricsMiddleware)
+
 
 @app.get("/")
 def read_root():
@@ -63,6 +112,9 @@ def read_root():
 
 # 워크플로우 라우터 추가
 app.include_router(workflow_router)
+app.include_router(system_router)
+app.include_router(metrics_router)
+app.include_router(blob_router)
 
 if __name__ == "__main__":
 
@@ -1,4 +1,7 @@
-from sqlalchemy import select
+from typing import AsyncIterator, List, Sequence
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.graph.edge import Edge
@@ -6,6 +9,9 @@ from setting.logger import get_logger
 
 logger = get_logger(__name__)
 
+# asyncpg 의 statement 당 바인드 파라미터 상한
+MAX_BIND_PARAMS = 32767
+
 
 class EdgeRepository:
     def __init__(self, db: AsyncSession):
@@ -17,6 +23,23 @@ class EdgeRepository:
         logger.info(f"Edge created: {edge}")
         return edge
 
+    async def bulk_create_edges(self, edges: List[Edge]) -> List[int]:
+        """Edge 일괄 생성 (multi-row INSERT ... RETURNING id, 입력 순서대로 id 반환)"""
+        if not edges:
+            return []
+
+        rows = [edge.model_dump(exclude={"id"}) for edge in edges]
+        page_size = max(1, MAX_BIND_PARAMS // len(rows[0]))
+        stmt = (
+            insert(Edge)
+            .returning(Edge.id, sort_by_parameter_order=True)
+            .execution_options(insertmanyvalues_page_size=page_size)
+        )
+        result = await self.db.execute(stmt, rows)
+        ids = list(result.scalars().all())
+        logger.info(f"Edge bulk created: {len(ids)}")
+        return ids
+
     async def get_edge(self, edge_id: int):
         result = await self.db.execute(select(Edge).where(Edge.id == edge_id))
         return result.scalar_one_or_none()
@@ -49,3 +72,23 @@ class EdgeRepository:
     async def get_edges_by_graph_id(self, graph_id: int):
         result = await self.db.execute(select(Edge).where(Edge.graph_id == graph_id))
         return result.scalars().all()
+
+    async def stream_edges_by_graph_id(
+        self, graph_id: int, chunk_size: int = 1000
+    ) -> AsyncIterator[Sequence[Row]]:
+        """그래프의 Edge 를 서버 측 커서로 chunk_size 개씩 조회"""
+        stmt = (
+            select(Edge.source_id, Edge.target_id, Edge.type, Edge.properties)
+            .where(Edge.graph_id == graph_id)
+            .order_by(Edge.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self.db.stream(stmt)
+        async for rows in result.partitions():
+            yield rows
+
+    async def delete_edges_by_graph_id(self, graph_id: int) -> int:
+        """그래프의 Edge 일괄 삭제 (커밋은 호출자가 수행)"""
+        result = await self.db.execute(delete(Edge).where(Edge.graph_id == graph_id))
+        logger.info(f"Edges deleted: graph_id={graph_id}, count={result.rowcount}")
+        return result.rowcount
@@ -1,11 +1,34 @@
-from sqlalchemy import select
+import re
+from datetime import datetime
+from typing import List, Sequence, Tuple
+
+from sqlalchemy import (
+    JSON,
+    Integer,
+    String,
+    cast,
+    delete,
+    literal,
+    null,
+    select,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import configure_mappers, make_transient_to_detached
 
+from database.graph.edge import Edge
 from database.graph.graph import Graph
+from database.graph.vertex import Vertex
 from setting.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 목록 조회에서 선택할 수 있는 컬럼 (기본값은 JSON 컬럼 제외)
+GRAPH_FIELDS = ("id", "name", "description", "properties", "created_at", "updated_at")
+GRAPH_LIST_FIELDS = ("id", "name", "description", "created_at", "updated_at")
+
 
 class GraphRepository:
     def __init__(self, db: AsyncSession):
@@ -22,10 +45,53 @@ class GraphRepository:
         result = await self.db.execute(select(Graph).where(Graph.id == graph_id))
         return result.scalar_one_or_none()
 
+    async def get_graph_with_elements(
+        self, graph_id: int
+    ) -> Tuple[Graph | None, List[Vertex], List[Edge]]:
+        """그래프와 버텍스/엣지를 한 번의 쿼리(UNION ALL)로 조회"""
+        result = await self.db.execute(_graph_elements_query(graph_id))
+
+        # 행마다 __init__ 검증을 거치지 않고 ORM 로드와 같은 방식으로 객체 구성
+        configure_mappers()
+        graph = None
+        vertices: List[Vertex] = []
+        edges: List[Edge] = []
+        for row in result:
+            if row.kind == "vertex":
+                vertices.append(_detached(Vertex, row, _VERTEX_COLUMNS))
+            elif row.kind == "edge":
+                edges.append(_detached(Edge, row, _EDGE_COLUMNS))
+            else:
+                graph = _detached(Graph, row, _GRAPH_COLUMNS)
+        return graph, vertices, edges
+
     async def get_graphs(self):
         result = await self.db.execute(select(Graph))
         return result.scalars().all()
 
+    async def get_graph_page(
+        self,
+        limit: int,
+        after: Tuple[datetime, int] | None = None,
+        fields: Sequence[str] = GRAPH_LIST_FIELDS,
+        name_prefix: str | None = None,
+    ) -> Sequence[RowMapping]:
+        """(updated_at, id) 내림차순 keyset 페이지 조회
+
+        after 로 직전 페이지 마지막 행의 (updated_at, id) 를 받아 그 이후 행만
+        조회하고, fields 에 지정된 컬럼만 SELECT 합니다.
+        """
+        columns = [Graph.__table__.c[field] for field in fields]
+        stmt = select(*columns).order_by(Graph.updated_at.desc(), Graph.id.desc())
+        if after is not None:
+            stmt = stmt.where(tuple_(Graph.updated_at, Graph.id) < after)
+        if name_prefix:
+            # 패턴을 하나의 바인드 값으로 넘겨야 플래너가 인덱스 범위로 변환 가능
+            escaped = re.sub(r"([\\%_])", r"\\\1", name_prefix)
+            stmt = stmt.where(Graph.name.like(f"{escaped}%", escape="\\"))
+        result = await self.db.execute(stmt.limit(limit))
+        return result.mappings().all()
+
     async def update_graph(self, graph_id: int, graph: Graph):
         stmt = select(Graph).where(Graph.id == graph_id)
         result = await self.db.execute(stmt)
@@ -45,3 +111,90 @@ class GraphRepository:
             await self.db.commit()
             logger.info(f"Graph deleted: {graph_id}")
         return graph_id
+
+    async def delete_graph_by_id(self, graph_id: int) -> int:
+        """그래프 행 삭제 (커밋은 호출자가 수행)"""
+        result = await self.db.execute(delete(Graph).where(Graph.id == graph_id))
+        return result.rowcount
+
+
+_GRAPH_COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "properties",
+    "execution_plan",
+    "created_at",
+    "updated_at",
+)
+_VERTEX_COLUMNS = ("id", "graph_id", "type", "properties", "created_at", "updated_at")
+_EDGE_COLUMNS = (
+    "id",
+    "graph_id",
+    "source_id",
+    "target_id",
+    "type",
+    "properties",
+    "created_at",
+    "updated_at",
+)
+
+
+def _detached(model, row, columns):
+    """조회 행으로 세션에서 분리된(detached) 모델 인스턴스 생성"""
+    instance = model.__mapper__.class_manager.new_instance()
+    mapping = row._mapping
+    instance.__dict__.update({column: mapping[column] for column in columns})
+    make_transient_to_detached(instance)
+    return instance
+
+
+def _graph_elements_query(graph_id: int):
+    """graph/vertex/edge 행을 공통 컬럼으로 맞춘 UNION ALL 쿼리"""
+    null_int = cast(null(), Integer)
+    null_str = cast(null(), String)
+    null_json = cast(null(), JSON)
+
+    graph_rows = select(
+        literal("graph", String).label("kind"),
+        Graph.id.label("id"),
+        null_int.label("graph_id"),
+        null_int.label("source_id"),
+        null_int.label("target_id"),
+        null_str.label("type"),
+        Graph.name.label("name"),
+        Graph.description.label("description"),
+        Graph.properties.label("properties"),
+        Graph.execution_plan.label("execution_plan"),
+        Graph.created_at.label("created_at"),
+        Graph.updated_at.label("updated_at"),
+    ).where(Graph.id == graph_id)
+    vertex_rows = select(
+        literal("vertex", String),
+        Vertex.id,
+        Vertex.graph_id,
+        null_int,
+        null_int,
+        Vertex.type,
+        null_str,
+        null_str,
+        Vertex.properties,
+        null_json,
+        Vertex.created_at,
+        Vertex.updated_at,
+    ).where(Vertex.graph_id == graph_id)
+    edge_rows = select(
+        literal("edge", String),
+        Edge.id,
+        Edge.graph_id,
+        Edge.source_id,
+        Edge.target_id,
+        Edge.type,
+        null_str,
+        null_str,
+        Edge.properties,
+        null_json,
+        Edge.created_at,
+        Edge.updated_at,
+    ).where(Edge.graph_id == graph_id)
+    return union_all(graph_rows, vertex_rows, edge_rows)
@@ -1,4 +1,7 @@
-from sqlalchemy import select
+from typing import AsyncIterator, List, Sequence
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.graph.vertex import Vertex
@@ -6,6 +9,9 @@ from setting.logger import get_logger
 
 logger = get_logger(__name__)
 
+# asyncpg 의 statement 당 바인드 파라미터 상한
+MAX_BIND_PARAMS = 32767
+
 
 class VertexRepository:
     def __init__(self, db: AsyncSession):
@@ -17,6 +23,23 @@ class VertexRepository:
         logger.info(f"Vertex created: {vertex}")
         return vertex
 
+    async def bulk_create_vertices(self, vertices: List[Vertex]) -> List[int]:
+        """Vertex 일괄 생성 (multi-row INSERT ... RETURNING id, 입력 순서대로 id 반환)"""
+        if not vertices:
+            return []
+
+        rows = [vertex.model_dump(exclude={"id"}) for vertex in vertices]
+        page_size = max(1, MAX_BIND_PARAMS // len(rows[0]))
+        stmt = (
+            insert(Vertex)
+            .returning(Vertex.id, sort_by_parameter_order=True)
+            .execution_options(insertmanyvalues_page_size=page_size)
+        )
+        result = await self.db.execute(stmt, rows)
+        ids = list(result.scalars().all())
+        logger.info(f"Vertex bulk created: {len(ids)}")
+        return ids
+
     async def get_vertex(self, vertex_id: int):
         result = await self.db.execute(select(Vertex).where(Vertex.id == vertex_id))
         return result.scalar_one_or_none()
@@ -51,3 +74,28 @@ class VertexRepository:
             select(Vertex).where(Vertex.graph_id == graph_id)
         )
         return result.scalars().all()
+
+    async def stream_vertices_by_graph_id(
+        self, graph_id: int, chunk_size: int = 1000
+    ) -> AsyncIterator[Sequence[Row]]:
+        """그래프의 Vertex 를 서버 측 커서로 chunk_size 개씩 조회
+
+        ORM 객체 대신 컬럼 튜플을 반환하므로 세션 identity map 에 쌓이지 않음
+        """
+        stmt = (
+            select(Vertex.id, Vertex.type, Vertex.properties)
+            .where(Vertex.graph_id == graph_id)
+            .order_by(Vertex.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self.db.stream(stmt)
+        async for rows in result.partitions():
+            yield rows
+
+    async def delete_vertices_by_graph_id(self, graph_id: int) -> int:
+        """그래프의 Vertex 일괄 삭제 (커밋은 호출자가 수행)"""
+        result = await self.db.execute(
+            delete(Vertex).where(Vertex.graph_id == graph_id)
+        )
+        logger.info(f"Vertexs deleted: graph_id={graph_id}, count={result.rowcount}")
+        return result.rowcount
@@ -0,0 +1,61 @@
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.run.node_run import NodeRun
+from database.run.workflow_run import WorkflowRun
+from repositories.graph.vertex_repository import MAX_BIND_PARAMS
+from setting.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RunHistoryRepository:
+    """워크플로우/노드 실행 이력 저장소 (커밋은 호출 측에서 수행)"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def insert_runs(self, rows: List[Dict[str, Any]]):
+        """WorkflowRun 일괄 생성"""
+        await self._insert_many(WorkflowRun, rows)
+
+    async def insert_node_runs(self, rows: List[Dict[str, Any]]):
+        """NodeRun 일괄 생성"""
+        await self._insert_many(NodeRun, rows)
+
+    async def update_runs(self, rows: List[Dict[str, Any]]):
+        """WorkflowRun 일괄 수정 (각 row 는 id 포함, 기본키 기준 executemany)"""
+        if rows:
+            await self.db.execute(update(WorkflowRun), rows)
+
+    async def get_run(self, run_id: str) -> WorkflowRun | None:
+        result = await self.db.execute(
+            select(WorkflowRun).where(WorkflowRun.id == run_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_latest_run(self, graph_id: int) -> WorkflowRun | None:
+        result = await self.db.execute(
+            select(WorkflowRun)
+            .where(WorkflowRun.graph_id == graph_id)
+            .order_by(WorkflowRun.started_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_node_runs(self, run_id: str) -> Sequence[NodeRun]:
+        result = await self.db.execute(
+            select(NodeRun).where(NodeRun.run_id == run_id).order_by(NodeRun.id)
+        )
+        return result.scalars().all()
+
+    async def _insert_many(self, model, rows: List[Dict[str, Any]]):
+        """multi-row INSERT (모든 row 의 키 구성이 같아야 함)"""
+        if not rows:
+            return
+        page_size = max(1, MAX_BIND_PARAMS // len(rows[0]))
+        stmt = insert(model).execution_options(insertmanyvalues_page_size=page_size)
+        await self.db.execute(stmt, rows)
+        logger.debug(f"{model.__tablename__} bulk created: {len(rows)}")
@@ -0,0 +1,68 @@
+import asyncio
+import os
+from typing import Any, Dict
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse
+
+from helpers.utils.blob_store import (
+    BINARY_MEDIA_TYPE,
+    TEXT_MEDIA_TYPE,
+    get_blob_store,
+)
+from helpers.utils.ndjson import NDJSON_MEDIA_TYPE
+
+router = APIRouter(prefix="/blobs", tags=["blobs"])
+
+# 다운로드 응답에 그대로 쓸 수 있는 Content-Type (그 외는 BINARY_MEDIA_TYPE 으로 응답)
+_DOWNLOAD_MEDIA_TYPES = frozenset(
+    {TEXT_MEDIA_TYPE, BINARY_MEDIA_TYPE, NDJSON_MEDIA_TYPE}
+)
+
+
+@router.post("/", status_code=201)
+async def upload_blob(request: Request) -> Dict[str, Any]:
+    """요청 본문을 blob 으로 저장하고 참조 반환
+
+    본문은 청크 단위로 저장되므로 큰 파일도 메모리에 모두 올리지 않습니다.
+    반환된 참조를 실행 초기 입력의 file 로 넘기면 FILE_INPUT 노드가 사용합니다.
+    파일 쓰기는 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+    """
+    media_type = request.headers.get("content-type") or BINARY_MEDIA_TYPE
+    writer = get_blob_store().writer(media_type)
+    await asyncio.to_thread(writer.__enter__)
+    try:
+        async for chunk in request.stream():
+            if chunk:
+                await asyncio.to_thread(writer.write, chunk)
+    except BaseException as e:
+        # 임시 파일 정리
+        await asyncio.to_thread(writer.__exit__, type(e), e, e.__traceback__)
+        raise
+    await asyncio.to_thread(writer.__exit__, None, None, None)
+    return writer.ref.to_dict()
+
+
+@router.get("/{digest}")
+async def get_blob(digest: str, media_type: str = BINARY_MEDIA_TYPE):
+    """blob 참조({"$blob": "sha256:<digest>"})의 내용 다운로드
+
+    실행 결과에 참조로 담긴 대용량 출력을 가져올 때 사용하며,
+    참조의 media_type 이 텍스트/NDJSON 이면 해당 Content-Type 으로 응답합니다.
+    브라우저가 내용을 HTML 등으로 해석하지 않도록 항상 첨부 파일로 내려보냅니다.
+    """
+    try:
+        path = get_blob_store().path(digest.removeprefix("sha256:"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="blob 을 찾을 수 없습니다")
+    if media_type not in _DOWNLOAD_MEDIA_TYPES:
+        media_type = BINARY_MEDIA_TYPE
+    return FileResponse(
+        path,
+        media_type=media_type,
+        filename=os.path.basename(path),
+        content_disposition_type="attachment",
+        headers={"X-Content-Type-Options": "nosniff"},
+    )
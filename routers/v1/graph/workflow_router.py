@@ -1,6 +1,15 @@
-from typing import Any, Dict, List
-
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, Dict, List, Literal
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
 from database.graph.edge import Edge
 from database.graph.graph import Graph
@@ -10,30 +19,56 @@ from dto.workflow.workflow_dto import (
     WorkflowCreateResponse,
     WorkflowExecuteRequest,
 )
+from helpers.engine.profiler import (
+    PROFILE_MODE_WALL,
+    ProfilerBusyError,
+    ProfilingDisabledError,
+    to_folded,
+)
+from helpers.node.factory import NodeFactory
 from helpers.node.node_base import NodeType
 from helpers.utils.dependencies import (
     get_graph_service,
     get_workflow_execution_service,
     get_workflow_persistence_service,
+    get_workflow_run_status_service,
 )
-from services.graph.graph_service import GraphService
+from helpers.utils.json_response import FastJSONResponse
+from helpers.utils.ndjson import NDJSON_MEDIA_TYPE, iter_ndjson
+from helpers.utils.negotiation import NegotiatingRoute, negotiated_response
+from helpers.utils.workflow_codec import (
+    MSGPACK_MEDIA_TYPE,
+    WorkflowCodecError,
+    prefers_msgpack,
+)
+from services.graph.graph_service import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, GraphService
+from services.workflow.workflow_cache import etag_matches
 from services.workflow.workflow_execution_service import WorkflowExecutionService
 from services.workflow.workflow_persistence_service import WorkflowPersistenceService
+from services.workflow.workflow_run_status_service import WorkflowRunStatusService
 
-router = APIRouter(prefix="/workflows", tags=["workflows"])
+# JSON / msgpack 요청 본문을 모두 받도록 콘텐츠 협상 route 사용
+router = APIRouter(
+    prefix="/workflows", tags=["workflows"], route_class=NegotiatingRoute
+)
 
 
 @router.post("/", response_model=WorkflowCreateResponse)
 async def create_workflow(
     request: WorkflowCreateRequest,
+    accept: str | None = Header(default=None),
     persistence_service: WorkflowPersistenceService = Depends(
         get_workflow_persistence_service
     ),
 ):
-    """워크플로우 생성"""
+    """워크플로우 생성 (JSON 또는 msgpack 바이너리 워크플로우 본문)"""
     try:
         # 그래프 생성
-        graph = Graph(name=request.name, description=request.description)
+        graph = Graph(
+            name=request.name,
+            description=request.description,
+            properties=request.properties,
+        )
 
         # 버텍스들 생성
         vertices = []
@@ -59,112 +94,200 @@ async def create_workflow(
         # 워크플로우 저장
         saved_graph = await persistence_service.save(graph, vertices, edges)
 
-        return {
-            "success": True,
-            "graph_id": saved_graph.id,
-            "message": "워크플로우가 성공적으로 생성되었습니다",
-        }
+        return negotiated_response(
+            {
+                "success": True,
+                "graph_id": saved_graph.id,
+                "message": "워크플로우가 성공적으로 생성되었습니다",
+            },
+            accept,
+        )
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/import", response_model=WorkflowCreateResponse)
+async def import_workflow(
+    request: Request,
+    persistence_service: WorkflowPersistenceService = Depends(
+        get_workflow_persistence_service
+    ),
+):
+    """NDJSON 스트림으로 워크플로우 가져오기
+
+    요청 본문을 줄 단위로 파싱하면서 버텍스/엣지를 청크 단위로 저장하므로
+    대용량 워크플로우도 전체를 메모리에 올리지 않습니다.
+    형식은 `GET /workflows/{graph_id}/export` 와 같습니다.
+    """
+    try:
+        graph = await persistence_service.import_ndjson(iter_ndjson(request.stream()))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return {
+        "success": True,
+        "graph_id": graph.id,
+        "message": "워크플로우를 성공적으로 가져왔습니다",
+    }
+
+
 @router.get("/", response_model=List[Dict[str, Any]])
-async def get_workflows(graph_service: GraphService = Depends(get_graph_service)):
-    """모든 워크플로우 조회"""
+async def get_workflows(
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None, description="이전 응답의 X-Next-Cursor"),
+    fields: str | None = Query(
+        default=None, description="쉼표로 구분한 조회 필드 (예: id,name)"
+    ),
+    name: str | None = Query(default=None, description="이름 접두사 검색"),
+    graph_service: GraphService = Depends(get_graph_service),
+):
+    """워크플로우 목록 조회 (updated_at 내림차순 커서 페이지네이션)
+
+    다음 페이지가 있으면 `X-Next-Cursor` 헤더로 커서를 반환합니다.
+    """
+    field_list = [field.strip() for field in fields.split(",")] if fields else None
     try:
-        graphs = await graph_service.get_graphs()
-        return [
-            {
-                "id": graph.id,
-                "name": graph.name,
-                "description": graph.description,
-                "created_at": (
-                    graph.created_at.isoformat() if graph.created_at else None
-                ),
-                "updated_at": (
-                    graph.updated_at.isoformat() if graph.updated_at else None
-                ),
-            }
-            for graph in graphs
-        ]
+        graphs, next_cursor = await graph_service.list_graphs(
+            limit=limit, cursor=cursor, fields=field_list, name_prefix=name
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return FastJSONResponse(graphs, headers=headers)
+
+
+# === 실행(run) 상태 조회 엔드포인트 ===
+# 실행 상태 저장소만 조회하므로 실행 중 짧은 주기로 폴링해도 DB 를 사용하지 않음
+@router.get("/runs/{run_id}", response_model=Dict[str, Any])
+async def get_run_status(
+    run_id: str,
+    include_results: bool = False,
+    status_service: WorkflowRunStatusService = Depends(get_workflow_run_status_service),
+):
+    """실행 상태 조회"""
+    status = await status_service.get_run_status(run_id, include_results)
+    if status is None:
+        raise HTTPException(status_code=404, detail="실행을 찾을 수 없습니다")
+    return FastJSONResponse(status)
+
+
+@router.get("/runs/{run_id}/nodes/{node_id}", response_model=Dict[str, Any])
+async def get_run_node_status(
+    run_id: str,
+    node_id: str,
+    status_service: WorkflowRunStatusService = Depends(get_workflow_run_status_service),
+):
+    """실행 내 특정 노드의 상태 조회"""
+    status = await status_service.get_run_node_status(run_id, node_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="실행 또는 노드를 찾을 수 없습니다")
+    return FastJSONResponse(status)
+
+
+@router.get("/runs/{run_id}/profile")
+async def get_run_profile(
+    run_id: str,
+    format: Literal["json", "folded"] = "json",
+    status_service: WorkflowRunStatusService = Depends(get_workflow_run_status_service),
+):
+    """실행 프로파일 조회 (folded: wall 모드 스택을 flamegraph 입력 형식으로)"""
+    profile = await status_service.get_run_profile(run_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다")
+    if format == "folded":
+        if profile["mode"] != PROFILE_MODE_WALL:
+            raise HTTPException(
+                status_code=400, detail="folded 형식은 wall 모드 프로파일만 지원합니다"
+            )
+        return PlainTextResponse(to_folded(profile))
+    return FastJSONResponse(profile)
+
 
 @router.get("/{graph_id}", response_model=Dict[str, Any])
 async def get_workflow(
     graph_id: int,
+    if_none_match: str | None = Header(default=None),
+    accept: str | None = Header(default=None),
     persistence_service: WorkflowPersistenceService = Depends(
         get_workflow_persistence_service
     ),
 ):
-    """특정 워크플로우 조회"""
+    """특정 워크플로우 조회 (ETag 조건부 요청, JSON / msgpack 협상 지원)"""
     try:
-        graph, vertices, edges = await persistence_service.load(graph_id)
-
-        return {
-            "graph": {
-                "id": graph.id,
-                "name": graph.name,
-                "description": graph.description,
-                "properties": graph.properties,
-                "created_at": (
-                    graph.created_at.isoformat() if graph.created_at else None
-                ),
-                "updated_at": (
-                    graph.updated_at.isoformat() if graph.updated_at else None
-                ),
-            },
-            "vertices": [
-                {
-                    "id": vertex.id,
-                    "type": vertex.type,
-                    "properties": vertex.properties,
-                    "created_at": (
-                        vertex.created_at.isoformat() if vertex.created_at else None
-                    ),
-                    "updated_at": (
-                        vertex.updated_at.isoformat() if vertex.updated_at else None
-                    ),
-                }
-                for vertex in vertices
-            ],
-            "edges": [
-                {
-                    "id": edge.id,
-                    "source_id": edge.source_id,
-                    "target_id": edge.target_id,
-                    "type": edge.type,
-                    "properties": edge.properties,
-                    "created_at": (
-                        edge.created_at.isoformat() if edge.created_at else None
-                    ),
-                    "updated_at": (
-                        edge.updated_at.isoformat() if edge.updated_at else None
-                    ),
-                }
-                for edge in edges
-            ],
-        }
+        snapshot = await persistence_service.load_snapshot(graph_id)
     except Exception as e:
         raise HTTPException(status_code=404, detail=str(e))
 
+    if prefers_msgpack(accept):
+        try:
+            body, etag, media_type = (
+                snapshot.msgpack_body,
+                snapshot.msgpack_etag,
+                MSGPACK_MEDIA_TYPE,
+            )
+        except WorkflowCodecError as e:
+            # 바이너리 포맷으로 표현할 수 없는 저장 상태 (예: 그래프 밖 버텍스를 참조하는 엣지)
+            raise HTTPException(status_code=500, detail=str(e))
+    else:
+        body, etag, media_type = snapshot.body, snapshot.etag, "application/json"
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+@router.get("/{graph_id}/export")
+async def export_workflow(
+    graph_id: int,
+    persistence_service: WorkflowPersistenceService = Depends(
+        get_workflow_persistence_service
+    ),
+):
+    """워크플로우를 NDJSON 스트림으로 내보내기 (graph, vertex..., edge... 순서)"""
+    try:
+        lines = await persistence_service.export_ndjson(graph_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    return StreamingResponse(
+        lines,
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={
+            "Content-Disposition": f'attachment; filename="workflow-{graph_id}.ndjson"'
+        },
+    )
+
 
 @router.post("/{graph_id}/execute", response_model=Dict[str, Any])
 async def execute_workflow(
     graph_id: int,
     request: WorkflowExecuteRequest,
+    traceparent: str | None = Header(default=None),
     execution_service: WorkflowExecutionService = Depends(
         get_workflow_execution_service
     ),
 ):
-    """워크플로우 실행"""
+    """워크플로우 실행 (traceparent 헤더가 있으면 호출 측 trace 에 이어서 기록)
+
+    profile 을 지정하면 실행을 프로파일링하고 결과를 응답과 /runs/{run_id}/profile 로 제공
+    """
     try:
         result = await execution_service.execute_workflow(
-            graph_id, request.initial_inputs
+            graph_id, request.initial_inputs, traceparent, request.profile
         )
-        return result
+        # node_results 는 크기가 클 수 있어 jsonable_encoder 를 거치지 않고 바로 직렬화
+        return FastJSONResponse(result)
+    except ProfilingDisabledError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -172,16 +295,14 @@ async def execute_workflow(
 @router.get("/{graph_id}/status", response_model=Dict[str, Any])
 async def get_workflow_status(
     graph_id: int,
-    execution_service: WorkflowExecutionService = Depends(
-        get_workflow_execution_service
-    ),
+    include_results: bool = False,
+    status_service: WorkflowRunStatusService = Depends(get_workflow_run_status_service),
 ):
-    """워크플로우 상태 조회"""
-    try:
-        status = await execution_service.get_workflow_status(graph_id)
-        return status
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    """워크플로우의 가장 최근 실행 상태 조회"""
+    status = await status_service.get_workflow_status(graph_id, include_results)
+    if status is None:
+        raise HTTPException(status_code=404, detail="실행 기록이 없습니다")
+    return FastJSONResponse(status)
 
 
 @router.delete("/{graph_id}", response_model=Dict[str, Any])
@@ -191,24 +312,32 @@ async def delete_workflow(
         get_workflow_persistence_service
     ),
 ):
-    """워크플로우 삭제"""
+    """워크플로우 삭제 (그래프가 없으면 404)"""
     try:
         result = await persistence_service.delete(graph_id)
         return result
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/node-types/", response_model=List[Dict[str, Any]])
 async def get_node_types():
-    """사용 가능한 노드 타입들 조회"""
+    """사용 가능한 노드 타입들 조회 (플러그인 노드 타입 포함)"""
+    node_types = [node_type.value for node_type in NodeType]
+    node_types += [
+        node_type
+        for node_type in NodeFactory.get_node_types()
+        if node_type not in node_types
+    ]
     return [
         {
-            "type": node_type.value,
-            "name": node_type.name,
-            "description": f"{node_type.name} 노드",
+            "type": node_type,
+            "name": node_type,
+            "description": f"{node_type} 노드",
         }
-        for node_type in NodeType
+        for node_type in node_types
     ]
 
 
@@ -228,8 +357,8 @@ async def get_graph_metadata(
             "name": graph.name,
             "description": graph.description,
             "properties": graph.properties,
-            "created_at": graph.created_at.isoformat() if graph.created_at else None,
-            "updated_at": graph.updated_at.isoformat() if graph.updated_at else None,
+            "created_at": graph.created_at,
+            "updated_at": graph.updated_at,
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -252,16 +381,15 @@ async def delete_graph_metadata(
 async def get_node_status(
     graph_id: int,
     node_id: str,
-    execution_service: WorkflowExecutionService = Depends(
-        get_workflow_execution_service
-    ),
+    status_service: WorkflowRunStatusService = Depends(get_workflow_run_status_service),
 ):
-    """특정 노드의 상태 조회"""
-    try:
-        status = await execution_service.get_node_status(graph_id, node_id)
-        return status
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    """워크플로우의 가장 최근 실행에서 특정 노드의 상태 조회"""
+    status = await status_service.get_node_status(graph_id, node_id)
+    if status is None:
+        raise HTTPException(
+            status_code=404, detail="실행 기록 또는 노드를 찾을 수 없습니다"
+        )
+    return FastJSONResponse(status)
 
 
 # TODO: websocket 연결 엔드포인트 구성
@@ -0,0 +1,58 @@
+from typing import Any, Dict, Iterable, List, Tuple
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from database.setup import get_pool_metrics
+from helpers.utils.metrics import PROMETHEUS_MEDIA_TYPE, REGISTRY, MetricFamily
+from services.workflow.workflow_cache import get_workflow_cache
+
+router = APIRouter(tags=["system"])
+
+# 통계 dict 키 -> (메트릭 이름, 타입, 설명)
+CACHE_METRICS = {
+    "hits": ("workflow_cache_hits_total", "counter", "워크플로우 캐시 적중 수"),
+    "misses": ("workflow_cache_misses_total", "counter", "워크플로우 캐시 미적중 수"),
+    "size": ("workflow_cache_entries", "gauge", "캐시된 워크플로우 수"),
+}
+DB_POOL_METRICS = {
+    "size": ("db_pool_size", "gauge", "커넥션 풀 크기"),
+    "checked_out": ("db_pool_checked_out", "gauge", "사용 중인 커넥션 수"),
+    "overflow": ("db_pool_overflow", "gauge", "풀 크기를 초과해 연 커넥션 수"),
+    "checkouts": ("db_pool_checkouts_total", "counter", "커넥션 체크아웃 수"),
+    "timeouts": ("db_pool_timeouts_total", "counter", "커넥션 대기 타임아웃 수"),
+    "wait_seconds_total": (
+        "db_pool_wait_seconds_total",
+        "counter",
+        "커넥션 체크아웃 누적 대기 시간",
+    ),
+}
+
+
+def _families(
+    stats: Dict[str, Any], metrics: Dict[str, Tuple[str, str, str]]
+) -> List[MetricFamily]:
+    """통계 dict 를 라벨 없는 MetricFamily 로 변환 (없는 키는 생략)"""
+    return [
+        (name, type_name, documentation, [(name, {}, stats[key])])
+        for key, (name, type_name, documentation) in metrics.items()
+        if key in stats
+    ]
+
+
+@REGISTRY.register_collector
+def collect_workflow_cache() -> Iterable[MetricFamily]:
+    """워크플로우 정의 캐시 적중/미적중 (스크레이프 시점 값)"""
+    return _families(get_workflow_cache().stats(), CACHE_METRICS)
+
+
+@REGISTRY.register_collector
+def collect_db_pool() -> Iterable[MetricFamily]:
+    """DB 커넥션 풀 사용량 (SQLite 등 큐 풀이 아니면 생략)"""
+    return _families(get_pool_metrics(), DB_POOL_METRICS)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus 스크레이프 엔드포인트"""
+    return PlainTextResponse(REGISTRY.render(), media_type=PROMETHEUS_MEDIA_TYPE)
@@ -0,0 +1,22 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter, Request
+
+from database.setup import get_pool_metrics
+
+router = APIRouter(prefix="/system", tags=["system"])
+
+
+@router.get("/db-pool", response_model=Dict[str, Any])
+async def get_db_pool_metrics():
+    """DB 커넥션 풀 상태 조회 (사용 중/오버플로 커넥션 수, 체크아웃 대기 시간)"""
+    return get_pool_metrics()
+
+
+@router.get("/run-history", response_model=Dict[str, Any])
+async def get_run_history_stats(request: Request):
+    """실행 이력 배치 기록 상태 조회 (대기 중/기록/유실 건수)"""
+    writer = getattr(request.app.state, "run_history_writer", None)
+    if writer is None:
+        return {"enabled": False}
+    return {"enabled": True, **writer.stats()}
@@ -1,17 +1,30 @@
+from typing import AsyncIterator, List, Sequence
+
+from sqlalchemy.engine import Row
+
 from database.graph.edge import Edge
 from repositories.graph.edge_repository import EdgeRepository
+from services.workflow.workflow_cache import WorkflowCache, get_workflow_cache
 from setting.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 class EdgeService:
-    def __init__(self, edge_repository: EdgeRepository):
+    def __init__(
+        self,
+        edge_repository: EdgeRepository,
+        workflow_cache: WorkflowCache | None = None,
+    ):
         self.edge_repository = edge_repository
+        self.workflow_cache = workflow_cache or get_workflow_cache()
 
     async def create_edge(self, edge: Edge):
         return await self.edge_repository.create_edge(edge)
 
+    async def bulk_create_edges(self, edges: List[Edge]) -> List[int]:
+        return await self.edge_repository.bulk_create_edges(edges)
+
     async def get_edge(self, edge_id: int):
         return await self.edge_repository.get_edge(edge_id)
 
@@ -19,10 +32,28 @@ class EdgeService:
         return await self.edge_repository.get_edges()
 
     async def update_edge(self, edge_id: int, edge: Edge):
-        return await self.edge_repository.update_edge(edge_id, edge)
+        existing = await self.edge_repository.get_edge(edge_id)
+        # commit 후에는 속성이 만료되므로 graph_id 는 미리 확보
+        # (다른 그래프로 옮겨진 경우 양쪽 모두 무효화)
+        graph_ids = (existing.graph_id, edge.graph_id) if existing else ()
+        updated = await self.edge_repository.update_edge(edge_id, edge)
+        self.workflow_cache.invalidate(*graph_ids)
+        return updated
 
     async def delete_edge(self, edge_id: int):
-        return await self.edge_repository.delete_edge(edge_id)
+        existing = await self.edge_repository.get_edge(edge_id)
+        graph_id = existing.graph_id if existing else None
+        deleted_id = await self.edge_repository.delete_edge(edge_id)
+        self.workflow_cache.invalidate(graph_id)
+        return deleted_id
 
     async def get_edges_by_graph_id(self, graph_id: int):
         return await self.edge_repository.get_edges_by_graph_id(graph_id)
+
+    def stream_edges_by_graph_id(
+        self, graph_id: int, chunk_size: int = 1000
+    ) -> AsyncIterator[Sequence[Row]]:
+        return self.edge_repository.stream_edges_by_graph_id(graph_id, chunk_size)
+
+    async def delete_edges_by_graph_id(self, graph_id: int) -> int:
+        return await self.edge_repository.delete_edges_by_graph_id(graph_id)
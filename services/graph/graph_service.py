@@ -1,11 +1,22 @@
-from typing import Any, Dict, List
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Sequence, Tuple
 
 from database.graph.graph import Graph
-from repositories.graph.graph_repository import GraphRepository
+from repositories.graph.graph_repository import (
+    GRAPH_FIELDS,
+    GRAPH_LIST_FIELDS,
+    GraphRepository,
+)
+from services.workflow.workflow_cache import WorkflowCache, get_workflow_cache
 from setting.logger import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
 
 class GraphService:
     """그래프 메타데이터 관리 전용 서비스 - Graph CRUD 작업만 담당"""
@@ -13,14 +24,40 @@ class GraphService:
     def __init__(
         self,
         graph_repository: GraphRepository,
+        workflow_cache: WorkflowCache | None = None,
     ):
         self.graph_repository = graph_repository
+        self.workflow_cache = workflow_cache or get_workflow_cache()
 
     # === Graph 메타데이터 CRUD 작업 ===
     async def get_graphs(self) -> List[Graph]:
         """모든 그래프 메타데이터 조회"""
         return await self.graph_repository.get_graphs()
 
+    async def list_graphs(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        fields: Sequence[str] | None = None,
+        name_prefix: str | None = None,
+    ) -> Tuple[List[Dict[str, Any]], str | None]:
+        """그래프 메타데이터 페이지 조회, (목록, 다음 페이지 커서) 반환
+
+        fields 를 지정하면 해당 컬럼만 조회합니다 (id, updated_at 은 커서 계산을
+        위해 항상 포함). 잘못된 커서나 필드는 ValueError.
+        """
+        selected = _select_fields(fields)
+        after = decode_cursor(cursor) if cursor else None
+        rows = await self.graph_repository.get_graph_page(
+            limit + 1, after=after, fields=selected, name_prefix=name_prefix
+        )
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["updated_at"], rows[-1]["id"])
+        return [dict(row) for row in rows], next_cursor
+
     async def get_graph(self, graph_id: int) -> Graph:
         """특정 그래프 메타데이터 조회"""
         return await self.graph_repository.get_graph(graph_id)
@@ -31,12 +68,15 @@ class GraphService:
 
     async def update_graph(self, graph_id: int, graph: Graph) -> Graph:
         """그래프 메타데이터 업데이트"""
-        return await self.graph_repository.update_graph(graph_id, graph)
+        updated_graph = await self.graph_repository.update_graph(graph_id, graph)
+        self.workflow_cache.invalidate(graph_id)
+        return updated_graph
 
     async def delete_graph_metadata(self, graph_id: int) -> Dict[str, Any]:
         """그래프 메타데이터만 삭제 (워크플로우는 삭제하지 않음)"""
         try:
             await self.graph_repository.delete_graph(graph_id)
+            self.workflow_cache.invalidate(graph_id)
             return {
                 "success": True,
                 "message": "그래프 메타데이터가 성공적으로 삭제되었습니다",
@@ -44,3 +84,29 @@ class GraphService:
         except Exception as e:
             logger.error(f"그래프 메타데이터 삭제 실패: {str(e)}", exc_info=True)
             return {"success": False, "error": str(e)}
+
+
+def encode_cursor(updated_at: datetime, graph_id: int) -> str:
+    """페이지 마지막 행의 (updated_at, id) 를 불투명한 커서 문자열로 변환"""
+    payload = json.dumps([updated_at.isoformat(), graph_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        updated_at, graph_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(updated_at), int(graph_id)
+    except Exception:
+        raise ValueError(f"잘못된 커서입니다: {cursor}")
+
+
+def _select_fields(fields: Sequence[str] | None) -> Tuple[str, ...]:
+    if not fields:
+        return GRAPH_LIST_FIELDS
+    unknown = [field for field in fields if field not in GRAPH_FIELDS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 필드: {', '.join(unknown)}")
+    # 커서 계산에 필요한 컬럼 포함, 컬럼 순서는 GRAPH_FIELDS 기준
+    requested = {"id", "updated_at", *fields}
+    return tuple(field for field in GRAPH_FIELDS if field in requested)
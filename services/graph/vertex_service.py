@@ -1,17 +1,30 @@
+from typing import AsyncIterator, List, Sequence
+
+from sqlalchemy.engine import Row
+
 from database.graph.vertex import Vertex
 from repositories.graph.vertex_repository import VertexRepository
+from services.workflow.workflow_cache import WorkflowCache, get_workflow_cache
 from setting.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 class VertexService:
-    def __init__(self, vertex_repository: VertexRepository):
+    def __init__(
+        self,
+        vertex_repository: VertexRepository,
+        workflow_cache: WorkflowCache | None = None,
+    ):
         self.vertex_repository = vertex_repository
+        self.workflow_cache = workflow_cache or get_workflow_cache()
 
     async def create_vertex(self, vertex: Vertex):
         return await self.vertex_repository.create_vertex(vertex)
 
+    async def bulk_create_vertices(self, vertices: List[Vertex]) -> List[int]:
+        return await self.vertex_repository.bulk_create_vertices(vertices)
+
     async def get_vertex(self, vertex_id: int):
         return await self.vertex_repository.get_vertex(vertex_id)
 
@@ -19,10 +32,28 @@ class VertexService:
         return await self.vertex_repository.get_vertices()
 
     async def update_vertex(self, vertex_id: int, vertex: Vertex):
-        return await self.vertex_repository.update_vertex(vertex_id, vertex)
+        existing = await self.vertex_repository.get_vertex(vertex_id)
+        # commit 후에는 속성이 만료되므로 graph_id 는 미리 확보
+        # (다른 그래프로 옮겨진 경우 양쪽 모두 무효화)
+        graph_ids = (existing.graph_id, vertex.graph_id) if existing else ()
+        updated = await self.vertex_repository.update_vertex(vertex_id, vertex)
+        self.workflow_cache.invalidate(*graph_ids)
+        return updated
 
     async def delete_vertex(self, vertex_id: int):
-        return await self.vertex_repository.delete_vertex(vertex_id)
+        existing = await self.vertex_repository.get_vertex(vertex_id)
+        graph_id = existing.graph_id if existing else None
+        deleted_id = await self.vertex_repository.delete_vertex(vertex_id)
+        self.workflow_cache.invalidate(graph_id)
+        return deleted_id
 
     async def get_vertices_by_graph_id(self, graph_id: int):
         return await self.vertex_repository.get_vertices_by_graph_id(graph_id)
+
+    def stream_vertices_by_graph_id(
+        self, graph_id: int, chunk_size: int = 1000
+    ) -> AsyncIterator[Sequence[Row]]:
+        return self.vertex_repository.stream_vertices_by_graph_id(graph_id, chunk_size)
+
+    async def delete_vertices_by_graph_id(self, graph_id: int) -> int:
+        return await self.vertex_repository.delete_vertices_by_graph_id(graph_id)
@@ -0,0 +1,341 @@
+"""
+워크플로우 실행 이력 (write-behind)
+
+실행/노드 이력을 실행 경로에서 바로 INSERT 하지 않고 메모리 버퍼에 쌓아 두었다가
+백그라운드 태스크가 batch_size 에 도달하거나 flush_interval 이 지나면
+한 트랜잭션에서 multi-row INSERT 로 기록합니다.
+
+- 실행 경로에서는 dict 를 버퍼에 추가하는 비용만 듭니다 (DB 대기 없음).
+- 실행 row 는 시작 시 running 으로 추가되고, 종료 시 상태/시간을 갱신합니다.
+  아직 flush 되지 않은 실행이면 버퍼의 row 를 직접 수정하므로 짧은 실행은
+  INSERT 한 번으로 기록됩니다.
+- 일괄 기록이 실패하면 실행 단위(실행 row + 노드 row + 갱신)로 나눠 다시 기록하므로
+  그래프가 삭제된 실행 하나 때문에 다른 실행의 이력까지 버려지지 않습니다.
+- 버퍼가 max_pending 을 넘거나 실행 단위 기록도 실패하면 해당 이력을 버리고 dropped 로
+  집계합니다. 이력 기록 실패가 워크플로우 실행을 실패시키지 않습니다.
+- 종료(stop) 시 남은 버퍼를 모두 flush 합니다. 프로세스가 비정상 종료되면
+  마지막 flush 이후의 이력은 유실될 수 있습니다.
+"""
+
+import asyncio
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.run.node_run import NodeRun
+from database.run.workflow_run import WorkflowRun
+from dto.workflow.workflow_dto import WorkflowExecutionResult
+from helpers.engine.run_context import NodeRunState, NodeTiming, RunContext
+from helpers.engine.run_state_store import InMemoryRunStateStore, RunRecord
+from repositories.run.run_history_repository import RunHistoryRepository
+from setting.logger import get_logger
+
+logger = get_logger(__name__)
+
+FINISHED_NODE_STATUSES = ("completed", "failed")
+
+
+class RunHistoryWriter:
+    """실행 이력 배치 기록기"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_pending: int = 50000,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._runs: Dict[str, Dict[str, Any]] = {}
+        self._run_updates: Dict[str, Dict[str, Any]] = {}
+        self._node_runs: List[Dict[str, Any]] = []
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+        self.flushes = 0
+        self.written_runs = 0
+        self.written_node_runs = 0
+        self.dropped = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._runs) + len(self._run_updates) + len(self._node_runs)
+
+    def add_run(self, row: Dict[str, Any]):
+        """실행 row 추가"""
+        if self._reject():
+            return
+        self._runs[row["id"]] = row
+        self._after_add()
+
+    def update_run(self, run_id: str, values: Dict[str, Any]):
+        """실행 row 갱신 (flush 전이면 버퍼의 row 를 직접 수정)"""
+        pending_row = self._runs.get(run_id)
+        if pending_row is not None:
+            pending_row.update(values)
+            return
+        if run_id not in self._run_updates and self._reject():
+            return
+        self._run_updates.setdefault(run_id, {}).update(values)
+        self._after_add()
+
+    def add_node_run(self, row: Dict[str, Any]):
+        """노드 실행 row 추가"""
+        if self._reject():
+            return
+        self._node_runs.append(row)
+        self._after_add()
+
+    def start(self):
+        """백그라운드 flush 태스크 시작 (이벤트 루프 안에서 호출)"""
+        if self._task is None:
+            self._stopping = False
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """백그라운드 태스크 종료 후 남은 이력 flush"""
+        self._stopping = True
+        if self._task is not None:
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def flush(self):
+        """버퍼의 이력을 한 트랜잭션으로 기록"""
+        if not self.pending:
+            return
+        runs = list(self._runs.values())
+        run_updates = [
+            {"id": run_id, **values} for run_id, values in self._run_updates.items()
+        ]
+        node_runs = self._node_runs
+        self._runs, self._run_updates, self._node_runs = {}, {}, []
+
+        try:
+            async with self.session_factory() as session:
+                await self._write(session, runs, node_runs, run_updates)
+                await session.commit()
+        except Exception as e:
+            logger.warning(
+                f"실행 이력 일괄 기록 실패, 실행 단위로 다시 기록합니다: {e}"
+            )
+            await self._write_each(runs, node_runs, run_updates)
+            return
+
+        self.flushes += 1
+        self.written_runs += len(runs)
+        self.written_node_runs += len(node_runs)
+
+    async def _write_each(
+        self,
+        runs: List[Dict[str, Any]],
+        node_runs: List[Dict[str, Any]],
+        run_updates: List[Dict[str, Any]],
+    ):
+        """실행 단위로 나눠 각각 커밋 (실패한 실행의 이력만 버림)"""
+        groups: Dict[str, Tuple[List, List, List]] = {}
+        for index, rows in enumerate((runs, node_runs, run_updates)):
+            key = "run_id" if rows is node_runs else "id"
+            for row in rows:
+                groups.setdefault(row[key], ([], [], []))[index].append(row)
+
+        pending = len(runs) + len(node_runs) + len(run_updates)
+        try:
+            async with self.session_factory() as session:
+                for run_id, (run_rows, node_rows, update_rows) in groups.items():
+                    count = len(run_rows) + len(node_rows) + len(update_rows)
+                    pending -= count
+                    try:
+                        await self._write(session, run_rows, node_rows, update_rows)
+                        await session.commit()
+                    except Exception as e:
+                        await session.rollback()
+                        self.dropped += count
+                        logger.error(f"실행 {run_id} 이력 기록 실패: {str(e)}")
+                        continue
+                    self.written_runs += len(run_rows)
+                    self.written_node_runs += len(node_rows)
+        except Exception as e:
+            # 세션을 열 수 없는 경우 등 (남은 실행의 이력을 모두 버림)
+            self.dropped += pending
+            logger.error(f"실행 이력 기록 실패: {str(e)}", exc_info=True)
+            return
+        self.flushes += 1
+
+    @staticmethod
+    async def _write(
+        session: AsyncSession,
+        runs: List[Dict[str, Any]],
+        node_runs: List[Dict[str, Any]],
+        run_updates: List[Dict[str, Any]],
+    ):
+        repository = RunHistoryRepository(session)
+        # 노드 row 가 참조하는 실행 row 를 먼저 기록
+        await repository.insert_runs(runs)
+        await repository.insert_node_runs(node_runs)
+        await repository.update_runs(run_updates)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending": self.pending,
+            "flushes": self.flushes,
+            "written_runs": self.written_runs,
+            "written_node_runs": self.written_node_runs,
+            "dropped": self.dropped,
+        }
+
+    async def _flush_loop(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def _reject(self) -> bool:
+        if self.pending >= self.max_pending:
+            self.dropped += 1
+            return True
+        return False
+
+    def _after_add(self):
+        if self._wakeup is not None and self.pending >= self.batch_size:
+            self._wakeup.set()
+
+
+class PersistentRunStateStore(InMemoryRunStateStore):
+    """DB 백업 실행 상태 저장소
+
+    진행 중/최근 실행은 메모리에서 조회하고, 메모리에 없는 실행(다른 워커,
+    재시작 전, 제거된 실행)은 DB 이력에서 조회합니다.
+    DB 에서 조회한 실행에는 실행이 끝난 노드만 포함됩니다.
+    """
+
+    def __init__(
+        self,
+        writer: RunHistoryWriter,
+        session_factory: Callable[[], AsyncSession],
+        max_runs: int = 1000,
+    ):
+        super().__init__(max_runs=max_runs)
+        self.writer = writer
+        self.session_factory = session_factory
+
+    def start_run(
+        self,
+        graph_id: int,
+        run_context: RunContext,
+        node_types: Dict[str, str],
+        inputs: Dict[str, Any] | None = None,
+    ) -> RunRecord:
+        record = super().start_run(graph_id, run_context, node_types, inputs)
+        self.writer.add_run(
+            {
+                "id": record.run_id,
+                "graph_id": graph_id,
+                "status": record.status,
+                "inputs": inputs,
+                "errors": [],
+                "started_at": record.started_at,
+                "finished_at": None,
+                "execution_time": None,
+            }
+        )
+        return record
+
+    def node_changed(self, run_id: str, node_id: str, state: NodeRunState):
+        if state.status not in FINISHED_NODE_STATUSES:
+            return
+        record = self._runs.get(run_id)
+        node_type = record.node_types.get(node_id) if record else None
+        timing = state.timing
+        duration = None
+        if timing is not None:
+            duration = timing.queue_wait + timing.total
+        elif state.started_at and state.finished_at:
+            duration = (state.finished_at - state.started_at).total_seconds()
+        self.writer.add_node_run(
+            {
+                "run_id": run_id,
+                "node_id": node_id,
+                "node_type": node_type,
+                "status": state.status,
+                "inputs": state.inputs,
+                "outputs": state.result,
+                "error": state.error,
+                "started_at": state.started_at,
+                "finished_at": state.finished_at,
+                "duration": duration,
+                "timing": asdict(timing) if timing else None,
+            }
+        )
+
+    def finish_run(self, run_id: str, result: WorkflowExecutionResult):
+        super().finish_run(run_id, result)
+        record = self._runs.get(run_id)
+        if record is None:
+            return
+        self.writer.update_run(
+            run_id,
+            {
+                "status": record.status,
+                "errors": record.errors,
+                "finished_at": record.finished_at,
+                "execution_time": record.execution_time,
+            },
+        )
+
+    async def get_run(self, run_id: str) -> RunRecord | None:
+        record = await super().get_run(run_id)
+        if record is not None:
+            return record
+        async with self.session_factory() as session:
+            repository = RunHistoryRepository(session)
+            run = await repository.get_run(run_id)
+            return await self._to_record(repository, run) if run else None
+
+    async def get_latest_run(self, graph_id: int) -> RunRecord | None:
+        record = await super().get_latest_run(graph_id)
+        if record is not None:
+            return record
+        async with self.session_factory() as session:
+            repository = RunHistoryRepository(session)
+            run = await repository.get_latest_run(graph_id)
+            return await self._to_record(repository, run) if run else None
+
+    async def _to_record(
+        self, repository: RunHistoryRepository, run: WorkflowRun
+    ) -> RunRecord:
+        node_runs: List[NodeRun] = list(await repository.get_node_runs(run.id))
+        return RunRecord(
+            run_id=run.id,
+            graph_id=run.graph_id,
+            node_types={node_run.node_id: node_run.node_type for node_run in node_runs},
+            node_states={
+                node_run.node_id: NodeRunState(
+                    status=node_run.status,
+                    result=node_run.outputs,
+                    error=node_run.error,
+                    inputs=node_run.inputs,
+                    started_at=node_run.started_at,
+                    finished_at=node_run.finished_at,
+                    timing=NodeTiming(**node_run.timing) if node_run.timing else None,
+                )
+                for node_run in node_runs
+            },
+            status=run.status,
+            inputs=run.inputs,
+            started_at=run.started_at,
+            finished_at=run.finished_at,
+            execution_time=run.execution_time or 0.0,
+            errors=run.errors or [],
+        )
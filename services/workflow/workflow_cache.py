@@ -0,0 +1,218 @@
+"""
+워크플로우 정의 캐시
+
+그래프 id 별로 (graph, vertices, edges) 스냅샷과 직렬화된 응답 본문, ETag,
+실행 계획을 프로세스 메모리에 LRU 로 보관합니다.
+
+- 그래프마다 버전 카운터가 있고, 모든 쓰기 경로(save/update/delete)에서
+  버전을 올리며 캐시 항목을 제거합니다.
+- 로드 도중 버전이 바뀌면 (동시에 수정된 경우) 로드 결과를 캐시에 넣지 않습니다.
+- 버전은 전체 공통 카운터에서 발급하며, 캐시 항목처럼 최근 max_size 개 그래프의
+  버전만 보관합니다. 보관하지 않는 그래프는 지금까지 제거된 버전 중 가장 큰 값을
+  버전으로 보므로, 로드 도중 버전이 제거되어도 오래된 결과가 캐시되지 않습니다.
+- ETag 는 응답 본문의 해시이므로 워커 프로세스가 달라도 같은 내용이면 같습니다.
+  단, 캐시는 프로세스 단위이므로 여러 워커로 실행하면서 다른 워커의 수정이
+  즉시 보여야 한다면 WORKFLOW_CACHE_SIZE=0 으로 비활성화하세요.
+
+캐시된 객체는 여러 요청이 공유하므로 읽기 전용으로 취급해야 합니다.
+"""
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from database.graph.edge import Edge
+from database.graph.graph import Graph
+from database.graph.vertex import Vertex
+from helpers.engine.execution_plan import ExecutionPlan, load_plan
+from helpers.utils.json_response import dumps
+from helpers.utils.workflow_codec import encode_workflow
+
+
+def serialize_workflow(
+    graph: Graph, vertices: List[Vertex], edges: List[Edge]
+) -> Dict[str, Any]:
+    """워크플로우 조회 응답 형식으로 변환 (datetime 은 dumps 에서 직렬화)"""
+    return {
+        "graph": {
+            "id": graph.id,
+            "name": graph.name,
+            "description": graph.description,
+            "properties": graph.properties,
+            "created_at": graph.created_at,
+            "updated_at": graph.updated_at,
+        },
+        "vertices": [
+            {
+                "id": vertex.id,
+                "type": vertex.type,
+                "properties": vertex.properties,
+                "created_at": vertex.created_at,
+                "updated_at": vertex.updated_at,
+            }
+            for vertex in vertices
+        ],
+        "edges": [
+            {
+                "id": edge.id,
+                "source_id": edge.source_id,
+                "target_id": edge.target_id,
+                "type": edge.type,
+                "properties": edge.properties,
+                "created_at": edge.created_at,
+                "updated_at": edge.updated_at,
+            }
+            for edge in edges
+        ],
+    }
+
+
+@dataclass(slots=True)
+class WorkflowSnapshot:
+    """특정 버전의 워크플로우 정의와 직렬화 결과"""
+
+    graph: Graph
+    vertices: List[Vertex]
+    edges: List[Edge]
+    _body: bytes | None = field(default=None, repr=False)
+    _etag: str | None = field(default=None, repr=False)
+    _msgpack_body: bytes | None = field(default=None, repr=False)
+    _msgpack_etag: str | None = field(default=None, repr=False)
+    _plan: ExecutionPlan | None = field(default=None, repr=False)
+
+    @property
+    def body(self) -> bytes:
+        """JSON 응답 본문 (최초 접근 시 한 번만 직렬화)"""
+        if self._body is None:
+            self._body = dumps(
+                serialize_workflow(self.graph, self.vertices, self.edges)
+            )
+        return self._body
+
+    @property
+    def etag(self) -> str:
+        if self._etag is None:
+            self._etag = _content_etag(self.body)
+        return self._etag
+
+    @property
+    def msgpack_body(self) -> bytes:
+        """바이너리 워크플로우 포맷 본문 (최초 접근 시 한 번만 직렬화)"""
+        if self._msgpack_body is None:
+            self._msgpack_body = encode_workflow(self.graph, self.vertices, self.edges)
+        return self._msgpack_body
+
+    @property
+    def msgpack_etag(self) -> str:
+        if self._msgpack_etag is None:
+            self._msgpack_etag = _content_etag(self.msgpack_body)
+        return self._msgpack_etag
+
+    @property
+    def plan(self) -> ExecutionPlan:
+        """실행 계획 (저장된 계획이 없거나 맞지 않으면 최초 접근 시 한 번 컴파일)"""
+        if self._plan is None:
+            self._plan = load_plan(self.graph.execution_plan, self.vertices, self.edges)
+        return self._plan
+
+
+def _content_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+class WorkflowCache:
+    """그래프 id -> WorkflowSnapshot LRU 캐시 (버전 기반 무효화)"""
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, WorkflowSnapshot]" = OrderedDict()
+        self._versions: "OrderedDict[int, int]" = OrderedDict()
+        self._last_version = 0
+        # 제거된 버전 중 가장 큰 값 (버전을 보관하지 않는 그래프의 버전)
+        self._dropped_version = 0
+        self.hits = 0
+        self.misses = 0
+
+    def version(self, graph_id: int) -> int:
+        return self._versions.get(graph_id, self._dropped_version)
+
+    def get(self, graph_id: int) -> WorkflowSnapshot | None:
+        snapshot = self._entries.get(graph_id)
+        if snapshot is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(graph_id)
+        self.hits += 1
+        return snapshot
+
+    def put(self, graph_id: int, version: int, snapshot: WorkflowSnapshot) -> bool:
+        """로드 시작 시점의 버전이 그대로일 때만 저장"""
+        if self.max_size <= 0 or self.version(graph_id) != version:
+            return False
+        self._entries[graph_id] = snapshot
+        self._entries.move_to_end(graph_id)
+        while len(self._entries) > self.max_size:
+            evicted, _ = self._entries.popitem(last=False)
+            self._drop_version(evicted)
+        return True
+
+    def invalidate(self, *graph_ids: int | None):
+        """버전을 올리고 캐시 항목 제거"""
+        for graph_id in graph_ids:
+            if graph_id is None:
+                continue
+            self._last_version += 1
+            self._versions[graph_id] = self._last_version
+            self._versions.move_to_end(graph_id)
+            self._entries.pop(graph_id, None)
+        # 삭제된 그래프처럼 다시 로드되지 않는 그래프의 버전이 쌓이지 않도록 제한
+        while len(self._versions) > max(self.max_size, 0):
+            self._drop_version(next(iter(self._versions)))
+
+    def _drop_version(self, graph_id: int):
+        dropped = self._versions.pop(graph_id, None)
+        if dropped is not None:
+            self._dropped_version = max(self._dropped_version, dropped)
+
+    def clear(self):
+        self._entries.clear()
+        self._versions.clear()
+        self._last_version = 0
+        self._dropped_version = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_workflow_cache: WorkflowCache | None = None
+
+
+def get_workflow_cache() -> WorkflowCache:
+    """설정값 기반 전역 워크플로우 캐시"""
+    global _workflow_cache
+    if _workflow_cache is None:
+        from setting.config import get_config
+
+        _workflow_cache = WorkflowCache(max_size=get_config().WORKFLOW_CACHE_SIZE)
+    return _workflow_cache
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag 와 일치하는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.removeprefix("W/") == etag:
+            return True
+    return False
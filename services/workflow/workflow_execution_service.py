@@ -1,7 +1,17 @@
+from dataclasses import asdict
 from typing import Any, Dict
 
 from dto.workflow.workflow_dto import WorkflowExecutionResult
+from helpers.engine.profiler import (
+    ProfilingError,
+    RunProfiler,
+    create_profiler,
+    get_profile_store,
+)
+from helpers.engine.run_context import RunContext
+from helpers.engine.run_state_store import RunStateStore, get_run_state_store
 from helpers.engine.workflow_engine import WorkflowEngine
+from helpers.utils.tracing import get_tracer
 from services.workflow.workflow_persistence_service import WorkflowPersistenceService
 from setting.logger import get_logger
 
@@ -11,65 +21,116 @@ logger = get_logger(__name__)
 class WorkflowExecutionService:
     """워크플로우 실행 전용 서비스 - 워크플로우 실행 및 상태 관리 담당"""
 
-    def __init__(self, persistence_service: WorkflowPersistenceService):
+    def __init__(
+        self,
+        persistence_service: WorkflowPersistenceService,
+        run_state_store: RunStateStore | None = None,
+    ):
         self.persistence_service = persistence_service
+        self.run_state_store = run_state_store or get_run_state_store()
         self.workflow_engine = WorkflowEngine()
 
     async def execute_workflow(
-        self, graph_id: int, initial_inputs: Dict[str, Any] | None = None
+        self,
+        graph_id: int,
+        initial_inputs: Dict[str, Any] | None = None,
+        traceparent: str | None = None,
+        profile: str | None = None,
+    ) -> Dict[str, Any]:
+        """워크플로우 실행
+
+        로드와 실행을 하나의 trace 로 기록하며, traceparent 가 주어지면 호출 측
+        trace 에 이어서 기록합니다.
+        profile(cpu | wall) 을 지정하면 실행을 프로파일링해 결과를 run_id 로 보관합니다.
+        프로파일링을 시작할 수 없으면 ProfilingError 를 발생시킵니다.
+        """
+        # 설정에서 비활성화되었거나 cpu 프로파일러가 사용 중이면
+        # 워크플로우를 로드하고 실행을 등록하기 전에 거절
+        profiler = create_profiler(profile) if profile else None
+        try:
+            with get_tracer().start_span(
+                "workflow.execute", {"graph.id": graph_id}, traceparent=traceparent
+            ) as span:
+                result = await self._execute(graph_id, initial_inputs, profiler)
+                if "run_id" in result:
+                    span.set_attribute("workflow.run_id", result["run_id"])
+                if not result["success"]:
+                    span.status = "error"
+                result["trace_id"] = span.trace_id
+                return result
+        finally:
+            if profiler is not None:
+                profiler.release()
+
+    async def _execute(
+        self,
+        graph_id: int,
+        initial_inputs: Dict[str, Any] | None,
+        profiler: RunProfiler | None = None,
     ) -> Dict[str, Any]:
-        """워크플로우 실행"""
         try:
-            # 워크플로우 로드
-            graph, vertices, edges = await self.persistence_service.load(graph_id)
+            # 워크플로우 로드 (실행 계획은 저장 시 컴파일된 것을 스냅샷과 함께 캐시)
+            snapshot = await self.persistence_service.load_snapshot(graph_id)
+            vertices = snapshot.vertices
 
             # 워크플로우 엔진에 로드
-            success = await self.workflow_engine.load(vertices, edges)
+            success = await self.workflow_engine.load(
+                vertices, snapshot.edges, snapshot.plan
+            )
             if not success:
                 raise ValueError("워크플로우 로드 실패")
 
+            # 실행 상태 저장소에 실행 등록
+            run_context = RunContext()
+            record = self.run_state_store.start_run(
+                graph_id,
+                run_context,
+                {str(vertex.id): vertex.type for vertex in vertices},
+                initial_inputs,
+            )
+
             # 워크플로우 실행
-            result = await self.workflow_engine.start(initial_inputs)
+            try:
+                result = await self.workflow_engine.start(
+                    initial_inputs, run_context, profiler
+                )
+            except BaseException as e:
+                # 취소 등으로 중단되어도 실행이 running 으로 남지 않도록 종료 처리
+                result = WorkflowExecutionResult()
+                result.errors.append(f"워크플로우 실행 중단: {e!r}")
+                self.run_state_store.finish_run(record.run_id, result)
+                raise
+            self.run_state_store.finish_run(record.run_id, result)
+            if result.profile is not None:
+                get_profile_store().put(record.run_id, result.profile)
 
-            return self._format_execution_result(result)
+            return self._format_execution_result(record.run_id, result)
 
+        except ProfilingError:
+            raise
         except Exception as e:
             logger.error(f"워크플로우 실행 실패: {str(e)}", exc_info=True)
             return {"success": False, "error": str(e)}
 
-    async def get_workflow_status(self, graph_id: int) -> Dict[str, Any]:
-        """워크플로우 상태 조회"""
-        try:
-            graph, vertices, edges = await self.persistence_service.load(graph_id)
-            await self.workflow_engine.load(vertices, edges)
-            return self.workflow_engine.get_workflow_status()
-        except Exception as e:
-            logger.error(f"워크플로우 상태 조회 실패: {str(e)}", exc_info=True)
-            return {"error": str(e)}
-
-    async def get_node_status(self, graph_id: int, node_id: str) -> Dict[str, Any]:
-        """특정 노드 상태 조회"""
-        try:
-            graph, vertices, edges = await self.persistence_service.load(graph_id)
-            await self.workflow_engine.load(vertices, edges)
-            return self.workflow_engine.get_node_status(node_id)
-        except Exception as e:
-            logger.error(f"노드 상태 조회 실패: {str(e)}", exc_info=True)
-            return {"error": str(e)}
-
     def reset_workflow_engine(self):
         """워크플로우 엔진 상태 초기화"""
         self.workflow_engine.reset_workflow()
         logger.info("워크플로우 엔진 상태 초기화 완료")
 
     def _format_execution_result(
-        self, result: WorkflowExecutionResult
+        self, run_id: str, result: WorkflowExecutionResult
     ) -> Dict[str, Any]:
         """실행 결과 포맷팅"""
         return {
+            "run_id": run_id,
             "success": result.success,
             "execution_time": result.execution_time,
             "node_results": result.node_results,
             "errors": result.errors,
             "execution_order": result.execution_order,
+            "node_timings": {
+                node_id: asdict(timing)
+                for node_id, timing in result.node_timings.items()
+            },
+            **({"profile": result.profile} if result.profile is not None else {}),
         }
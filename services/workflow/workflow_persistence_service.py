@@ -1,15 +1,27 @@
-from typing import Any, Dict, List, Tuple
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Tuple
 
 from database.graph.edge import Edge
 from database.graph.graph import Graph
 from database.graph.vertex import Vertex
+from helpers.engine.execution_plan import PlanBuilder
+from helpers.utils.ndjson import encode_line
+from helpers.utils.tracing import get_tracer
 from repositories.graph.graph_repository import GraphRepository
 from services.graph.edge_service import EdgeService
 from services.graph.vertex_service import VertexService
+from services.workflow.workflow_cache import (
+    WorkflowCache,
+    WorkflowSnapshot,
+    get_workflow_cache,
+)
 from setting.logger import get_logger
 
 logger = get_logger(__name__)
 
+# NDJSON 내보내기/가져오기 시 한 번에 조회/INSERT 하는 행 수
+EXPORT_CHUNK_SIZE = 1000
+IMPORT_CHUNK_SIZE = 1000
+
 
 class WorkflowPersistenceService:
     """워크플로우 영속성 전용 서비스 - 워크플로우 저장/로드 담당"""
@@ -19,29 +31,64 @@ class WorkflowPersistenceService:
         graph_repository: GraphRepository,
         vertex_service: VertexService,
         edge_service: EdgeService,
+        workflow_cache: WorkflowCache | None = None,
     ):
         self.graph_repository = graph_repository
         self.vertex_service = vertex_service
         self.edge_service = edge_service
+        self.workflow_cache = workflow_cache or get_workflow_cache()
 
     async def save(
         self, graph: Graph, vertices: List[Vertex], edges: List[Edge]
     ) -> Graph:
-        """워크플로우를 데이터베이스에 저장"""
+        """워크플로우를 검증/컴파일해 실행 계획과 함께 데이터베이스에 저장
+
+        실행할 수 없는 워크플로우(사이클, 알 수 없는 노드 타입 등)는
+        WorkflowValidationError 를 발생시키고 저장하지 않습니다.
+        """
         try:
-            # 그래프 저장
-            saved_graph = await self.graph_repository.create_graph(graph)
-            graph_id = saved_graph.id
+            with get_tracer().start_span(
+                "db.workflow.save",
+                {"workflow.vertices": len(vertices), "workflow.edges": len(edges)},
+            ) as span:
+                # INSERT 전에 클라이언트 id 기준으로 검증/컴파일
+                # (id 가 없는 버텍스는 엣지가 참조할 수 없으므로 임시 id 사용)
+                node_ids = [
+                    f"$new{index}" if vertex.id is None else str(vertex.id)
+                    for index, vertex in enumerate(vertices)
+                ]
+                builder = PlanBuilder()
+                for node_id, vertex in zip(node_ids, vertices):
+                    builder.add_vertex(node_id, vertex.type, vertex.properties)
+                for edge in edges:
+                    builder.add_edge(edge.source_id, edge.target_id)
+                plan = builder.build()
+                span.set_attribute("workflow.levels", len(plan.levels))
 
-            # 버텍스들 저장
-            await self._save_vertices(vertices, graph_id)
+                # 그래프 저장
+                saved_graph = await self.graph_repository.create_graph(graph)
+                graph_id = saved_graph.id
+                span.set_attribute("graph.id", graph_id)
 
-            # 엣지들 저장
-            await self._save_edges(edges, graph_id)
+                # 버텍스들 저장 (클라이언트 측 id -> DB id 매핑 반환)
+                vertex_id_map = await self._save_vertices(vertices, graph_id)
 
-            # 모든 작업이 성공하면 commit
-            await self.graph_repository.db.commit()
-            await self.graph_repository.db.refresh(saved_graph)
+                # 엣지들 저장 (source/target 을 DB id 로 변환)
+                await self._save_edges(edges, graph_id, vertex_id_map)
+
+                # 실행 계획의 노드 id 를 DB id 로 변환
+                id_map = {
+                    node_id: str(vertex.id)
+                    for node_id, vertex in zip(node_ids, vertices)
+                }
+                saved_graph.execution_plan = plan.remap(
+                    id_map, vertices, edges
+                ).to_dict()
+
+                # 모든 작업이 성공하면 commit
+                await self.graph_repository.db.commit()
+                self.workflow_cache.invalidate(graph_id)
+                await self.graph_repository.db.refresh(saved_graph)
 
             logger.info(f"워크플로우 저장 완료: {saved_graph.id}")
             return saved_graph
@@ -52,18 +99,38 @@ class WorkflowPersistenceService:
             raise
 
     async def load(self, graph_id: int) -> Tuple[Graph, List[Vertex], List[Edge]]:
-        """데이터베이스에서 워크플로우 로드"""
-        try:
-            # 그래프 로드
-            graph = await self.graph_repository.get_graph(graph_id)
-            if not graph:
-                raise ValueError(f"그래프를 찾을 수 없습니다: {graph_id}")
+        """워크플로우 로드 (캐시된 객체는 읽기 전용으로 사용)"""
+        snapshot = await self.load_snapshot(graph_id)
+        return snapshot.graph, snapshot.vertices, snapshot.edges
+
+    async def load_snapshot(self, graph_id: int) -> WorkflowSnapshot:
+        """캐시에서 워크플로우 스냅샷 조회, 없으면 데이터베이스에서 로드"""
+        with get_tracer().start_span("workflow.load", {"graph.id": graph_id}) as span:
+            snapshot = self.workflow_cache.get(graph_id)
+            span.set_attribute("cache.hit", snapshot is not None)
+            if snapshot is not None:
+                return snapshot
 
-            # 버텍스들 로드
-            vertices = await self.vertex_service.get_vertices_by_graph_id(graph_id)
+            version = self.workflow_cache.version(graph_id)
+            snapshot = WorkflowSnapshot(*await self._load(graph_id))
+            self.workflow_cache.put(graph_id, version, snapshot)
+            return snapshot
 
-            # 엣지들 로드
-            edges = await self.edge_service.get_edges_by_graph_id(graph_id)
+    async def _load(self, graph_id: int) -> Tuple[Graph, List[Vertex], List[Edge]]:
+        """데이터베이스에서 워크플로우 로드"""
+        try:
+            with get_tracer().start_span(
+                "db.workflow.load", {"graph.id": graph_id}
+            ) as span:
+                # 그래프 + 버텍스 + 엣지를 한 번의 쿼리로 로드
+                graph, vertices, edges = (
+                    await self.graph_repository.get_graph_with_elements(graph_id)
+                )
+                if not graph:
+                    raise ValueError(f"그래프를 찾을 수 없습니다: {graph_id}")
+                span.set_attributes(
+                    {"workflow.vertices": len(vertices), "workflow.edges": len(edges)}
+                )
 
             logger.info(f"워크플로우 로드 완료. id: {graph_id}")
             return graph, vertices, edges
@@ -73,22 +140,22 @@ class WorkflowPersistenceService:
             raise
 
     async def delete(self, graph_id: int) -> Dict[str, Any]:
-        """워크플로우 삭제 (Graph + Vertices + Edges)"""
-        try:
-            # 관련된 vertices와 edges도 함께 삭제
-            vertices = await self.vertex_service.get_vertices_by_graph_id(graph_id)
-            edges = await self.edge_service.get_edges_by_graph_id(graph_id)
-
-            # edges 삭제
-            for edge in edges:
-                await self.edge_service.delete_edge(edge.id)
+        """워크플로우 삭제 (Graph + Vertices + Edges)
 
-            # vertices 삭제
-            for vertex in vertices:
-                await self.vertex_service.delete_vertex(vertex.id)
+        그래프 단위 DELETE 문 3개를 하나의 트랜잭션으로 실행합니다.
+        그래프가 없으면 롤백 후 ValueError 를 발생시킵니다.
+        """
+        try:
+            with get_tracer().start_span("db.workflow.delete", {"graph.id": graph_id}):
+                # edges -> vertices -> graph 순서로 삭제 (FK 의존 순서)
+                await self.edge_service.delete_edges_by_graph_id(graph_id)
+                await self.vertex_service.delete_vertices_by_graph_id(graph_id)
+                deleted = await self.graph_repository.delete_graph_by_id(graph_id)
+                if not deleted:
+                    raise ValueError(f"그래프를 찾을 수 없습니다: {graph_id}")
 
-            # graph 삭제
-            await self.graph_repository.delete_graph(graph_id)
+                await self.graph_repository.db.commit()
+            self.workflow_cache.invalidate(graph_id)
 
             logger.info(f"워크플로우 삭제 완료: {graph_id}")
             return {
@@ -96,18 +163,187 @@ class WorkflowPersistenceService:
                 "message": "워크플로우가 성공적으로 삭제되었습니다",
             }
 
+        except ValueError:
+            await self.graph_repository.db.rollback()
+            raise
         except Exception as e:
+            await self.graph_repository.db.rollback()
             logger.error(f"워크플로우 삭제 실패: {str(e)}", exc_info=True)
             return {"success": False, "error": str(e)}
 
-    async def _save_vertices(self, vertices: List[Vertex], graph_id: int):
-        """버텍스들 저장"""
+    async def export_ndjson(self, graph_id: int) -> AsyncIterator[bytes]:
+        """워크플로우를 NDJSON 으로 내보내는 스트림 반환
+
+        첫 줄은 graph, 이후 vertex, edge 레코드가 한 줄씩 이어집니다.
+        버텍스/엣지는 서버 측 커서로 EXPORT_CHUNK_SIZE 개씩 읽어 청크 단위로 전송합니다.
+        """
+        graph = await self.graph_repository.get_graph(graph_id)
+        if not graph:
+            raise ValueError(f"그래프를 찾을 수 없습니다: {graph_id}")
+        return self._export_lines(graph)
+
+    async def _export_lines(self, graph: Graph) -> AsyncIterator[bytes]:
+        yield encode_line(
+            {
+                "kind": "graph",
+                "name": graph.name,
+                "description": graph.description,
+                "properties": graph.properties,
+            }
+        )
+        async for rows in self.vertex_service.stream_vertices_by_graph_id(
+            graph.id, EXPORT_CHUNK_SIZE
+        ):
+            yield b"".join(
+                encode_line(
+                    {
+                        "kind": "vertex",
+                        "id": vertex_id,
+                        "type": vertex_type,
+                        "properties": properties,
+                    }
+                )
+                for vertex_id, vertex_type, properties in rows
+            )
+        async for rows in self.edge_service.stream_edges_by_graph_id(
+            graph.id, EXPORT_CHUNK_SIZE
+        ):
+            yield b"".join(
+                encode_line(
+                    {
+                        "kind": "edge",
+                        "source_id": source_id,
+                        "target_id": target_id,
+                        "type": edge_type,
+                        "properties": properties,
+                    }
+                )
+                for source_id, target_id, edge_type, properties in rows
+            )
+
+    async def import_ndjson(self, records: AsyncIterable[Dict[str, Any]]) -> Graph:
+        """NDJSON 레코드 스트림으로 워크플로우 생성
+
+        첫 레코드는 graph 여야 하고, 엣지는 앞서 나온 버텍스 id 만 참조할 수 있습니다.
+        IMPORT_CHUNK_SIZE 개씩 모아 일괄 INSERT 하며 전체를 하나의 트랜잭션으로 처리합니다.
+        저장한 청크의 id/타입/속성 이름만 PlanBuilder 에 모아 마지막에 save 와 같이
+        검증/컴파일합니다.
+        """
+        graph: Graph | None = None
+        builder = PlanBuilder()
+        vertex_id_map: Dict[str, int] = {}
+        vertex_buffer: List[Vertex] = []
+        edge_buffer: List[Edge] = []
+        counts = {"vertex": 0, "edge": 0}
+
+        async def flush_vertices():
+            vertex_id_map.update(await self._save_vertices(vertex_buffer, graph.id))
+            for vertex in vertex_buffer:
+                builder.add_vertex(vertex.id, vertex.type, vertex.properties)
+            counts["vertex"] += len(vertex_buffer)
+            vertex_buffer.clear()
+
+        async def flush_edges():
+            # 엣지가 참조하는 버텍스가 먼저 저장되어 있어야 함
+            if vertex_buffer:
+                await flush_vertices()
+            for edge in edge_buffer:
+                for vertex_id in (edge.source_id, edge.target_id):
+                    if str(vertex_id) not in vertex_id_map:
+                        raise ValueError(f"존재하지 않는 버텍스 참조: {vertex_id}")
+            await self._save_edges(edge_buffer, graph.id, vertex_id_map)
+            for edge in edge_buffer:
+                builder.add_edge(edge.source_id, edge.target_id)
+            counts["edge"] += len(edge_buffer)
+            edge_buffer.clear()
+
+        try:
+            async for record in records:
+                kind = record.get("kind") if isinstance(record, dict) else None
+                if graph is None:
+                    if kind != "graph":
+                        raise ValueError("첫 레코드는 graph 여야 합니다")
+                    graph = await self.graph_repository.create_graph(
+                        Graph(
+                            name=record.get("name", ""),
+                            description=record.get("description", ""),
+                            properties=record.get("properties", {}),
+                        )
+                    )
+                elif kind == "vertex":
+                    vertex_buffer.append(
+                        Vertex(
+                            id=record.get("id"),
+                            type=record.get("type", ""),
+                            properties=record.get("properties", {}),
+                        )
+                    )
+                    if len(vertex_buffer) >= IMPORT_CHUNK_SIZE:
+                        await flush_vertices()
+                elif kind == "edge":
+                    edge_buffer.append(
+                        Edge(
+                            source_id=record.get("source_id"),
+                            target_id=record.get("target_id"),
+                            type=record.get("type", "default"),
+                            properties=record.get("properties", {}),
+                        )
+                    )
+                    if len(edge_buffer) >= IMPORT_CHUNK_SIZE:
+                        await flush_edges()
+                else:
+                    raise ValueError(f"알 수 없는 레코드 종류: {kind}")
+
+            if graph is None:
+                raise ValueError("graph 레코드가 없습니다")
+            if vertex_buffer:
+                await flush_vertices()
+            if edge_buffer:
+                await flush_edges()
+
+            graph.execution_plan = builder.build().to_dict()
+
+            graph_id = graph.id
+            await self.graph_repository.db.commit()
+            self.workflow_cache.invalidate(graph_id)
+            await self.graph_repository.db.refresh(graph)
+
+            logger.info(
+                f"워크플로우 가져오기 완료: {graph_id} "
+                f"(vertices={counts['vertex']}, edges={counts['edge']})"
+            )
+            return graph
+
+        except Exception as e:
+            await self.graph_repository.db.rollback()
+            logger.error(f"워크플로우 가져오기 실패: {str(e)}", exc_info=True)
+            raise
+
+    async def _save_vertices(
+        self, vertices: List[Vertex], graph_id: int
+    ) -> Dict[str, int]:
+        """버텍스들을 한 번의 INSERT 로 저장하고 클라이언트 id(문자열) -> DB id 매핑 반환"""
+        client_ids = [vertex.id for vertex in vertices]
         for vertex in vertices:
             vertex.graph_id = graph_id
-            await self.vertex_service.create_vertex(vertex)
+        vertex_ids = await self.vertex_service.bulk_create_vertices(vertices)
 
-    async def _save_edges(self, edges: List[Edge], graph_id: int):
-        """엣지들 저장"""
+        vertex_id_map: Dict[str, int] = {}
+        for vertex, client_id, vertex_id in zip(vertices, client_ids, vertex_ids):
+            vertex.id = vertex_id
+            if client_id is not None:
+                vertex_id_map[str(client_id)] = vertex_id
+        return vertex_id_map
+
+    async def _save_edges(
+        self, edges: List[Edge], graph_id: int, vertex_id_map: Dict[str, int]
+    ):
+        """엣지들을 한 번의 INSERT 로 저장"""
         for edge in edges:
             edge.graph_id = graph_id
-            await self.edge_service.create_edge(edge)
+            # 클라이언트 id 로 지정된 버텍스는 DB id 로 변환 (그 외는 기존 DB id 로 간주)
+            edge.source_id = vertex_id_map.get(str(edge.source_id), edge.source_id)
+            edge.target_id = vertex_id_map.get(str(edge.target_id), edge.target_id)
+        edge_ids = await self.edge_service.bulk_create_edges(edges)
+        for edge, edge_id in zip(edges, edge_ids):
+            edge.id = edge_id
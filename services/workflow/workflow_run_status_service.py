@@ -0,0 +1,77 @@
+from dataclasses import asdict
+from typing import Any, Dict
+
+from helpers.engine.profiler import ProfileStore, get_profile_store
+from helpers.engine.run_state_store import (
+    RunRecord,
+    RunStateStore,
+    get_run_state_store,
+)
+from helpers.node.factory import NodeFactory
+
+
+class WorkflowRunStatusService:
+    """워크플로우 실행 상태 조회 서비스
+
+    실행 상태 저장소만 조회하므로 DB 세션이나 워크플로우 엔진이 필요 없습니다.
+    """
+
+    def __init__(
+        self,
+        run_state_store: RunStateStore | None = None,
+        profile_store: ProfileStore | None = None,
+    ):
+        self.run_state_store = run_state_store or get_run_state_store()
+        self.profile_store = profile_store or get_profile_store()
+
+    async def get_run_status(
+        self, run_id: str, include_results: bool = False
+    ) -> Dict[str, Any] | None:
+        """실행 상태 조회"""
+        record = await self.run_state_store.get_run(run_id)
+        return record.to_dict(include_results) if record else None
+
+    async def get_run_node_status(
+        self, run_id: str, node_id: str
+    ) -> Dict[str, Any] | None:
+        """실행 내 특정 노드 상태 조회"""
+        record = await self.run_state_store.get_run(run_id)
+        return self._format_node_status(record, node_id) if record else None
+
+    async def get_run_profile(self, run_id: str) -> Dict[str, Any] | None:
+        """프로파일링한 실행의 프로파일 조회"""
+        return self.profile_store.get(run_id)
+
+    async def get_workflow_status(
+        self, graph_id: int, include_results: bool = False
+    ) -> Dict[str, Any] | None:
+        """워크플로우의 가장 최근 실행 상태 조회"""
+        record = await self.run_state_store.get_latest_run(graph_id)
+        return record.to_dict(include_results) if record else None
+
+    async def get_node_status(
+        self, graph_id: int, node_id: str
+    ) -> Dict[str, Any] | None:
+        """워크플로우의 가장 최근 실행에서 특정 노드 상태 조회"""
+        record = await self.run_state_store.get_latest_run(graph_id)
+        return self._format_node_status(record, node_id) if record else None
+
+    def _format_node_status(
+        self, record: RunRecord, node_id: str
+    ) -> Dict[str, Any] | None:
+        """노드 상태 포맷팅 (입출력 스키마는 노드 클래스에서 조회)"""
+        node_type = record.node_types.get(node_id)
+        if node_type is None:
+            return None
+        state = record.node_states[node_id]
+        node_class = NodeFactory.get_node_class(node_type)
+        return {
+            "run_id": record.run_id,
+            "node_id": node_id,
+            "status": state.status,
+            "result": state.result,
+            "error": state.error,
+            "timing": asdict(state.timing) if state.timing else None,
+            "inputs": [asdict(schema) for schema in node_class.get_input_schema()],
+            "outputs": [asdict(schema) for schema in node_class.get_output_schema()],
+        }
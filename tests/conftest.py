@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel
+
+from database.setup import create_engine_from_config, get_async_db
+from helpers.engine import run_state_store
+from helpers.engine.run_state_store import InMemoryRunStateStore
+from helpers.utils import blob_store
+from helpers.utils.blob_store import BlobStore
+from main import app
+from services.workflow import workflow_cache
+from services.workflow.workflow_cache import WorkflowCache
+from setting.config import Settings
+
+
+@pytest.fixture
+def cache(monkeypatch) -> WorkflowCache:
+    """테스트마다 격리된 워크플로우 캐시"""
+    cache = WorkflowCache(max_size=8)
+    monkeypatch.setattr(workflow_cache, "_workflow_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def run_store(monkeypatch) -> InMemoryRunStateStore:
+    """테스트마다 격리된 실행 상태 저장소"""
+    store = InMemoryRunStateStore(max_runs=8)
+    monkeypatch.setattr(run_state_store, "_run_state_store", store)
+    return store
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch) -> BlobStore:
+    """16 bytes 보다 큰 출력을 offload 하는 테스트용 전역 blob 저장소"""
+    store = BlobStore(str(tmp_path / "blobs"), inline_threshold=16)
+    monkeypatch.setattr(blob_store, "_blob_store", store)
+    return store
+
+
+@pytest.fixture
+def client(cache, run_store):
+    """SQLite 메모리 DB 를 사용하는 테스트 클라이언트 (운영과 같은 엔진 설정/PRAGMA)"""
+    engine = create_engine_from_config(Settings(DATABASE_URL="sqlite+aiosqlite://"))
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+    async def get_test_db():
+        async with AsyncSession(engine) as session:
+            yield session
+
+    asyncio.run(create_tables())
+    app.dependency_overrides[get_async_db] = get_test_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    asyncio.run(engine.dispose())
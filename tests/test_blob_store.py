@@ -0,0 +1,113 @@
+import asyncio
+import os
+
+import pytest
+
+from database.graph.edge import Edge
+from database.graph.vertex import Vertex
+from helpers.engine.workflow_engine import WorkflowEngine
+from helpers.utils.blob_store import (
+    TEXT_MEDIA_TYPE,
+    BlobNotFoundError,
+    BlobRef,
+    is_blob_ref,
+)
+
+
+class TestBlobStore:
+    """blob 저장소 테스트"""
+
+    def test_put_and_load(self, store):
+        ref = store.put("안녕하세요" * 10)
+        assert ref.media_type == TEXT_MEDIA_TYPE
+        assert ref.size == len(("안녕하세요" * 10).encode("utf-8"))
+        assert store.load(ref) == "안녕하세요" * 10
+
+        # 같은 내용은 같은 파일 하나로 저장
+        again = store.put_chunks([b"\xec\x95\x88", ("안녕하세요" * 10).encode()[3:]])
+        assert again.digest == ref.digest
+        assert len(os.listdir(os.path.dirname(store.path(ref.digest)))) == 1
+        assert os.listdir(os.path.join(store.root, "tmp")) == []
+
+        binary = store.put(b"\x00" * 40)
+        assert store.load(binary.to_dict()) == b"\x00" * 40
+        assert b"".join(store.iter_chunks(binary, chunk_size=16)) == b"\x00" * 40
+
+        empty = store.put(b"")
+        assert store.read_bytes(empty) == b""
+
+    def test_refs(self, store):
+        ref = BlobRef.from_value(store.offload("x" * 17))
+        assert store.exists(ref)
+        assert store.offload("x" * 16) == "x" * 16
+        assert store.offload({"big": "x" * 100}) == {"big": "x" * 100}
+
+        with pytest.raises(ValueError):
+            store.path("../../etc/passwd")
+        with pytest.raises(BlobNotFoundError):
+            store.load(BlobRef(digest="0" * 64, size=1))
+
+    def test_large_outputs_travel_as_refs(self, store):
+        text = "문서 " * 50
+        vertices = [
+            Vertex(id=1, type="TEXT_INPUT", properties={}),
+            Vertex(id=2, type="LLM_NODE", properties={}),
+            Vertex(id=3, type="TEXT_OUTPUT", properties={}),
+        ]
+        edges = [Edge(source_id=1, target_id=2), Edge(source_id=2, target_id=3)]
+        engine = WorkflowEngine()
+        assert asyncio.run(engine.load(vertices, edges))
+
+        result = asyncio.run(engine.start({"text": text}))
+        assert result.success
+
+        ref = result.node_results["1"]["text"]
+        assert is_blob_ref(ref)
+        # LLM 노드는 내용으로 복원된 입력을 받고, 출력은 다시 같은 blob 참조가 됨
+        assert result.node_results["2"]["text"] == ref
+        # TEXT_OUTPUT 은 참조를 그대로 출력하고, 실행 기록에도 참조만 남음
+        assert result.node_results["3"]["output"] == ref
+        assert engine.run_context.get_node_state("2").inputs["text"] == ref
+        assert store.load(ref) == text
+
+    def test_small_outputs_skip_offload_thread(self, store, monkeypatch):
+        calls = []
+        original = asyncio.to_thread
+
+        async def to_thread(function, *args, **kwargs):
+            calls.append(function)
+            return await original(function, *args, **kwargs)
+
+        monkeypatch.setattr(asyncio, "to_thread", to_thread)
+        vertices = [
+            Vertex(id=1, type="TEXT_INPUT", properties={}),
+            Vertex(id=2, type="TEXT_OUTPUT", properties={}),
+        ]
+        edges = [Edge(source_id=1, target_id=2)]
+        for text, expected in [("짧은 글", []), ("x" * 17, ["_offload_outputs"])]:
+            calls.clear()
+            engine = WorkflowEngine()
+            assert asyncio.run(engine.load(vertices, edges))
+            assert asyncio.run(engine.start({"text": text})).success
+            # 임계값 이하 출력은 스레드 풀을 거치지 않음
+            assert [function.__name__ for function in calls] == expected
+
+    def test_download(self, store, client):
+        ref = store.put("x" * 100)
+        response = client.get(
+            f"/blobs/sha256:{ref.digest}", params={"media_type": ref.media_type}
+        )
+        assert response.status_code == 200
+        assert response.text == "x" * 100
+        assert response.headers["content-type"] == TEXT_MEDIA_TYPE
+        assert response.headers["x-content-type-options"] == "nosniff"
+        assert response.headers["content-disposition"].startswith("attachment")
+
+        # 허용되지 않은 media_type 은 바이너리로 응답
+        response = client.get(
+            f"/blobs/sha256:{ref.digest}", params={"media_type": "text/html"}
+        )
+        assert response.headers["content-type"] == "application/octet-stream"
+
+        assert client.get(f"/blobs/{'0' * 64}").status_code == 404
+        assert client.get("/blobs/not-a-digest").status_code == 400
@@ -0,0 +1,77 @@
+import pytest
+
+from helpers.node.node_templates.condition import ConditionNode
+from helpers.utils.safe_expression import ExpressionError, compile_expression
+
+
+class TestCompileExpression:
+    """조건식 컴파일러 테스트"""
+
+    def test_comparison_and_boolean_operators(self):
+        expression = compile_expression("value > 3 and value != 10 or value == -1")
+        assert expression.evaluate({"value": 5}) is True
+        assert expression.evaluate({"value": 10}) is False
+        assert expression.evaluate({"value": -1}) is True
+
+    def test_membership_and_functions(self):
+        expression = compile_expression(
+            "len(value) > 2 and value.lower() in ['abc', 'xyz']"
+        )
+        assert expression.evaluate({"value": "ABC"}) is True
+        assert expression.evaluate({"value": "ab"}) is False
+
+    def test_value_is_bound_not_substituted(self):
+        expression = compile_expression("value == 'a\" or True or \"'")
+        assert expression.evaluate({"value": "x"}) is False
+
+    def test_sequence_repeat_within_limit(self):
+        assert compile_expression("len('ab' * 3) == 6").evaluate({}) is True
+
+    def test_numeric_modulo(self):
+        assert compile_expression("value % 3 == 1").evaluate({"value": 7}) is True
+
+    def test_compiled_expression_is_cached(self):
+        assert compile_expression("value == 1") is compile_expression("value == 1")
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "__import__('os').system('echo hi')",
+            "value.__class__",
+            "(lambda: 1)()",
+            "open('/etc/passwd')",
+            "[x for x in value]",
+            "value ** 1000",
+            "'a' * 100000000",
+            "('a' * 10000) * 10000",
+            "[0, 1] * 60000",
+            "'%0300000000d' % 1",
+        ],
+    )
+    def test_rejects_unsafe_expressions(self, source):
+        with pytest.raises(ExpressionError):
+            compile_expression(source).evaluate({"value": 1})
+
+
+class TestConditionNode:
+    """조건문 노드 테스트"""
+
+    def test_condition_from_properties_is_compiled_at_load(self):
+        node = ConditionNode("1", {"condition": "value == 'yes'"})
+        assert node.expression is not None
+        assert node.validate_inputs({"value": "yes"})
+        assert node.execute({"value": "yes"}) == {"true": True, "false": False}
+
+    def test_condition_from_inputs(self):
+        node = ConditionNode("1", {})
+        result = node.execute({"condition": "value in 'hello'", "value": "ell"})
+        assert result == {"true": True, "false": False}
+
+    def test_invalid_condition_evaluates_to_false(self):
+        node = ConditionNode("1", {})
+        result = node.execute({"condition": "value.__dict__", "value": "a"})
+        assert result == {"true": False, "false": True}
+
+    def test_invalid_condition_in_properties_fails_at_load(self):
+        with pytest.raises(ExpressionError):
+            ConditionNode("1", {"condition": "import os"})
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from benchmarks.engine_benchmark import (
+    GENERATORS,
+    bench_concurrency,
+    bench_shape,
+    compare,
+    register_bench_nodes,
+)
+from helpers.engine.workflow_engine import WorkflowEngine
+
+
+class TestEngineBenchmark:
+    """엔진 벤치마크 생성기/회귀 비교 테스트"""
+
+    def setup_method(self):
+        register_bench_nodes()
+
+    @pytest.mark.parametrize("shape", sorted(GENERATORS))
+    def test_generated_graphs_are_dags(self, shape):
+        vertices, edges = GENERATORS[shape](50)
+        ids = {vertex.id for vertex in vertices}
+        assert all(edge.source_id in ids and edge.target_id in ids for edge in edges)
+
+        engine = WorkflowEngine()
+        assert asyncio.run(engine.load(vertices, edges))
+        assert len(engine._topological_sort()) == len(vertices)
+
+    def test_bench_rows(self):
+        row = asyncio.run(bench_shape("diamond", 10, repeat=1, memory=True))
+        assert row["nodes"] == 10
+        assert row["edges"] == 12
+        assert row["peak_mb"] > 0
+        concurrency = asyncio.run(bench_concurrency(2, "BENCH_SLEEP", 3, 0.001, 1))
+        assert concurrency["throughput"] > 0
+
+    def test_compare_flags_regressions(self):
+        baseline = {
+            "chain/1000": {"run": 0.1, "per_node_us": 100.0, "peak_mb": 2.0},
+            "chain/10": {"run": 0.0001, "per_node_us": 10.0},
+            "concurrency/sleep/4": {"elapsed": 0.1, "throughput": 40.0},
+        }
+        current = {
+            "chain/1000": {"run": 0.15, "per_node_us": 150.0, "peak_mb": 2.1},
+            # 측정 시간이 너무 짧은 항목은 비교하지 않음
+            "chain/10": {"run": 0.0003, "per_node_us": 30.0},
+            "concurrency/sleep/4": {"elapsed": 0.2, "throughput": 20.0},
+        }
+        regressions = compare(baseline, current, threshold=0.2)
+        assert [line.split(":")[0] for line in regressions] == [
+            "chain/1000 run",
+            "chain/1000 per_node_us",
+            "concurrency/sleep/4 throughput",
+        ]
@@ -0,0 +1,225 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from database.graph.edge import Edge
+from database.graph.graph import Graph
+from database.graph.vertex import Vertex
+from database.setup import get_async_db
+from helpers.engine.execution_plan import (
+    PLAN_VERSION,
+    ExecutionPlan,
+    WorkflowValidationError,
+    compile_plan,
+    load_plan,
+)
+from helpers.engine.workflow_engine import WorkflowEngine
+from helpers.node.factory import NodeFactory
+from helpers.node.node_base import BaseNode, NodeInputOutput, NodeInputOutputType
+from main import app
+
+
+class CountNode(BaseNode):
+    """text 이름으로 숫자를 출력하는 테스트 노드"""
+
+    __slots__ = ()
+
+    outputs = (NodeInputOutput(name="text", type=NodeInputOutputType.NUMBER),)
+
+    def execute(self, inputs):
+        return {"text": 1}
+
+    def validate_inputs(self, inputs):
+        return True
+
+
+class ValueNode(BaseNode):
+    """value 를 출력하는 테스트 노드"""
+
+    __slots__ = ()
+
+    outputs = (NodeInputOutput(name="value", type=NodeInputOutputType.TEXT),)
+
+    def execute(self, inputs):
+        return {"value": "x"}
+
+    def validate_inputs(self, inputs):
+        return True
+
+
+def _vertices(*types):
+    return [
+        Vertex(id=index, type=node_type, properties={})
+        for index, node_type in enumerate(types, start=1)
+    ]
+
+
+def _edges(*pairs):
+    return [Edge(source_id=source, target_id=target) for source, target in pairs]
+
+
+def _errors(vertices, edges) -> str:
+    with pytest.raises(WorkflowValidationError) as error:
+        compile_plan(vertices, edges)
+    return str(error.value)
+
+
+class TestExecutionPlan:
+    """실행 계획 컴파일/검증 테스트"""
+
+    def test_compile_diamond(self):
+        vertices = _vertices("TEXT_INPUT", "LLM_NODE", "TEXT_OUTPUT", "TEXT_OUTPUT")
+        edges = _edges((1, 2), (1, 3), (2, 4), (3, 4))
+        plan = compile_plan(vertices, edges)
+
+        assert plan.order == ("1", "2", "3", "4")
+        assert plan.levels == (("1",), ("2", "3"), ("4",))
+        assert plan.adjacency["1"] == ("2", "3")
+        assert plan.dependencies["4"] == ("2", "3")
+
+        restored = ExecutionPlan.from_dict(plan.to_dict())
+        assert restored == plan
+        assert restored.matches(vertices, edges)
+        assert not restored.matches(vertices, edges[:-1])
+
+    def test_rejects_broken_graphs(self):
+        assert "사이클" in _errors(
+            _vertices("TEXT_OUTPUT", "TEXT_OUTPUT"), _edges((1, 2), (2, 1))
+        )
+        assert "지원하지 않는 노드 타입: NOPE" in _errors(_vertices("NOPE"), [])
+        assert "존재하지 않는 버텍스 9" in _errors(
+            _vertices("TEXT_INPUT"), _edges((1, 9))
+        )
+        # JSON_OUTPUT 의 data 를 제공하는 앞 노드가 없음
+        assert "필수 입력 data" in _errors(
+            _vertices("TEXT_INPUT", "JSON_OUTPUT"), _edges((1, 2))
+        )
+
+    def test_only_declared_property_inputs_count(self, monkeypatch):
+        monkeypatch.setitem(NodeFactory._node_classes, "TEST_VALUE", ValueNode)
+        # CONDITION 은 condition 만 속성에서 읽으므로 value 속성은 연결로 치지 않음
+        vertices = _vertices("TEXT_INPUT", "CONDITION")
+        vertices[1].properties = {"condition": "value == 'x'", "value": "x"}
+        assert "필수 입력 value" in _errors(vertices, _edges((1, 2)))
+
+        vertices = _vertices("TEST_VALUE", "CONDITION")
+        assert "필수 입력 condition" in _errors(vertices, _edges((1, 2)))
+        vertices[1].properties = {"condition": "value == 'x'"}
+        compile_plan(vertices, _edges((1, 2)))
+
+    def test_rejects_port_type_mismatch(self, monkeypatch):
+        monkeypatch.setitem(NodeFactory._node_classes, "TEST_COUNT", CountNode)
+        message = _errors(_vertices("TEST_COUNT", "TEXT_OUTPUT"), _edges((1, 2)))
+        assert "text 포트 타입 불일치 (NUMBER -> TEXT)" in message
+
+    def test_engine_uses_plan_order(self):
+        vertices = _vertices("TEXT_INPUT", "TEXT_OUTPUT")
+        edges = _edges((1, 2))
+        plan = compile_plan(vertices, edges)
+        engine = WorkflowEngine()
+        assert asyncio.run(engine.load(vertices, edges, plan))
+
+        result = asyncio.run(engine.start({"text": "hi"}))
+        assert result.success
+        assert result.execution_order == ["1", "2"]
+        assert engine.dependencies["2"] == {"1"}
+
+    def test_stale_plan_is_recompiled(self):
+        vertices = _vertices("TEXT_INPUT", "TEXT_OUTPUT")
+        stored = compile_plan(vertices[:1], []).to_dict()
+        plan = load_plan(stored, vertices, _edges((1, 2)))
+        assert plan.order == ("1", "2")
+
+        # 엣지 수가 같아도 연결 방향이 바뀌면 다시 컴파일
+        vertices = _vertices("TEXT_OUTPUT", "TEXT_INPUT")
+        stored = compile_plan(vertices, _edges((1, 2))).to_dict()
+        plan = load_plan(stored, vertices, _edges((2, 1)))
+        assert plan.order == ("2", "1")
+        # 노드 타입만 바뀐 경우도 마찬가지
+        assert not ExecutionPlan.from_dict(stored).matches(
+            _vertices("TEXT_OUTPUT", "TEXT_OUTPUT"), _edges((1, 2))
+        )
+        with pytest.raises(WorkflowValidationError):
+            load_plan(None, vertices, _edges((1, 2), (2, 1)))
+
+    def test_save_stores_plan_and_rejects_cycles(self, client):
+        rejected = client.post(
+            "/workflows/",
+            json={
+                "name": "cyclic",
+                "vertices": [
+                    {"id": "a", "type": "TEXT_OUTPUT", "properties": {}},
+                    {"id": "b", "type": "TEXT_OUTPUT", "properties": {}},
+                ],
+                "edges": [
+                    {"source_id": "a", "target_id": "b"},
+                    {"source_id": "b", "target_id": "a"},
+                ],
+            },
+        )
+        assert rejected.status_code == 400
+        assert "사이클" in rejected.json()["detail"]
+
+        graph_id = client.post(
+            "/workflows/",
+            json={
+                "name": "planned",
+                "vertices": [
+                    {"id": "a", "type": "TEXT_INPUT", "properties": {}},
+                    {"id": "b", "type": "TEXT_OUTPUT", "properties": {}},
+                ],
+                "edges": [{"source_id": "a", "target_id": "b"}],
+            },
+        ).json()["graph_id"]
+
+        async def stored_plans():
+            session = await anext(app.dependency_overrides[get_async_db]())
+            rows = await session.execute(select(Graph.name, Graph.execution_plan))
+            vertices = (await session.execute(select(Vertex))).scalars().all()
+            edges = (await session.execute(select(Edge))).scalars().all()
+            return dict(rows.all()), vertices, edges
+
+        plans, vertices, edges = asyncio.run(stored_plans())
+        # 거절된 워크플로우는 저장되지 않음 (INSERT 전에 검증)
+        assert set(plans) == {"planned"}
+        assert len(vertices) == 2
+        plan = plans["planned"]
+        assert plan["version"] == PLAN_VERSION
+        # 클라이언트 id 로 컴파일한 계획이 DB id 로 변환되어 저장됨
+        assert ExecutionPlan.from_dict(plan).matches(vertices, edges)
+
+        executed = client.post(
+            f"/workflows/{graph_id}/execute", json={"initial_inputs": {"text": "x"}}
+        ).json()
+        assert executed["success"]
+        assert executed["execution_order"] == plan["order"]
+
+    def test_import_stores_plan(self, client):
+        body = (
+            '{"kind": "graph", "name": "imported"}\n'
+            '{"kind": "vertex", "id": "a", "type": "TEXT_INPUT"}\n'
+            '{"kind": "vertex", "id": "b", "type": "TEXT_OUTPUT"}\n'
+            '{"kind": "edge", "source_id": "a", "target_id": "b"}\n'
+        )
+        graph_id = client.post("/workflows/import", content=body).json()["graph_id"]
+
+        async def stored():
+            session = await anext(app.dependency_overrides[get_async_db]())
+            graph = await session.get(Graph, graph_id)
+            vertices = (await session.execute(select(Vertex))).scalars().all()
+            edges = (await session.execute(select(Edge))).scalars().all()
+            return graph.execution_plan, vertices, edges
+
+        plan, vertices, edges = asyncio.run(stored())
+        assert ExecutionPlan.from_dict(plan).matches(vertices, edges)
+        assert plan["order"] == [str(vertex.id) for vertex in vertices]
+
+    def test_import_rejects_broken_graph(self, client):
+        body = (
+            '{"kind": "graph", "name": "imported"}\n'
+            '{"kind": "vertex", "id": 1, "type": "UNKNOWN_NODE"}\n'
+        )
+        response = client.post("/workflows/import", content=body)
+        assert response.status_code == 400
+        assert "UNKNOWN_NODE" in response.json()["detail"]
@@ -0,0 +1,122 @@
+import asyncio
+import os
+
+import pytest
+
+from database.graph.edge import Edge
+from database.graph.vertex import Vertex
+from helpers.engine.execution_plan import compile_plan
+from helpers.engine.workflow_engine import WorkflowEngine
+from helpers.node.node_templates.file_nodes import FileOutputNode, resolve_node_path
+from helpers.node.node_templates.utility_nodes import SplitNode
+from helpers.utils.ndjson import NDJSON_MEDIA_TYPE
+from setting.config import get_config
+
+
+@pytest.fixture
+def root(tmp_path, monkeypatch) -> str:
+    """FILE_INPUT/FILE_OUTPUT 이 접근할 수 있는 디렉터리"""
+    root = tmp_path / "files"
+    root.mkdir()
+    monkeypatch.setattr(get_config(), "FILE_NODE_ROOTS", [str(root)])
+    return str(root)
+
+
+def _run(vertices, edges, initial_inputs):
+    engine = WorkflowEngine()
+    assert asyncio.run(engine.load(vertices, edges, compile_plan(vertices, edges)))
+    return asyncio.run(engine.start(initial_inputs))
+
+
+class TestFileNodes:
+    """FILE_INPUT / FILE_OUTPUT 노드와 blob 분할 테스트"""
+
+    def test_file_to_split_to_file(self, store, root):
+        lines = [f"{index}번째 줄" for index in range(1000)]
+        with open(os.path.join(root, "input.txt"), "w", encoding="utf-8") as file:
+            file.write("\n".join(lines))
+
+        vertices = [
+            Vertex(id=1, type="FILE_INPUT", properties={}),
+            Vertex(id=2, type="SPLIT", properties={"separator": "\n"}),
+            Vertex(id=3, type="FILE_OUTPUT", properties={"path": "out/lines.txt"}),
+        ]
+        edges = [Edge(source_id=1, target_id=2), Edge(source_id=2, target_id=3)]
+        result = _run(vertices, edges, {"path": "input.txt"})
+        assert result.success, result.errors
+
+        data = result.node_results["1"]["data"]
+        assert data["media_type"] == "text/plain; charset=utf-8"
+        split = result.node_results["2"]
+        assert split["count"] == 1000
+        assert split["split_data"]["media_type"] == NDJSON_MEDIA_TYPE
+        # 참조를 받지 않는 노드에는 배열로 복원됨
+        assert store.load(split["split_data"]) == lines
+
+        path = os.path.join(root, "out", "lines.txt")
+        # 서버의 절대 경로 대신 루트 기준 상대 경로를 출력
+        assert result.node_results["3"]["path"] == os.path.join("out", "lines.txt")
+        assert result.node_results["3"]["size"] == os.path.getsize(path)
+        with open(path, encoding="utf-8") as file:
+            assert file.read() == "\n".join(lines)
+        assert os.listdir(os.path.join(root, "out")) == ["lines.txt"]
+
+    def test_split_blob_matches_str_split(self, store):
+        node = SplitNode("1", {})
+        for text, separator, max_splits in [
+            ("a,b,,c,", ",", None),
+            ("가나::다::라", "::", 1),
+            ("", ",", None),
+            ("구분자 없음", ",", 2),
+        ]:
+            ref = store.put(text).to_dict()
+            inputs = {"data": ref, "separator": separator, "max_splits": max_splits}
+            result = node.execute(inputs)
+            expected = text.split(separator, max_splits or -1)
+            assert store.load(result["split_data"]) == expected
+            assert result["count"] == len(expected)
+
+    def test_uploaded_blob(self, store, root, client):
+        uploaded = client.post(
+            "/blobs/",
+            content=b"x,y,z",
+            headers={"Content-Type": "text/plain; charset=utf-8"},
+        )
+        assert uploaded.status_code == 201
+        ref = uploaded.json()
+        assert store.load(ref) == "x,y,z"
+
+        vertices = [
+            Vertex(id=1, type="FILE_INPUT", properties={}),
+            Vertex(id=2, type="FILE_OUTPUT", properties={"path": "copy.txt"}),
+        ]
+        result = _run(vertices, [Edge(source_id=1, target_id=2)], {"file": ref})
+        assert result.success, result.errors
+        assert result.node_results["1"]["data"] == ref
+        assert result.node_results["2"]["size"] == 5
+
+    def test_write_values(self, store, root):
+        node = FileOutputNode("1", {"path": "values.txt", "separator": ";"})
+        assert node.execute({"split_data": ["a", 1, {"b": 2}]}) == {
+            "path": "values.txt",
+            "size": 11,
+        }
+        with open(os.path.join(root, "values.txt"), encoding="utf-8") as file:
+            assert file.read() == 'a;1;{"b":2}'
+        assert node.validate_inputs({"text": "x"})
+        assert not FileOutputNode("1", {}).validate_inputs({"text": "x"})
+
+    def test_paths_are_restricted_to_roots(self, store, root, tmp_path):
+        outside = tmp_path / "secret.txt"
+        outside.write_text("secret")
+        os.symlink(outside, os.path.join(root, "link.txt"))
+
+        for path in ("../secret.txt", str(outside), "link.txt"):
+            with pytest.raises(PermissionError):
+                resolve_node_path(path)
+        assert resolve_node_path("a/b.txt") == os.path.join(root, "a", "b.txt")
+
+        vertices = [Vertex(id=1, type="FILE_INPUT", properties={"path": "link.txt"})]
+        result = _run(vertices, [], {})
+        assert not result.success
+        assert "허용되지 않은 파일 경로" in " ".join(result.errors)
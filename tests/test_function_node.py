@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from helpers.node.node_templates.function import FunctionNode
+from helpers.utils.code_sandbox import (
+    SandboxError,
+    SandboxPool,
+    SandboxTimeoutError,
+    compile_code,
+)
+
+
+class TestCompileCode:
+    """코드 컴파일 캐시 테스트"""
+
+    def test_same_source_is_compiled_once(self):
+        code = "result = args['a'] + 1"
+        assert compile_code(code) is compile_code(code)
+
+    def test_inline_execution(self):
+        node = FunctionNode("1", {})
+        result = node.execute({"code": "result = args['a'] * 2", "args": {"a": 21}})
+        assert result == {"result": 42}
+
+    def test_builtins_are_not_available(self):
+        node = FunctionNode("1", {})
+        with pytest.raises(Exception, match="코드 실행 오류"):
+            node.execute({"code": "result = open('/etc/passwd')", "args": {}})
+
+    def test_unknown_execution_mode(self):
+        with pytest.raises(ValueError):
+            FunctionNode("1", {"execution_mode": "remote"})
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = SandboxPool(max_workers=2, cpu_limit_seconds=1, memory_limit_mb=512)
+    pool.warm_up()
+    yield pool
+    pool.shutdown()
+
+
+class TestSandboxPool:
+    """샌드박스 워커 풀 테스트"""
+
+    def test_run(self, pool):
+        assert pool.run("result = [x * 2 for x in args]", [1, 2, 3]) == [2, 4, 6]
+
+    def test_run_async(self, pool):
+        result = asyncio.run(pool.run_async("result = {'sum': args['a']}", {"a": 1}))
+        assert result == {"sum": 1}
+
+    def test_error_is_reported(self, pool):
+        with pytest.raises(SandboxError, match="ZeroDivisionError"):
+            pool.run("result = 1 / 0", {})
+
+    def test_cpu_limit(self, pool):
+        with pytest.raises(SandboxTimeoutError):
+            pool.run("while True:\n    pass", {})
+        # 제한 초과 후에도 워커는 계속 사용 가능
+        assert pool.run("result = 1", {}) == 1
+
+    def test_result_must_be_serializable(self, pool):
+        with pytest.raises(SandboxError):
+            pool.run("result = {1, 2}", {})
@@ -0,0 +1,78 @@
+import re
+
+from helpers.utils.metrics import MetricsRegistry
+
+
+def _sample(text: str, sample: str) -> float:
+    """텍스트 포맷에서 sample(이름 + 라벨) 값 조회 (없으면 0)"""
+    match = re.search(rf"^{re.escape(sample)} (\S+)$", text, re.MULTILINE)
+    return float(match.group(1)) if match else 0.0
+
+
+class TestMetrics:
+    """Prometheus 메트릭 테스트"""
+
+    def test_render_text_format(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "처리한 작업", ("kind",))
+        histogram = registry.histogram(
+            "job_seconds", "작업 시간", ("kind",), buckets=(0.1, 1.0)
+        )
+        counter.labels('a"b').inc()
+        counter.labels('a"b').inc(2)
+        for value in (0.05, 0.5, 5.0):
+            histogram.labels("x").observe(value)
+
+        text = registry.render()
+        assert "# TYPE jobs_total counter" in text
+        assert 'jobs_total{kind="a\\"b"} 3' in text
+        assert 'job_seconds_bucket{kind="x",le="0.1"} 1' in text
+        assert 'job_seconds_bucket{kind="x",le="1"} 2' in text
+        assert 'job_seconds_bucket{kind="x",le="+Inf"} 3' in text
+        assert 'job_seconds_count{kind="x"} 3' in text
+        assert 'job_seconds_sum{kind="x"} 5.55' in text
+
+    def test_metrics_endpoint(self, client):
+        before = client.get("/metrics").text
+        created = client.post(
+            "/workflows/",
+            json={
+                "name": "metrics",
+                "vertices": [{"id": "a", "type": "TEXT_INPUT", "properties": {}}],
+                "edges": [],
+            },
+        )
+        graph_id = created.json()["graph_id"]
+        client.post(
+            f"/workflows/{graph_id}/execute", json={"initial_inputs": {"text": "x"}}
+        )
+        client.get(f"/workflows/{graph_id}")
+        client.get(f"/workflows/{graph_id}")
+
+        response = client.get("/metrics")
+        after = response.text
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+
+        def delta(sample: str) -> float:
+            return _sample(after, sample) - _sample(before, sample)
+
+        assert delta('workflow_runs_total{status="completed"}') == 1
+        assert (
+            delta(
+                'workflow_node_executions_total{node_type="TEXT_INPUT",status="completed"}'
+            )
+            == 1
+        )
+        assert (
+            delta('workflow_node_duration_seconds_count{node_type="TEXT_INPUT"}') == 1
+        )
+        assert _sample(after, "workflow_runs_in_progress") == 0
+        # 라벨은 실제 경로가 아닌 라우트 템플릿
+        assert (
+            delta(
+                'http_requests_total{method="GET",route="/workflows/{graph_id}",status="200"}'
+            )
+            == 2
+        )
+        assert "/workflows/1" not in after
+        assert _sample(after, "workflow_cache_hits_total") >= 1
@@ -0,0 +1,66 @@
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from helpers.node import factory
+from helpers.node.factory import NodeFactory
+from helpers.node.node_base import NodeType
+from helpers.node.node_templates.text_input import TextInputNode
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """테스트 중 등록한 노드 타입이 다른 테스트에 영향을 주지 않도록 격리"""
+    monkeypatch.setattr(NodeFactory, "_node_classes", dict(NodeFactory._node_classes))
+    monkeypatch.setattr(NodeFactory, "_entry_points_loaded", False)
+    return NodeFactory
+
+
+class TestNodeFactory:
+    """노드 팩토리 테스트"""
+
+    def test_importing_factory_does_not_load_node_templates(self):
+        code = (
+            "import sys, helpers.node.factory;"
+            "print(any(m.startswith('helpers.node.node_templates.') for m in sys.modules),"
+            " 'requests' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.split() == ["False", "False"]
+
+    def test_create_node_by_enum_or_name(self, registry):
+        assert isinstance(
+            registry.create_node(NodeType.TEXT_INPUT, "1", {}), TextInputNode
+        )
+        assert isinstance(registry.create_node("TEXT_INPUT", "2", {}), TextInputNode)
+
+    def test_register_lazy_path(self, registry):
+        registry.register_node_type(
+            "CUSTOM_INPUT", "helpers.node.node_templates.text_input:TextInputNode"
+        )
+        assert registry.get_node_class("CUSTOM_INPUT") is TextInputNode
+
+    def test_entry_point_plugins(self, registry, monkeypatch):
+        plugin = EntryPoint(
+            name="PLUGIN_NODE",
+            value="helpers.node.node_templates.text_input:TextInputNode",
+            group=factory.NODE_ENTRY_POINT_GROUP,
+        )
+        monkeypatch.setattr(factory, "entry_points", lambda group: [plugin])
+
+        assert "PLUGIN_NODE" in registry.get_node_types()
+        assert registry.get_node_class("PLUGIN_NODE") is TextInputNode
+
+    def test_unknown_node_type(self, registry, monkeypatch):
+        monkeypatch.setattr(factory, "entry_points", lambda group: [])
+        with pytest.raises(ValueError, match="지원하지 않는 노드 타입"):
+            registry.create_node("UNKNOWN", "1", {})
+
+    def test_rejects_non_node_class(self, registry):
+        registry.register_node_type("BROKEN", "helpers.node.node_base:NodeType")
+        with pytest.raises(TypeError):
+            registry.get_node_class("BROKEN")
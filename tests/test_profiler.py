@@ -0,0 +1,144 @@
+import asyncio
+import time
+
+import pytest
+
+from helpers.engine import profiler
+from helpers.engine.profiler import (
+    AWAIT_MARKER,
+    CpuProfiler,
+    ProfilerBusyError,
+    ProfileStore,
+    WallClockProfiler,
+    to_folded,
+)
+from setting.config import get_config
+
+
+@pytest.fixture
+def profiling_enabled(monkeypatch):
+    monkeypatch.setattr(get_config(), "PROFILING_ENABLED", True)
+    monkeypatch.setattr(profiler, "_profile_store", ProfileStore(max_profiles=2))
+
+
+def _create_workflow(client) -> int:
+    created = client.post(
+        "/workflows/",
+        json={
+            "name": "profiled",
+            "vertices": [
+                {"id": "a", "type": "TEXT_INPUT", "properties": {}},
+                {"id": "b", "type": "TEXT_OUTPUT", "properties": {}},
+            ],
+            "edges": [{"source_id": "a", "target_id": "b"}],
+        },
+    )
+    return created.json()["graph_id"]
+
+
+class TestProfiler:
+    """실행 프로파일링 테스트"""
+
+    def test_wall_clock_samples_running_and_awaiting(self):
+        wall = WallClockProfiler(interval=0.002)
+
+        def busy(seconds: float):
+            deadline = time.perf_counter() + seconds
+            while time.perf_counter() < deadline:
+                pass
+
+        async def run():
+            wall.start()
+            await asyncio.sleep(0.1)
+            busy(0.1)
+            return wall.stop()
+
+        result = asyncio.run(run())
+        assert result["mode"] == "wall"
+        assert result["samples"] > 0
+        stacks = [row["stack"] for row in result["stacks"]]
+        # 대기 구간은 sleep 지점, 실행 구간은 busy 함수로 집계
+        assert any(
+            stack.endswith(AWAIT_MARKER) and "sleep" in stack for stack in stacks
+        )
+        assert any("busy" in stack and AWAIT_MARKER not in stack for stack in stacks)
+        # 루트는 start() 를 호출한 코루틴
+        assert all(stack.split(";")[0].startswith("TestProfiler") for stack in stacks)
+        assert to_folded(result).splitlines()[0].rsplit(" ", 1)[1].isdigit()
+
+    def test_cpu_profiler_is_exclusive(self):
+        first = CpuProfiler(top_n=5)
+        first.reserve()
+        first.start()
+        with pytest.raises(ProfilerBusyError):
+            CpuProfiler().reserve()
+        result = first.stop()
+        first.release()
+        assert result["mode"] == "cpu"
+        assert len(result["functions"]) <= 5
+        # 반환 후에는 다시 확보 가능
+        second = CpuProfiler()
+        second.reserve()
+        second.release()
+
+    def test_busy_profiler_does_not_create_run(
+        self, client, profiling_enabled, run_store
+    ):
+        graph_id = _create_workflow(client)
+        holder = CpuProfiler()
+        holder.reserve()
+        try:
+            response = client.post(
+                f"/workflows/{graph_id}/execute",
+                json={"initial_inputs": {"text": "x"}, "profile": "cpu"},
+            )
+        finally:
+            holder.release()
+        assert response.status_code == 409
+        assert asyncio.run(run_store.get_latest_run(graph_id)) is None
+
+    def test_profile_flag_requires_config(self, client):
+        graph_id = _create_workflow(client)
+        response = client.post(
+            f"/workflows/{graph_id}/execute",
+            json={"initial_inputs": {"text": "x"}, "profile": "cpu"},
+        )
+        assert response.status_code == 403
+
+    def test_execute_with_profile(self, client, profiling_enabled):
+        graph_id = _create_workflow(client)
+        response = client.post(
+            f"/workflows/{graph_id}/execute",
+            json={"initial_inputs": {"text": "x"}, "profile": "cpu"},
+        ).json()
+        assert response["success"]
+        assert response["profile"]["total_calls"] > 0
+        functions = [row["function"] for row in response["profile"]["functions"]]
+        assert any(name.startswith("_run ") for name in functions)
+
+        stored = client.get(f"/workflows/runs/{response['run_id']}/profile")
+        assert stored.json()["mode"] == "cpu"
+        folded = client.get(
+            f"/workflows/runs/{response['run_id']}/profile", params={"format": "folded"}
+        )
+        assert folded.status_code == 400
+
+        wall = client.post(
+            f"/workflows/{graph_id}/execute",
+            json={"initial_inputs": {"text": "x"}, "profile": "wall"},
+        ).json()
+        assert wall["profile"]["mode"] == "wall"
+        folded = client.get(
+            f"/workflows/runs/{wall['run_id']}/profile", params={"format": "folded"}
+        )
+        assert folded.status_code == 200
+        assert folded.headers["content-type"].startswith("text/plain")
+
+        # 프로파일 없이 실행한 run
+        plain = client.post(
+            f"/workflows/{graph_id}/execute", json={"initial_inputs": {"text": "x"}}
+        ).json()
+        assert "profile" not in plain
+        assert (
+            client.get(f"/workflows/runs/{plain['run_id']}/profile").status_code == 404
+        )
@@ -0,0 +1,107 @@
+import gzip
+import json
+import zlib
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from helpers.utils import compression
+from helpers.utils.compression import CompressionMiddleware, select_encoding
+from helpers.utils.json_response import FastJSONResponse, dumps
+
+LARGE_PAYLOAD = {"items": [{"id": i, "text": "x" * 20} for i in range(200)]}
+
+
+@pytest.fixture
+def client():
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/large")
+    async def large():
+        return FastJSONResponse(LARGE_PAYLOAD, headers={"ETag": '"v1"'})
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def lines():
+            for i in range(3):
+                yield f'{{"line":{i}}}\n'
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    @app.get("/binary")
+    async def binary():
+        return PlainTextResponse("x" * 2000, media_type="image/png")
+
+    return TestClient(app)
+
+
+class TestFastJSON:
+    """JSON 직렬화 테스트"""
+
+    def test_dumps_handles_datetime_and_sets(self):
+        moment = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        decoded = json.loads(dumps({"at": moment, "tags": {"a"}, 1: "int-key"}))
+        assert decoded == {"at": moment.isoformat(), "tags": ["a"], "1": "int-key"}
+
+    def test_dumps_encodes_bytes_as_base64(self):
+        assert json.loads(dumps({"data": b"\xff\x00"})) == {"data": "/wA="}
+
+    def test_dumps_rejects_unsupported_types(self):
+        with pytest.raises(TypeError):
+            dumps({"value": object()})
+
+
+class TestCompression:
+    """응답 압축 미들웨어 테스트"""
+
+    def test_select_encoding(self):
+        assert select_encoding("gzip, deflate") == "gzip"
+        assert select_encoding("gzip;q=0, identity") is None
+        assert select_encoding("") is None
+
+    def test_large_json_is_gzipped(self, client):
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"v1"'
+        assert response.json() == LARGE_PAYLOAD
+
+    def test_small_and_binary_responses_are_not_compressed(self, client):
+        small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        binary = client.get("/binary", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in small.headers
+        assert "content-encoding" not in binary.headers
+
+    def test_streaming_response_is_compressed_incrementally(self, client):
+        with client.stream(
+            "GET", "/stream", headers={"Accept-Encoding": "gzip"}
+        ) as response:
+            raw = b"".join(response.iter_raw())
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert gzip.decompress(raw).decode().splitlines() == [
+            '{"line":0}',
+            '{"line":1}',
+            '{"line":2}',
+        ]
+
+    def test_brotli_preferred_when_available(self, client, monkeypatch):
+        brotli = pytest.importorskip("brotli")
+        monkeypatch.setattr(compression, "brotli", brotli)
+        response = client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+        assert response.headers["content-encoding"] == "br"
+
+    def test_gzip_stream_is_valid_per_chunk(self):
+        compressor = compression._GzipCompressor(6)
+        first = compressor.compress(b"hello ")
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        # flush 된 청크는 이후 데이터 없이도 바로 복원 가능
+        assert decompressor.decompress(first) == b"hello "
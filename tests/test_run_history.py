@@ -0,0 +1,208 @@
+import asyncio
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlmodel import SQLModel
+
+from database.graph.edge import Edge
+from database.graph.graph import Graph
+from database.graph.vertex import Vertex
+from database.run.node_run import NodeRun
+from database.run.workflow_run import WorkflowRun
+from database.setup import create_engine_from_config
+from dto.workflow.workflow_dto import WorkflowExecutionResult
+from helpers.engine.run_context import RunContext
+from helpers.engine.workflow_engine import WorkflowEngine
+from services.workflow.run_history import PersistentRunStateStore, RunHistoryWriter
+from setting.config import Settings
+
+
+async def _session_factory():
+    # foreign_keys=ON 으로 외래 키 위반을 실제로 검사
+    engine = create_engine_from_config(Settings(DATABASE_URL="sqlite+aiosqlite://"))
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession)
+    async with session_factory() as session:
+        session.add(Graph(id=1, name="history", description=""))
+        await session.commit()
+    return engine, session_factory
+
+
+async def _count(session_factory, model) -> int:
+    async with session_factory() as session:
+        return (await session.execute(select(func.count()).select_from(model))).scalar()
+
+
+async def _run_workflow(store, fail: bool = False):
+    vertices = [
+        Vertex(id=1, type="TEXT_INPUT", properties={}),
+        Vertex(id=2, type="TEXT_OUTPUT", properties={}),
+    ]
+    edges = [Edge(source_id=1, target_id=2)]
+    if fail:
+        # SPLIT 노드는 data 입력이 없으므로 입력 검증에 실패
+        vertices.append(Vertex(id=3, type="SPLIT", properties={}))
+        edges.append(Edge(source_id=2, target_id=3))
+
+    engine = WorkflowEngine()
+    await engine.load(vertices, edges)
+    run_context = RunContext()
+    record = store.start_run(
+        1, run_context, {str(v.id): v.type for v in vertices}, {"text": "hi"}
+    )
+    result = await engine.start({"text": "hi"}, run_context)
+    store.finish_run(record.run_id, result)
+    return record
+
+
+class TestRunHistory:
+    """실행 이력 배치 기록 테스트"""
+
+    def test_runs_are_written_in_one_batch_and_loaded_back(self):
+        async def scenario():
+            engine, session_factory = await _session_factory()
+            writer = RunHistoryWriter(session_factory, flush_interval=60)
+            store = PersistentRunStateStore(writer, session_factory, max_runs=1)
+
+            first = await _run_workflow(store)
+            second = await _run_workflow(store, fail=True)
+
+            # 실행 중에는 버퍼에만 쌓이고 DB 에는 기록되지 않음
+            assert await _count(session_factory, WorkflowRun) == 0
+            # 종료 전 실행 row 를 직접 갱신하므로 update 는 따로 쌓이지 않음
+            assert writer.pending == 2 + 5
+
+            await writer.flush()
+            assert writer.stats()["written_runs"] == 2
+            assert writer.stats()["written_node_runs"] == 5
+            assert writer.flushes == 1
+
+            # max_runs=1 이므로 첫 실행은 메모리에서 제거되고 DB 에서 조회
+            loaded = await store.get_run(first.run_id)
+            assert loaded is not first
+            assert loaded.status == "completed"
+            assert loaded.inputs == {"text": "hi"}
+            assert loaded.node_states["2"].result == {"output": "hi"}
+            assert loaded.node_states["2"].timing.output_bytes == len(
+                b'{"output":"hi"}'
+            )
+            assert loaded.node_types == {"1": "TEXT_INPUT", "2": "TEXT_OUTPUT"}
+
+            latest = await store.get_latest_run(1)
+            assert latest is second
+            assert latest.status == "failed"
+
+            async with session_factory() as session:
+                node_runs = (
+                    await session.execute(
+                        select(NodeRun).where(NodeRun.run_id == second.run_id)
+                    )
+                ).scalars()
+                by_node = {node_run.node_id: node_run for node_run in node_runs}
+            assert by_node["3"].status == "failed"
+            assert by_node["1"].inputs == {"text": "hi"}
+            assert by_node["1"].duration >= 0
+            await engine.dispose()
+
+        asyncio.run(scenario())
+
+    def test_failed_run_does_not_drop_other_runs(self):
+        async def scenario():
+            engine, session_factory = await _session_factory()
+            writer = RunHistoryWriter(session_factory, flush_interval=60)
+            store = PersistentRunStateStore(writer, session_factory)
+
+            kept = await _run_workflow(store)
+            # 실행 후 flush 전에 그래프가 삭제된 경우 (graph_id 외래 키 위반)
+            orphan = store.start_run(2, RunContext(), {})
+            await writer.flush()
+
+            async with session_factory() as session:
+                assert await session.get(WorkflowRun, kept.run_id) is not None
+                assert await session.get(WorkflowRun, orphan.run_id) is None
+            assert await _count(session_factory, NodeRun) == 2
+            assert writer.stats()["written_runs"] == 1
+            assert writer.stats()["dropped"] == 1
+
+            # 기록되지 않은 실행의 나중 row 는 그 실행만 버림
+            store.finish_run(orphan.run_id, _result(success=True))
+            store.finish_run(kept.run_id, _result(success=False))
+            await writer.flush()
+            async with session_factory() as session:
+                assert (await session.get(WorkflowRun, kept.run_id)).status == "failed"
+            await engine.dispose()
+
+        asyncio.run(scenario())
+
+    def test_finish_after_flush_is_written_as_update(self):
+        async def scenario():
+            engine, session_factory = await _session_factory()
+            writer = RunHistoryWriter(session_factory, flush_interval=60)
+            store = PersistentRunStateStore(writer, session_factory)
+
+            record = store.start_run(1, RunContext(), {})
+            await writer.flush()
+            async with session_factory() as session:
+                assert (await session.get(WorkflowRun, record.run_id)).status == (
+                    "running"
+                )
+
+            store.finish_run(record.run_id, _result(success=True))
+            await writer.flush()
+            async with session_factory() as session:
+                run = await session.get(WorkflowRun, record.run_id)
+                assert run.status == "completed"
+                assert run.finished_at is not None
+            await engine.dispose()
+
+        asyncio.run(scenario())
+
+    def test_background_flush_on_batch_size(self):
+        async def scenario():
+            engine, session_factory = await _session_factory()
+            writer = RunHistoryWriter(session_factory, batch_size=3, flush_interval=60)
+            store = PersistentRunStateStore(writer, session_factory)
+            writer.start()
+
+            await _run_workflow(store)
+            for _ in range(20):
+                if writer.flushes:
+                    break
+                await asyncio.sleep(0.01)
+            assert writer.flushes == 1
+
+            await writer.stop()
+            assert writer.pending == 0
+            assert await _count(session_factory, NodeRun) == 2
+            await engine.dispose()
+
+        asyncio.run(scenario())
+
+    def test_overflow_and_failures_are_dropped(self):
+        async def scenario():
+            engine, session_factory = await _session_factory()
+            writer = RunHistoryWriter(session_factory, max_pending=1)
+            writer.add_run({"id": "a", "graph_id": 1, "status": "running"})
+            writer.add_run({"id": "b", "graph_id": 1, "status": "running"})
+            assert writer.pending == 1
+            assert writer.dropped == 1
+
+            await engine.dispose()
+            writer.session_factory = _broken_session
+            await writer.flush()
+            assert writer.pending == 0
+            assert writer.dropped == 2
+
+        asyncio.run(scenario())
+
+
+def _result(success: bool) -> WorkflowExecutionResult:
+    result = WorkflowExecutionResult()
+    result.success = success
+    result.execution_time = 0.0
+    return result
+
+
+def _broken_session():
+    raise RuntimeError("db down")
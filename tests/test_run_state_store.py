@@ -0,0 +1,120 @@
+import asyncio
+
+from dto.workflow.workflow_dto import WorkflowExecutionResult
+from helpers.engine.run_context import RunContext
+from helpers.engine.run_state_store import InMemoryRunStateStore
+
+
+class _Recorder:
+    def __init__(self):
+        self.changes = []
+
+    def node_changed(self, run_id, node_id, state):
+        self.changes.append((run_id, node_id, state.status))
+
+
+def _finished(success: bool = True) -> WorkflowExecutionResult:
+    result = WorkflowExecutionResult()
+    result.success = success
+    result.execution_time = 0.1
+    return result
+
+
+class TestRunStateStore:
+    """실행 상태 저장소 테스트"""
+
+    def test_run_context_notifies_listener(self):
+        run_context = RunContext()
+        recorder = _Recorder()
+        run_context.run_id = "run"
+        run_context.listener = recorder
+
+        run_context.set_status("1", "running")
+        run_context.set_result("1", {"output": "x"})
+        run_context.set_error("2", "boom")
+
+        assert recorder.changes == [
+            ("run", "1", "running"),
+            ("run", "1", "completed"),
+            ("run", "2", "failed"),
+        ]
+
+    def test_record_shares_node_states_with_run_context(self):
+        store = InMemoryRunStateStore()
+        run_context = RunContext()
+        record = store.start_run(1, run_context, {"1": "TEXT_INPUT", "2": "SPLIT"})
+
+        assert run_context.run_id == record.run_id
+        assert record.to_dict()["node_statuses"]["2"]["status"] == "pending"
+
+        # 실행 중 변경이 복사 없이 바로 조회됨
+        run_context.set_status("1", "running")
+        fetched = asyncio.run(store.get_run(record.run_id))
+        assert fetched.to_dict()["node_statuses"]["1"]["status"] == "running"
+        assert fetched.status == "running"
+
+        store.finish_run(record.run_id, _finished(success=False))
+        latest = asyncio.run(store.get_latest_run(1))
+        assert latest.status == "failed"
+
+    def test_evicts_oldest_finished_runs(self):
+        store = InMemoryRunStateStore(max_runs=2)
+        running = store.start_run(1, RunContext(), {})
+        finished = store.start_run(2, RunContext(), {})
+        store.finish_run(finished.run_id, _finished())
+        newest = store.start_run(3, RunContext(), {})
+
+        assert asyncio.run(store.get_run(finished.run_id)) is None
+        assert asyncio.run(store.get_latest_run(2)) is None
+        # 실행 중인 run 은 제거하지 않음
+        assert asyncio.run(store.get_run(running.run_id)) is running
+        assert asyncio.run(store.get_run(newest.run_id)) is newest
+
+    def test_status_endpoints(self, client):
+        created = client.post(
+            "/workflows/",
+            json={
+                "name": "runs",
+                "vertices": [
+                    {"id": "a", "type": "TEXT_INPUT", "properties": {}},
+                    {"id": "b", "type": "TEXT_OUTPUT", "properties": {}},
+                ],
+                "edges": [{"source_id": "a", "target_id": "b"}],
+            },
+        )
+        graph_id = created.json()["graph_id"]
+        assert client.get(f"/workflows/{graph_id}/status").status_code == 404
+
+        executed = client.post(
+            f"/workflows/{graph_id}/execute",
+            json={"initial_inputs": {"text": "hello"}},
+        ).json()
+        run_id = executed["run_id"]
+
+        run = client.get(f"/workflows/runs/{run_id}").json()
+        assert run["status"] == "completed"
+        assert run["total_nodes"] == 2
+        assert {state["status"] for state in run["node_statuses"].values()} == {
+            "completed"
+        }
+        assert "result" not in next(iter(run["node_statuses"].values()))
+
+        latest = client.get(
+            f"/workflows/{graph_id}/status", params={"include_results": True}
+        ).json()
+        assert latest["run_id"] == run_id
+        assert {"output": "hello"} in [
+            state["result"] for state in latest["node_statuses"].values()
+        ]
+
+        node_id = executed["execution_order"][-1]
+        node = client.get(f"/workflows/runs/{run_id}/nodes/{node_id}").json()
+        assert node["result"] == {"output": "hello"}
+        assert node["timing"]["executor"] == "inline"
+        assert set(executed["node_timings"]) == set(executed["execution_order"])
+        assert node["inputs"]
+
+        assert client.get("/workflows/runs/missing").status_code == 404
+        assert (
+            client.get(f"/workflows/{graph_id}/nodes/unknown/status").status_code == 404
+        )
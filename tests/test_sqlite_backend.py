@@ -0,0 +1,110 @@
+import argparse
+import asyncio
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from alembic import command
+from alembic.config import Config
+from database.setup import create_engine_from_config, get_async_db
+from main import app
+from setting.config import Settings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _alembic_config(url: str) -> Config:
+    config = Config(os.path.join(ROOT, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(ROOT, "alembic"))
+    config.cmd_opts = argparse.Namespace(x=[f"database_url={url}"])
+    return config
+
+
+@pytest.fixture
+def sqlite_url(tmp_path) -> str:
+    """마이그레이션을 적용한 SQLite 파일 DB"""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'workflow.db'}"
+    command.upgrade(_alembic_config(url), "head")
+    return url
+
+
+@pytest.fixture
+def sqlite_engine(sqlite_url):
+    engine = create_engine_from_config(Settings(DATABASE_URL=sqlite_url))
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+def _fetch(engine, sql: str):
+    async def run():
+        async with engine.connect() as conn:
+            return (await conn.execute(text(sql))).all()
+
+    return asyncio.run(run())
+
+
+class TestSqliteBackend:
+    """SQLite 임베디드 백엔드 테스트"""
+
+    def test_migrations_create_schema(self, sqlite_engine):
+        async def table_names():
+            async with sqlite_engine.connect() as conn:
+                return await conn.run_sync(
+                    lambda sync_conn: set(inspect(sync_conn).get_table_names())
+                )
+
+        tables = asyncio.run(table_names())
+        assert {"graphs", "vertices", "edges", "workflow_runs", "node_runs"} <= tables
+        foreign_keys = _fetch(sqlite_engine, "PRAGMA foreign_key_list(edges)")
+        # foreign_key_list 컬럼: id, seq, table, from, to, on_update, on_delete, match
+        assert {row[6] for row in foreign_keys} == {"CASCADE"}
+
+    def test_connection_pragmas(self, sqlite_engine):
+        assert _fetch(sqlite_engine, "PRAGMA journal_mode")[0][0] == "wal"
+        assert _fetch(sqlite_engine, "PRAGMA foreign_keys")[0][0] == 1
+        assert _fetch(sqlite_engine, "PRAGMA busy_timeout")[0][0] == 5000
+        # synchronous=NORMAL 은 1
+        assert _fetch(sqlite_engine, "PRAGMA synchronous")[0][0] == 1
+
+    def test_downgrade_and_upgrade_again(self, sqlite_url):
+        config = _alembic_config(sqlite_url)
+        command.downgrade(config, "base")
+        command.upgrade(config, "head")
+
+    def test_workflow_round_trip_cascades(self, sqlite_engine, cache, run_store):
+        async def get_test_db():
+            async with AsyncSession(sqlite_engine) as session:
+                yield session
+
+        app.dependency_overrides[get_async_db] = get_test_db
+        try:
+            client = TestClient(app)
+            created = client.post(
+                "/workflows/",
+                json={
+                    "name": "sqlite",
+                    "vertices": [
+                        {"id": "a", "type": "TEXT_INPUT", "properties": {}},
+                        {"id": "b", "type": "TEXT_OUTPUT", "properties": {}},
+                    ],
+                    "edges": [{"source_id": "a", "target_id": "b"}],
+                },
+            ).json()
+            graph_id = created["graph_id"]
+
+            executed = client.post(
+                f"/workflows/{graph_id}/execute",
+                json={"initial_inputs": {"text": "hello"}},
+            ).json()
+            assert executed["success"]
+
+            assert client.delete(f"/workflows/{graph_id}").status_code == 200
+        finally:
+            app.dependency_overrides.clear()
+
+        # foreign_keys=ON 이므로 정점/간선/실행 이력도 함께 삭제됨
+        for table in ("vertices", "edges", "workflow_runs"):
+            assert _fetch(sqlite_engine, f"SELECT COUNT(*) FROM {table}")[0][0] == 0
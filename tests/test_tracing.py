@@ -0,0 +1,153 @@
+import asyncio
+import json
+
+import pytest
+import requests
+
+from database.graph.edge import Edge
+from database.graph.vertex import Vertex
+from helpers.engine.workflow_engine import WorkflowEngine
+from helpers.node.node_templates.utility_nodes import WebhookNode
+from helpers.utils import tracing
+from helpers.utils.tracing import (
+    BatchSpanProcessor,
+    FileSpanExporter,
+    SimpleSpanProcessor,
+    SpanExporter,
+    Tracer,
+    parse_traceparent,
+    to_otlp_json,
+)
+
+
+class ListExporter(SpanExporter):
+    def __init__(self):
+        self.spans = []
+
+    def export(self, spans):
+        self.spans.extend(spans)
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    """끝난 span 을 리스트에 모으는 전역 tracer"""
+    exporter = ListExporter()
+    monkeypatch.setattr(tracing, "_tracer", Tracer(SimpleSpanProcessor(exporter)))
+    return exporter
+
+
+class TestTracing:
+    """실행 추적 테스트"""
+
+    def test_run_and_node_spans(self, exporter):
+        engine = WorkflowEngine()
+        asyncio.run(
+            engine.load(
+                [
+                    Vertex(id=1, type="TEXT_INPUT", properties={}),
+                    Vertex(id=2, type="TEXT_OUTPUT", properties={}),
+                ],
+                [Edge(source_id=1, target_id=2)],
+            )
+        )
+        assert asyncio.run(engine.start({"text": "hi"})).success
+
+        spans = {span.name: span for span in exporter.spans}
+        run = spans["workflow.run"]
+        assert run.parent_id is None
+        for name in ("node TEXT_INPUT", "node TEXT_OUTPUT"):
+            assert spans[name].parent_id == run.span_id
+            assert spans[name].trace_id == run.trace_id
+        assert spans["node TEXT_INPUT"].attributes["node.id"] == "1"
+        assert "timing.execution" in spans["node TEXT_OUTPUT"].attributes
+        assert tracing.current_span() is None
+
+    def test_traceparent_is_continued_and_injected(self, exporter):
+        tracer = tracing.get_tracer()
+        incoming = "00-" + "a" * 32 + "-" + "b" * 16 + "-01"
+        with tracer.start_span("parent", traceparent=incoming) as span:
+            headers = tracing.inject_traceparent({"x": "1"})
+        assert span.trace_id == "a" * 32
+        assert span.parent_id == "b" * 16
+        assert parse_traceparent(headers["traceparent"]) == ("a" * 32, span.span_id)
+        assert parse_traceparent("garbage") is None
+
+        with pytest.raises(RuntimeError):
+            with tracer.start_span("failing"):
+                raise RuntimeError("boom")
+        assert exporter.spans[-1].status == "error"
+        assert exporter.spans[-1].attributes["error.type"] == "RuntimeError"
+
+    def test_webhook_propagates_traceparent(self, exporter, monkeypatch):
+        sent = {}
+
+        class Response:
+            status_code = 200
+            text = "ok"
+
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return {"ok": True}
+
+        def fake_post(url, json=None, headers=None, timeout=None):
+            sent["headers"] = headers
+            return Response()
+
+        monkeypatch.setattr(requests, "post", fake_post)
+        headers = {"X-Key": "v"}
+        node = WebhookNode("hook", {})
+        with tracing.get_tracer().start_span("parent"):
+            node.execute({"url": "http://example.invalid", "headers": headers})
+
+        client_span = exporter.spans[0]
+        assert client_span.name == "HTTP POST"
+        assert client_span.attributes["http.status_code"] == 200
+        assert sent["headers"]["traceparent"] == client_span.traceparent
+        # 입력 헤더 dict 는 변경하지 않음
+        assert headers == {"X-Key": "v"}
+
+    def test_batch_file_exporter_and_otlp_shape(self, tmp_path):
+        path = tmp_path / "spans.jsonl"
+        processor = BatchSpanProcessor(FileSpanExporter(str(path)))
+        tracer = Tracer(processor)
+        with tracer.start_span("outer", {"count": 3}):
+            with tracer.start_span("inner"):
+                pass
+        assert processor.force_flush()
+        processor.shutdown()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["name"] for line in lines] == ["inner", "outer"]
+        assert lines[0]["parent_id"] == lines[1]["span_id"]
+
+        captured = ListExporter()
+        with Tracer(SimpleSpanProcessor(captured)).start_span("s", {"n": 1}):
+            pass
+        document = to_otlp_json(captured.spans, "svc")
+        otlp_span = document["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        assert otlp_span["name"] == "s"
+        assert otlp_span["attributes"] == [{"key": "n", "value": {"intValue": "1"}}]
+        assert otlp_span["status"] == {"code": 1}
+
+    def test_execute_response_has_trace_id(self, client, exporter):
+        created = client.post(
+            "/workflows/",
+            json={
+                "name": "traced",
+                "vertices": [{"id": "a", "type": "TEXT_INPUT", "properties": {}}],
+                "edges": [],
+            },
+        )
+        graph_id = created.json()["graph_id"]
+        trace_id = "c" * 32
+        response = client.post(
+            f"/workflows/{graph_id}/execute",
+            json={"initial_inputs": {"text": "x"}},
+            headers={"traceparent": f"00-{trace_id}-{'d' * 16}-01"},
+        )
+        assert response.json()["trace_id"] == trace_id
+
+        names = {span.name for span in exporter.spans if span.trace_id == trace_id}
+        assert {"workflow.execute", "workflow.run", "node TEXT_INPUT"} <= names
@@ -0,0 +1,101 @@
+from datetime import datetime, timezone
+
+from database.graph.graph import Graph
+from services.workflow.workflow_cache import (
+    WorkflowCache,
+    WorkflowSnapshot,
+    etag_matches,
+)
+
+
+def _snapshot(name: str = "graph") -> WorkflowSnapshot:
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    graph = Graph(
+        id=1, name=name, description="", created_at=created_at, updated_at=created_at
+    )
+    return WorkflowSnapshot(graph, [], [])
+
+
+class TestWorkflowCache:
+    """워크플로우 정의 캐시 테스트"""
+
+    def test_lru_eviction(self):
+        cache = WorkflowCache(max_size=2)
+        for graph_id in (1, 2):
+            cache.put(graph_id, cache.version(graph_id), _snapshot())
+        cache.get(1)
+        cache.put(3, cache.version(3), _snapshot())
+
+        assert cache.get(2) is None
+        assert cache.get(1) is not None
+        assert cache.get(3) is not None
+
+    def test_stale_load_is_not_cached(self):
+        cache = WorkflowCache()
+        version = cache.version(1)
+        # 로드 도중 수정되어 버전이 올라간 경우
+        cache.invalidate(1)
+
+        assert not cache.put(1, version, _snapshot())
+        assert cache.get(1) is None
+
+    def test_versions_are_bounded(self):
+        cache = WorkflowCache(max_size=2)
+        stale = cache.version(1)
+        cache.invalidate(1)
+        for graph_id in range(2, 100):
+            cache.invalidate(graph_id)
+
+        assert len(cache._versions) == 2
+        # 버전이 제거된 뒤에도 로드 도중 수정된 결과는 캐시하지 않음
+        assert not cache.put(1, stale, _snapshot())
+        assert cache.put(1, cache.version(1), _snapshot())
+
+        # LRU 에서 밀려난 그래프의 버전도 함께 제거
+        cache.invalidate(1)
+        assert cache.put(1, cache.version(1), _snapshot())
+        assert 1 in cache._versions
+        cache.put(2, cache.version(2), _snapshot())
+        cache.put(3, cache.version(3), _snapshot())
+        assert cache.get(1) is None
+        assert 1 not in cache._versions
+
+    def test_etag_follows_content(self):
+        assert _snapshot("a").etag == _snapshot("a").etag
+        assert _snapshot("a").etag != _snapshot("b").etag
+
+    def test_etag_matches(self):
+        etag = '"abc"'
+        assert etag_matches('"abc"', etag)
+        assert etag_matches('W/"abc", "def"', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"def"', etag)
+        assert not etag_matches(None, etag)
+
+    def test_get_workflow_etag_and_invalidation(self, client, cache):
+        created = client.post(
+            "/workflows/",
+            json={
+                "name": "cached",
+                "description": "",
+                "vertices": [{"id": "a", "type": "TEXT_INPUT", "properties": {}}],
+                "edges": [],
+            },
+        )
+        graph_id = created.json()["graph_id"]
+
+        first = client.get(f"/workflows/{graph_id}")
+        etag = first.headers["etag"]
+        assert first.status_code == 200
+        assert first.json()["graph"]["name"] == "cached"
+
+        not_modified = client.get(
+            f"/workflows/{graph_id}", headers={"If-None-Match": etag}
+        )
+        assert not_modified.status_code == 304
+        assert cache.hits == 1
+
+        assert client.delete(f"/workflows/{graph_id}").status_code == 200
+        assert client.get(f"/workflows/{graph_id}").status_code == 404
+        # 이미 삭제된 그래프는 성공으로 응답하지 않음
+        assert client.delete(f"/workflows/{graph_id}").status_code == 404
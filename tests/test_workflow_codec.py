@@ -0,0 +1,131 @@
+import pytest
+
+from database.graph.edge import Edge
+from database.graph.graph import Graph
+from database.graph.vertex import Vertex
+from helpers.utils import workflow_codec
+from helpers.utils.workflow_codec import (
+    MSGPACK_MEDIA_TYPE,
+    WorkflowCodecError,
+    decode_workflow,
+    encode_workflow,
+    prefers_msgpack,
+)
+from services.workflow import workflow_cache
+
+msgpack = pytest.importorskip("msgpack")
+
+
+def _workflow():
+    graph = Graph(id=1, name="binary", description="", properties={"k": 1})
+    vertices = [
+        Vertex(id=10, type="TEXT_INPUT", properties={}),
+        Vertex(id=11, type="TEXT_OUTPUT", properties={"x": [1, 2]}),
+        Vertex(id=12, type="TEXT_OUTPUT", properties={}),
+    ]
+    edges = [
+        Edge(source_id=10, target_id=11, type="default", properties={}),
+        Edge(source_id=10, target_id=12, type="default", properties={}),
+    ]
+    return graph, vertices, edges
+
+
+class TestWorkflowCodec:
+    """바이너리 워크플로우 포맷 테스트"""
+
+    def test_round_trip_interns_types_and_indexes_edges(self):
+        data = encode_workflow(*_workflow())
+        document = msgpack.unpackb(data)
+
+        assert document["types"] == ["TEXT_INPUT", "TEXT_OUTPUT", "default"]
+        assert document["edges"][0][:2] == [0, 1]
+
+        decoded = decode_workflow(data)
+        assert decoded["name"] == "binary"
+        assert decoded["properties"] == {"k": 1}
+        assert [v["id"] for v in decoded["vertices"]] == [10, 11, 12]
+        assert decoded["edges"][1]["source_id"] == 10
+        assert decoded["edges"][1]["target_id"] == 12
+
+    def test_invalid_documents(self):
+        with pytest.raises(WorkflowCodecError):
+            decode_workflow(b"\xc1")
+        bad_index = workflow_codec.packb(
+            {"v": 1, "types": ["T"], "vertices": [[1, 0, {}]], "edges": [[0, 5, 0, {}]]}
+        )
+        with pytest.raises(WorkflowCodecError):
+            decode_workflow(bad_index)
+
+    def test_prefers_msgpack(self):
+        assert prefers_msgpack("application/msgpack")
+        assert prefers_msgpack("application/json;q=0.5, application/x-msgpack")
+        assert not prefers_msgpack("application/json, application/msgpack;q=0.1")
+        assert not prefers_msgpack("*/*")
+        assert not prefers_msgpack(None)
+
+    def test_create_and_get_with_msgpack(self, client):
+        created = client.post(
+            "/workflows/",
+            content=encode_workflow(*_workflow()),
+            headers={
+                "Content-Type": MSGPACK_MEDIA_TYPE,
+                "Accept": MSGPACK_MEDIA_TYPE,
+            },
+        )
+        assert created.status_code == 200
+        assert created.headers["content-type"] == MSGPACK_MEDIA_TYPE
+        graph_id = msgpack.unpackb(created.content)["graph_id"]
+
+        response = client.get(
+            f"/workflows/{graph_id}", headers={"Accept": MSGPACK_MEDIA_TYPE}
+        )
+        assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+        decoded = decode_workflow(response.content)
+        assert [v["type"] for v in decoded["vertices"]] == [
+            "TEXT_INPUT",
+            "TEXT_OUTPUT",
+            "TEXT_OUTPUT",
+        ]
+        assert len(decoded["edges"]) == 2
+
+        # JSON 표현과 msgpack 표현의 ETag 는 서로 다름
+        json_response = client.get(f"/workflows/{graph_id}")
+        assert json_response.headers["etag"] != response.headers["etag"]
+        not_modified = client.get(
+            f"/workflows/{graph_id}",
+            headers={
+                "Accept": MSGPACK_MEDIA_TYPE,
+                "If-None-Match": response.headers["etag"],
+            },
+        )
+        assert not_modified.status_code == 304
+
+    def test_unencodable_workflow_returns_error(self, client, monkeypatch):
+        created = client.post(
+            "/workflows/",
+            json={
+                "name": "broken",
+                "vertices": [{"id": "a", "type": "TEXT_INPUT", "properties": {}}],
+                "edges": [],
+            },
+        )
+        graph_id = created.json()["graph_id"]
+
+        def encode(*args):
+            raise WorkflowCodecError("그래프에 없는 버텍스를 참조하는 엣지: 99")
+
+        monkeypatch.setattr(workflow_cache, "encode_workflow", encode)
+        response = client.get(
+            f"/workflows/{graph_id}", headers={"Accept": MSGPACK_MEDIA_TYPE}
+        )
+        assert response.status_code == 500
+        assert "그래프에 없는 버텍스" in response.json()["detail"]
+        assert client.get(f"/workflows/{graph_id}").status_code == 200
+
+    def test_invalid_msgpack_body(self, client):
+        response = client.post(
+            "/workflows/",
+            content=b"\xc1",
+            headers={"Content-Type": MSGPACK_MEDIA_TYPE},
+        )
+        assert response.status_code == 400
@@ -0,0 +1,97 @@
+import asyncio
+
+from database.graph.edge import Edge
+from database.graph.vertex import Vertex
+from helpers.engine.workflow_engine import WorkflowEngine
+from helpers.node.node_templates.function import FunctionNode
+from helpers.node.node_templates.text_input import TextInputNode
+
+
+def _load_engine(vertices, edges) -> WorkflowEngine:
+    engine = WorkflowEngine()
+    assert asyncio.run(engine.load(vertices, edges))
+    return engine
+
+
+class TestWorkflowEngine:
+    """워크플로우 엔진 테스트"""
+
+    def setup_method(self):
+        self.vertices = [
+            Vertex(id=1, type="TEXT_INPUT", properties={}),
+            Vertex(id=2, type="TEXT_OUTPUT", properties={}),
+            Vertex(id=3, type="SPLIT", properties={}),
+        ]
+        self.edges = [
+            Edge(source_id=1, target_id=2),
+            Edge(source_id=2, target_id=3),
+        ]
+
+    def test_node_schema_is_shared_per_class(self):
+        first = TextInputNode("1", {})
+        second = TextInputNode("2", {})
+        assert first.get_output_schema() is second.get_output_schema()
+        assert not hasattr(first, "__dict__")
+
+    def test_run_state_is_kept_in_run_context(self):
+        engine = _load_engine(self.vertices, self.edges)
+        assert engine.get_node_status("1")["status"] == "pending"
+
+        result = asyncio.run(engine.start({"text": "hello"}))
+
+        assert result.execution_order == ["1", "2", "3"]
+        assert engine.get_node_status("2")["status"] == "completed"
+        assert engine.get_node_status("2")["result"] == {"output": "hello"}
+
+        engine.reset_workflow()
+        assert engine.get_node_status("2")["status"] == "pending"
+
+    def test_failed_node_is_recorded(self):
+        # SPLIT 노드는 data 입력이 없으므로 입력 검증에 실패
+        engine = _load_engine(self.vertices, self.edges)
+        result = asyncio.run(engine.start({"text": "hello"}))
+
+        assert not result.success
+        assert engine.get_node_status("3")["status"] == "failed"
+        assert "입력 검증 실패" in engine.get_node_status("3")["error"]
+
+    def test_node_timings(self):
+        engine = _load_engine(self.vertices, self.edges)
+        result = asyncio.run(engine.start({"text": "hello"}))
+
+        assert set(result.node_timings) == {"1", "2", "3"}
+        completed = result.node_timings["2"]
+        phases = (
+            completed.input_collection
+            + completed.validation
+            + completed.execution
+            + completed.result_handling
+        )
+        assert min(phases, completed.queue_wait) >= 0
+        assert completed.total >= phases
+        assert completed.output_bytes == len(b'{"output":"hello"}')
+        # 입력 크기는 앞 노드 출력 크기에서 계산
+        assert completed.input_bytes == result.node_timings["1"].output_bytes
+        assert completed.executor == "inline"
+        assert result.execution_time >= sum(
+            timing.total for timing in result.node_timings.values()
+        )
+
+        # 실패한 노드도 실패 시점까지의 시간이 기록됨
+        failed = result.node_timings["3"]
+        assert failed.execution == 0.0
+        assert failed.output_bytes is None
+        assert engine.run_context.get_node_state("3").timing is failed
+
+    def test_payload_sizes_can_be_disabled(self):
+        engine = WorkflowEngine(record_payload_sizes=False)
+        asyncio.run(engine.load(self.vertices, self.edges))
+        result = asyncio.run(engine.start({"text": "hello"}))
+        timing = result.node_timings["2"]
+        assert timing.input_bytes is None and timing.output_bytes is None
+        assert timing.total > 0
+
+    def test_executor_type(self):
+        assert TextInputNode("1", {}).executor_type == "inline"
+        sandboxed = FunctionNode("2", {"execution_mode": "sandbox"})
+        assert sandboxed.executor_type == "process_pool"
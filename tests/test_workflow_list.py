@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from services.graph.graph_service import decode_cursor, encode_cursor
+
+
+def _create_workflows(client, names):
+    for name in names:
+        response = client.post(
+            "/workflows/",
+            json={"name": name, "description": "", "vertices": [], "edges": []},
+        )
+        assert response.status_code == 200
+
+
+class TestWorkflowList:
+    """워크플로우 목록 페이지네이션 테스트"""
+
+    def test_cursor_round_trip(self):
+        updated_at = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+        assert decode_cursor(encode_cursor(updated_at, 42)) == (updated_at, 42)
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+    def test_keyset_pages_cover_all_rows(self, client):
+        _create_workflows(client, [f"wf-{i}" for i in range(5)])
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get("/workflows/", params=params)
+            assert response.status_code == 200
+            seen += [graph["id"] for graph in response.json()]
+            cursor = response.headers.get("x-next-cursor")
+            if not cursor:
+                break
+
+        # 최근 수정 순, 중복/누락 없음
+        assert seen == sorted(seen, reverse=True)
+        assert len(seen) == 5
+
+    def test_fields_projection_and_name_filter(self, client):
+        _create_workflows(client, ["report_a", "report%b", "other"])
+
+        response = client.get(
+            "/workflows/", params={"fields": "name", "name": "report_"}
+        )
+        assert response.status_code == 200
+        graphs = response.json()
+        assert [graph["name"] for graph in graphs] == ["report_a"]
+        assert set(graphs[0]) == {"id", "name", "updated_at"}
+
+    def test_invalid_request(self, client):
+        assert client.get("/workflows/", params={"fields": "secret"}).status_code == 400
+        assert client.get("/workflows/", params={"cursor": "@@"}).status_code == 400
+        assert client.get("/workflows/", params={"limit": 5000}).status_code == 422
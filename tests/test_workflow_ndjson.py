@@ -0,0 +1,93 @@
+import asyncio
+import json
+
+import pytest
+
+from helpers.utils.ndjson import NDJSONError, iter_ndjson
+from services.workflow import workflow_persistence_service
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def _collect(chunks):
+    return [record async for record in iter_ndjson(chunks)]
+
+
+def _ndjson(records) -> bytes:
+    return "".join(json.dumps(record) + "\n" for record in records).encode()
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """청크 경계를 여러 번 넘도록 청크 크기를 줄임"""
+    monkeypatch.setattr(workflow_persistence_service, "EXPORT_CHUNK_SIZE", 2)
+    monkeypatch.setattr(workflow_persistence_service, "IMPORT_CHUNK_SIZE", 2)
+
+
+class TestNDJSON:
+    """NDJSON 스트리밍 내보내기/가져오기 테스트"""
+
+    def test_parses_lines_split_across_chunks(self):
+        records = asyncio.run(_collect(_chunks(b'{"a":', b"1}\n\n", b'{"b":2}')))
+        assert records == [{"a": 1}, {"b": 2}]
+
+    def test_invalid_line(self):
+        with pytest.raises(NDJSONError, match="2번째 줄"):
+            asyncio.run(_collect(_chunks(b'{"a":1}\n{oops\n')))
+
+    def test_import_export_round_trip(self, client, small_chunks):
+        records = [
+            {"kind": "graph", "name": "big", "description": "", "properties": {}},
+            *[
+                {
+                    "kind": "vertex",
+                    "id": f"v{i}",
+                    "type": "TEXT_INPUT",
+                    "properties": {},
+                }
+                for i in range(5)
+            ],
+            *[
+                {
+                    "kind": "edge",
+                    "source_id": f"v{i}",
+                    "target_id": f"v{i + 1}",
+                    "type": "default",
+                    "properties": {},
+                }
+                for i in range(4)
+            ],
+        ]
+        imported = client.post("/workflows/import", content=_ndjson(records))
+        assert imported.status_code == 200
+        graph_id = imported.json()["graph_id"]
+
+        exported = client.get(f"/workflows/{graph_id}/export")
+        assert exported.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in exported.text.splitlines()]
+
+        assert [line["kind"] for line in lines] == ["graph"] + ["vertex"] * 5 + [
+            "edge"
+        ] * 4
+        vertex_ids = [line["id"] for line in lines if line["kind"] == "vertex"]
+        edges = [line for line in lines if line["kind"] == "edge"]
+        assert [(edge["source_id"], edge["target_id"]) for edge in edges] == list(
+            zip(vertex_ids, vertex_ids[1:])
+        )
+
+    def test_import_rejects_unknown_vertex_and_rolls_back(self, client, small_chunks):
+        records = [
+            {"kind": "graph", "name": "broken"},
+            {"kind": "vertex", "id": "a", "type": "TEXT_INPUT"},
+            {"kind": "edge", "source_id": "a", "target_id": "missing"},
+        ]
+        response = client.post("/workflows/import", content=_ndjson(records))
+
+        assert response.status_code == 400
+        assert client.get("/workflows/").json() == []
+
+    def test_export_unknown_graph(self, client):
+        assert client.get("/workflows/999/export").status_code == 404